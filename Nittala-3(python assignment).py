@@ -15,28 +15,10 @@ can update the dictionaries easily in this method.
 you could store multiple datastructures in the same data dictionary unlike a list
 
 """
+import sys
 
-def stock_report(investor, stock_symbols, shares, purchase_price, current_price):
-    """Print stock report for all investors
-    """
-    print("Stock ownership for " + str(investor))
-    print("--------------------------------------------\n")
-    print("STOCK", "\t", "SHARE#", "\t", "EARNINGS/LOSS")
-    print("--------------------------------------------")
-    for i in range(0, len(stock_symbols)):
-            print(stock_symbols[i], "\t", shares[i], "\t\t", round((current_price[i]-purchase_price[i])*shares[i],2))
+from portfolio_book import PortfolioBook
 
-def validate_lists(stock_symbols, shares, purchase_price, current_price):
-    """ Validates that the lists have values and are all aligned.
-    """
-    if(len(stock_symbols) > 0 and
-       len(stock_symbols) == len(shares) and
-       len(stock_symbols) == len(purchase_price) and
-       len(stock_symbols) == len(current_price)):
-        return 1
-    else:
-        print("Please check lists for errors!!!")
-        return 0
 
 if __name__ == "__main__":
     #Lists of stock symbols, shares, purchase price, and current price
@@ -64,13 +46,6 @@ if __name__ == "__main__":
     stock_data_dict['dob'] = dob
     print(stock_data_dict)
 
-    
-    for investor, investor_attributes in stock_data_dict.items():    
-        if(validate_lists(stock_data_dict[investor]['stock_symbols'], stock_data_dict[investor]['shares'],
-                      stock_data_dict[investor]['purchase_price'], stock_data_dict[investor]['current_price'])):
-            stock_report(investor, stock_data_dict[investor]['stock_symbols'], stock_data_dict[investor]['shares'],
-                      stock_data_dict[investor]['purchase_price'], stock_data_dict[investor]['current_price'])
-    
-    
-
-    
+    # Pack every investor into one book so validation and earnings/loss run once, not once per investor
+    book = PortfolioBook.from_dict(stock_data_dict)
+    book.write_report(sys.stdout)
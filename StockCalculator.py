@@ -0,0 +1,181 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Columnar valuation engine for stocks and bonds.  #
+#             Prices, shares and purchase dates are kept in    #
+#             NumPy arrays so a whole book is valued in one    #
+#             batched pass instead of one object at a time.    #
+################################################################
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+
+import date_parser as dp
+from date_parser import DATE_FORMAT, EPOCH_ORDINAL
+
+
+def to_epoch_day(value, date_format=DATE_FORMAT):
+    """Convert a date, datetime, date string or epoch day into an epoch day integer
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    elif isinstance(value, str):
+        return dp.parse_epoch_day(value, date_format)
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+def to_date(value, date_format=DATE_FORMAT):
+    """Convert a date string, datetime or epoch day into a date
+    """
+    if isinstance(value, (int, np.integer)):
+        return dp.from_epoch_day(value)
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return dp.parse_date(value, date_format)
+    return value
+
+
+def to_epoch_days(values, date_format=DATE_FORMAT):
+    """Convert a column of dates into an int32 array of epoch days.
+    Each distinct value is converted only once.
+    :param values: Sequence of dates, date strings or epoch days
+    :param date_format: strptime format used for string values
+    :return: numpy array of epoch days
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return values.astype(np.int32, copy=False)
+    if values.size == 0:
+        return np.empty(0, dtype=np.int32)
+    if values.dtype.kind == "U":
+        return dp.parse_column(values, date_format)
+    uniques, inverse = np.unique(values.astype(object), return_inverse=True)
+    converted = np.fromiter((to_epoch_day(u, date_format) for u in uniques), dtype=np.int32, count=len(uniques))
+    return converted[inverse.reshape(-1)]
+
+
+def loss_gain(purchase_price, current_price, shares):
+    """Calculates the loss or gain for scalars or whole columns
+    """
+    purchase_price = np.asarray(purchase_price, dtype=np.float64)
+    current_price = np.asarray(current_price, dtype=np.float64)
+    return (current_price - purchase_price) * np.asarray(shares, dtype=np.float64)
+
+
+def annual_percent_yield_loss(purchase_price, current_price, current_day, purchase_day):
+    """Calculates the annual percent yield or loss for scalars or whole columns.
+    Days are epoch day integers; lots held for zero days give inf/nan.
+    """
+    purchase_price = np.asarray(purchase_price, dtype=np.float64)
+    current_price = np.asarray(current_price, dtype=np.float64)
+    days = np.asarray(current_day, dtype=np.float64) - np.asarray(purchase_day, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (((current_price - purchase_price) / purchase_price) / days) * 100 * 365
+
+
+def _rounded(values):
+    """Round results to cents, returning plain floats for scalar inputs"""
+    values = np.round(values, 2)
+    if values.ndim == 0:
+        return float(values)
+    return values
+
+
+def calculate_loss_gain(*args):
+    """Calculates the loss or gain.
+    :param args: Either (index, purchase_price, current_price, shares) with parallel lists,
+                 or (purchase_price, current_price, shares) as scalars or whole columns
+    :return: Rounded loss or gain
+    """
+    if len(args) == 4:
+        i, purchase_price, current_price, shares = args
+        args = (purchase_price[i], current_price[i], shares[i])
+    elif len(args) != 3:
+        raise TypeError("calculate_loss_gain expects 3 or 4 arguments, got {0}".format(len(args)))
+    return _rounded(loss_gain(*args))
+
+
+def calculate_percent_yield_loss(*args):
+    """Calculates the annual percent yield or loss.
+    :param args: Either (index, purchase_price, current_price, current_date, purchase_date) with parallel lists,
+                 or (purchase_price, current_price, current_date, purchase_date) as scalars or whole columns
+    :return: Rounded annual percent yield or loss
+    """
+    if len(args) == 5:
+        i, purchase_price, current_price, current_date, purchase_date = args
+        args = (purchase_price[i], current_price[i], current_date[i], purchase_date[i])
+    elif len(args) != 4:
+        raise TypeError("calculate_percent_yield_loss expects 4 or 5 arguments, got {0}".format(len(args)))
+    purchase_price, current_price, current_date, purchase_date = args
+    if np.ndim(current_date) == 0:
+        current_day = to_epoch_day(current_date)
+    else:
+        current_day = to_epoch_days(current_date)
+    if np.ndim(purchase_date) == 0:
+        purchase_day = to_epoch_day(purchase_date)
+    else:
+        purchase_day = to_epoch_days(purchase_date)
+    return _rounded(annual_percent_yield_loss(purchase_price, current_price, current_day, purchase_day))
+
+
+class Portfolio(object):
+    def __init__(self, symbols, shares, purchase_price, current_price, purchase_date):
+        """Build a columnar book of lots. All columns must have the same length.
+        :param symbols: Stock or bond symbols
+        :param shares: Number of shares per lot
+        :param purchase_price: Purchase price per share
+        :param current_price: Current price per share
+        :param purchase_date: Purchase dates as dates, '%m/%d/%Y' strings or epoch days
+        """
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.shares = np.asarray(shares, dtype=np.int64)
+        self.purchase_price = np.asarray(purchase_price, dtype=np.float64)
+        self.current_price = np.asarray(current_price, dtype=np.float64)
+        self.purchase_day = to_epoch_days(purchase_date)
+
+        size = len(self.symbols)
+        if not all(len(column) == size for column in
+                   (self.shares, self.purchase_price, self.current_price, self.purchase_day)):
+            raise ValueError("All portfolio columns must have the same length")
+
+    @classmethod
+    def from_lots(cls, lots):
+        """Build a portfolio from Stock or Bond objects
+        :param lots: Iterable of Stock/Bond objects
+        :return: Portfolio
+        """
+        lots = list(lots)
+        return cls([lot._stock_symbol for lot in lots],
+                   np.fromiter((lot._shares for lot in lots), dtype=np.int64, count=len(lots)),
+                   np.fromiter((lot._purchase_price for lot in lots), dtype=np.float64, count=len(lots)),
+                   np.fromiter((lot._current_price for lot in lots), dtype=np.float64, count=len(lots)),
+                   np.fromiter((lot._purchase_day for lot in lots), dtype=np.int32, count=len(lots)))
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def loss_gain(self):
+        """Loss or gain of every lot in the book"""
+        return loss_gain(self.purchase_price, self.current_price, self.shares)
+
+    def annual_percent_yield_loss(self, as_of=None):
+        """Annual percent yield or loss of every lot in the book
+        :param as_of: Valuation date, defaults to today
+        """
+        current_day = to_epoch_day(as_of if as_of is not None else date.today())
+        return annual_percent_yield_loss(self.purchase_price, self.current_price, current_day, self.purchase_day)
+
+    def held_days(self, as_of=None):
+        """Number of days each lot has been held"""
+        current_day = to_epoch_day(as_of if as_of is not None else date.today())
+        return current_day - self.purchase_day
+
+    def total_loss_gain(self):
+        """Loss or gain of the whole book"""
+        return float(self.loss_gain().sum())
@@ -0,0 +1,297 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Asyncio pipeline for the week 7 report. A parse  #
+#             thread feeds lots through a bounded queue; each  #
+#             investor whose rows are all read is rendered and #
+#             turned into table rows from the same lots; row   #
+#             batches go to a database writer thread and       #
+#             report chunks to a file writer thread through    #
+#             bounded queues, so parsing, SQLite inserts and   #
+#             report output overlap with rendering.            #
+################################################################"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+from itertools import chain
+import os
+import sqlite3
+import threading
+import time
+
+import holdings_loader as hl
+import investment_db as idb
+import metrics
+import report_renderer as rr
+
+# Rows per executemany call; smaller than a bulk insert batch so writes start while rendering continues
+PIPELINE_BATCH_SIZE = 5000
+# Batches or report chunks allowed in flight before the producer waits
+QUEUE_SIZE = 4
+REPORT_CHUNK_SIZE = 1 << 20
+# Lots per item handed from the parse thread to the renderer
+PARSE_BATCH_SIZE = 1000
+
+
+class PipelineStats(object):
+    def __init__(self):
+        """Busy time and row counts of each pipeline stage"""
+        self.seconds = {"parse": 0.0, "db_write": 0.0, "render": 0.0, "report_write": 0.0}
+        self.rows = {"parse": 0, "db_write": 0, "render": 0, "report_write": 0}
+        self.wall_seconds = 0.0
+
+    def __str__(self):
+        stages = ", ".join("{0} {1:.3f}s".format(stage, seconds) for stage, seconds in self.seconds.items())
+        return "Pipeline finished in {0:.3f}s ({1}; sum {2:.3f}s)".format(self.wall_seconds, stages,
+                                                                          sum(self.seconds.values()))
+
+
+def _source_rows(file_path, columns, kind, make_lot, grouped):
+    """Yield (investor_id, kind, make_lot, values) for every row of one holdings file.
+    Rows without an investor column get the key -1, so a merge reads them before any routed row.
+    :param grouped: Check that routed rows never go back to a lower INVESTOR_ID
+    """
+    last_id = None
+    for _, investor_id, values in hl.iter_rows(file_path, columns, kind):
+        if investor_id is None:
+            investor_id = -1
+        elif grouped:
+            if last_id is not None and investor_id < last_id:
+                raise ValueError("{0} rows for investor {1} follow investor {2}; grouped holdings must be sorted by "
+                                 "{3}".format(kind, investor_id, last_id, hl.INVESTOR_ID_COLUMN))
+            last_id = investor_id
+        yield investor_id, kind, make_lot, values
+
+
+def _parse(investors, sources, grouped, put, stop, stats):
+    """Runs on the parse thread: build the lot of every row and hand them to put() in (lots, finished) items.
+    lots are (investor, kind, lot) tuples routed like hl.route_rows; finished lists the investors whose rows
+    have all been read. With grouped, the files are merged by INVESTOR_ID so investors finish while parsing;
+    otherwise rows without an investor column go to every investor and everyone finishes at the end.
+    Returns early once stop is set.
+    """
+    busy = time.perf_counter()
+    everyone = list(investors.values())
+    unfinished = sorted(investors, reverse=True)
+    streams = [_source_rows(*source, grouped=grouped) for source in sources]
+    rows = heapq.merge(*streams, key=lambda row: row[0]) if grouped else chain(*streams)
+    lots = []
+    finished = []
+    for investor_id, kind, make_lot, values in rows:
+        if investor_id < 0:
+            lots.extend((investor_obj, kind, make_lot(values)) for investor_obj in everyone)
+        else:
+            while grouped and unfinished and unfinished[-1] < investor_id:
+                finished.append(investors[unfinished.pop()])
+            investor_obj = investors.get(investor_id)
+            if investor_obj is not None:
+                lots.append((investor_obj, kind, make_lot(values)))
+        if len(lots) >= PARSE_BATCH_SIZE:
+            stats.rows["parse"] += len(lots)
+            stats.seconds["parse"] += time.perf_counter() - busy
+            put((lots, finished))
+            if stop.is_set():
+                return
+            lots = []
+            finished = []
+            busy = time.perf_counter()
+    finished.extend(investors[investor_id] for investor_id in reversed(unfinished))
+    stats.rows["parse"] += len(lots)
+    stats.seconds["parse"] += time.perf_counter() - busy
+    put((lots, finished))
+
+
+async def _render(investors, parse_queue, stop, db_queue, report_queue, batch_size, chunk_size, stats):
+    """Consumer of the parse queue and producer for the writers: attach the parsed lots, then render every
+    finished investor in the order it finished and build its table rows from the same lots.
+    Rows are queued in batches for the database writer and blocks in large chunks for the report writer.
+    """
+    parsed = False
+    try:
+        ordered = sorted(investors.values(), key=lambda investor: investor._investor_id)
+        await db_queue.put((idb.INSERT_INVESTOR, [investor_obj.to_row() for investor_obj in ordered]))
+        batches = {idb.INSERT_STOCK: [], idb.INSERT_BOND: []}
+        chunk = []
+        buffered = 0
+        while True:
+            item = await parse_queue.get()
+            if item is None:
+                parsed = True
+                break
+            start = time.perf_counter()
+            lots, finished = item
+            for investor_obj, kind, lot in lots:
+                if kind == "Bond":
+                    investor_obj.add_bond(lot)
+                else:
+                    investor_obj.add_stock(lot)
+            for investor_obj in finished:
+                block = rr.render_investor_block(investor_obj)
+                chunk.append(block)
+                buffered += len(block)
+                stats.rows["render"] += 1
+                investor_id = investor_obj._investor_id
+                batches[idb.INSERT_STOCK].extend(stock.to_row(investor_id) for stock in investor_obj._list_of_stocks)
+                batches[idb.INSERT_BOND].extend(bond.to_row(investor_id) for bond in investor_obj._list_of_bonds)
+            stats.seconds["render"] += time.perf_counter() - start
+            for sql, batch in batches.items():
+                if len(batch) >= batch_size:
+                    await db_queue.put((sql, batch))
+                    batches[sql] = []
+            if buffered >= chunk_size:
+                await report_queue.put("".join(chunk))
+                chunk = []
+                buffered = 0
+        for sql, batch in batches.items():
+            if batch:
+                await db_queue.put((sql, batch))
+        if chunk:
+            await report_queue.put("".join(chunk))
+    finally:
+        if not parsed:
+            # Let the parse thread stop and run to its None item, so it never blocks on a full queue
+            stop.set()
+            while await parse_queue.get() is not None:
+                pass
+        await db_queue.put(None)
+        await report_queue.put(None)
+
+
+async def _consume(queue, executor, work, stage, stats):
+    """Consumer: run work(item) on the executor thread for every queued item until the None sentinel.
+    After a failure the queue is still drained so the producer never blocks; the error is raised at the end.
+    """
+    loop = asyncio.get_running_loop()
+    error = None
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+        if error is not None:
+            continue
+        start = time.perf_counter()
+        try:
+            stats.rows[stage] += await loop.run_in_executor(executor, work, item)
+        except Exception as e:
+            error = e
+        stats.seconds[stage] += time.perf_counter() - start
+    if error is not None:
+        raise error
+
+
+def _open_database(db_file):
+    """Runs on the database thread: connect, prepare the schema and start the one transaction that clears the
+    tables and inserts the new rows, so a failed run leaves the previous rows in place
+    """
+    conn = sqlite3.connect(db_file)
+    idb.configure_pragmas(conn)
+    idb.ensure_schema(conn)
+    conn.execute("BEGIN")
+    for table in ("investor", "stock", "bond"):
+        conn.execute("DELETE FROM {0}".format(table))
+    return conn
+
+
+def _finish_database(conn, commit):
+    try:
+        if commit:
+            conn.commit()
+        else:
+            conn.rollback()
+    finally:
+        conn.close()
+
+
+async def _run(investors, db_file, output_report_file, sources, grouped, batch_size, queue_size, stats):
+    loop = asyncio.get_running_loop()
+    parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline-parse")
+    db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline-db")
+    file_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline-report")
+    parse_queue = asyncio.Queue(maxsize=queue_size)
+    db_queue = asyncio.Queue(maxsize=queue_size)
+    report_queue = asyncio.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    # The report replaces the old one only once the database transaction has committed
+    temp_file = output_report_file + ".tmp"
+    conn = await loop.run_in_executor(db_executor, _open_database, db_file)
+    report = open(temp_file, "w")
+
+    def insert(item):
+        sql, rows = item
+        conn.executemany(sql, rows)
+        return len(rows)
+
+    def write(text):
+        report.write(text)
+        return 1
+
+    def put(item):
+        asyncio.run_coroutine_threadsafe(parse_queue.put(item), loop).result()
+
+    def parse():
+        # The None item ends the renderer's loop, also when parsing fails
+        try:
+            _parse(investors, sources, grouped, put, stop, stats)
+        finally:
+            put(None)
+
+    committed = False
+    parse_task = loop.run_in_executor(parse_executor, parse)
+    db_task = asyncio.ensure_future(_consume(db_queue, db_executor, insert, "db_write", stats))
+    report_task = asyncio.ensure_future(_consume(report_queue, file_executor, write, "report_write", stats))
+    try:
+        await _render(investors, parse_queue, stop, db_queue, report_queue, batch_size, REPORT_CHUNK_SIZE, stats)
+        await parse_task
+        await asyncio.gather(db_task, report_task)
+        committed = True
+    finally:
+        for task in (db_task, report_task):
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(parse_task, db_task, report_task, return_exceptions=True)
+        await loop.run_in_executor(file_executor, report.close)
+        try:
+            await loop.run_in_executor(db_executor, _finish_database, conn, committed)
+        except Exception:
+            committed = False
+            raise
+        finally:
+            parse_executor.shutdown()
+            db_executor.shutdown()
+            file_executor.shutdown()
+            if not committed:
+                os.remove(temp_file)
+    os.replace(temp_file, output_report_file)
+
+
+def run_pipeline(investors, db_file, output_report_file, make_stock, make_bond, stock_file=hl.STOCK_FILE,
+                 bond_file=hl.BOND_FILE, batch_size=PIPELINE_BATCH_SIZE, queue_size=QUEUE_SIZE, grouped=False):
+    """Load the holdings files, render the report and insert the same lots into the database with parsing,
+    inserts and report output overlapped. The database is not read back, and on failure neither the database
+    rows nor the report file change.
+    :param investors: Investor objects, without holdings
+    :param db_file: SQLite database file; its investor, stock and bond rows are replaced
+    :param output_report_file: Report file to write
+    :param make_stock: Callable building a Stock from the hl.STOCK_COLUMNS values of a row
+    :param make_bond: Callable building a Bond from the hl.BOND_COLUMNS values of a row
+    :param batch_size: Rows per executemany call
+    :param queue_size: Batches in flight between stages; bounds memory and applies backpressure
+    :param grouped: The files list routed rows in ascending INVESTOR_ID order, so each investor is rendered as
+                    soon as both files are past it; a row out of that order raises ValueError
+    :return: PipelineStats
+    """
+    stats = PipelineStats()
+    investors_by_id = dict((investor_obj._investor_id, investor_obj) for investor_obj in investors)
+    sources = [(stock_file, hl.STOCK_COLUMNS, "Stock", make_stock),
+               (bond_file, hl.BOND_COLUMNS, "Bond", make_bond)]
+    start = time.perf_counter()
+    asyncio.run(_run(investors_by_id, db_file, output_report_file, sources, grouped, batch_size, queue_size, stats))
+    stats.wall_seconds = time.perf_counter() - start
+    collector = metrics.active()
+    if collector is not None:
+        for stage, seconds in stats.seconds.items():
+            collector.record("pipeline_" + stage, seconds, stats.rows[stage])
+        collector.record("pipeline_wall", stats.wall_seconds)
+    return stats
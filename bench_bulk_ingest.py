@@ -0,0 +1,92 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Benchmark the bulk ingest path of the            #
+#             investments database against per-row inserts     #
+#             that commit after every row.                     #
+################################################################
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import investment_db as idb
+import week_7_nittala as w7
+
+SYMBOLS = ["GOOGL", "MSFT", "RDS-A", "AIG", "FB", "M", "F", "IBM"]
+
+
+def build_investors(number_of_investors, lots_per_investor, seed=7):
+    """Build synthetic investors with stock and bond lots"""
+    rnd = random.Random(seed)
+    investors = []
+    purchase_id = 0
+    for investor_id in range(1, number_of_investors + 1):
+        investor_obj = w7.Investor(investor_id, "Investor{0}".format(investor_id), "Address", "303-303-3033")
+        for _ in range(lots_per_investor):
+            purchase_id += 1
+            purchase_date = "{0}/{1}/{2}".format(rnd.randint(1, 12), rnd.randint(1, 28), rnd.randint(2010, 2017))
+            investor_obj.add_stock(w7.Stock(purchase_id, rnd.choice(SYMBOLS), round(rnd.uniform(10, 900), 2),
+                                            round(rnd.uniform(10, 900), 2), rnd.randint(1, 500), purchase_date))
+        purchase_id += 1
+        investor_obj.add_bond(w7.Bond(purchase_id, "GT2:GOV", 100.02, 100.05, 200, "8/1/2017", 1.38,
+                                      "{0:.2f}%".format(rnd.uniform(0.5, 5))))
+        investors.append(investor_obj)
+    return investors
+
+
+def insert_per_row(conn, investors):
+    """Insert every row with its own execute and commit"""
+    cur = conn.cursor()
+    for investor_obj in investors:
+        cur.execute(idb.INSERT_INVESTOR, investor_obj.to_row())
+        conn.commit()
+        for stock in investor_obj._list_of_stocks:
+            stock.insert_stock(cur, investor_obj._investor_id)
+            conn.commit()
+        for bond in investor_obj._list_of_bonds:
+            bond.insert_bond(cur, investor_obj._investor_id)
+            conn.commit()
+
+
+def time_load(db_file, investors, bulk, batch_size):
+    """Create a fresh database and time one full insert of all investors"""
+    conn = w7.create_connection(db_file)
+    if bulk:
+        idb.configure_pragmas(conn)
+    w7.create_tables(conn)
+    start = time.perf_counter()
+    if bulk:
+        idb.bulk_insert(conn, investors, batch_size, verbose=False)
+    else:
+        insert_per_row(conn, investors)
+    seconds = time.perf_counter() - start
+    conn.close()
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-row and bulk SQLite ingest")
+    # Every per-row commit syncs the journal, so the defaults stay small enough for that path to finish quickly
+    parser.add_argument("--investors", type=int, default=100)
+    parser.add_argument("--lots", type=int, default=100, help="stock lots per investor")
+    parser.add_argument("--batch-size", type=int, default=idb.DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    investors = build_investors(args.investors, args.lots)
+    rows = args.investors * (args.lots + 2)
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, bulk in (("per-row", False), ("bulk", True)):
+            seconds = time_load(os.path.join(workdir, name + ".db"), investors, bulk, args.batch_size)
+            results[name] = seconds
+            print("{0:<8} {1:>10} rows {2:>9.3f}s {3:>12,.0f} rows/sec".format(name, rows, seconds, rows / seconds))
+    print("speedup  {0:.1f}x".format(results["per-row"] / results["bulk"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Compare json.load with the streaming reader on a #
+#             synthetic AllStocks.json: peak RSS and records   #
+#             per second. Each reader runs in its own process  #
+#             so peak RSS is not shared between them.          #
+################################################################
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import json_stream as js
+import synthetic_data as sd
+
+READERS = ("json.load", "streaming")
+PRICE_FILE = "bench_AllStocks.json"
+
+
+def read_with_json_load(file_path, symbol):
+    with open(file_path) as f:
+        data = json.load(f)
+    return sum(1 for i in data if i["Symbol"] == symbol and i["Open"] != "-")
+
+
+def read_streaming(file_path, symbol):
+    return sum(1 for _ in js.iter_price_records(file_path, symbol))
+
+
+def run_reader(reader, file_path, symbol):
+    """Worker: read the file once and print kept records, seconds and peak RSS in KB as JSON"""
+    start = time.perf_counter()
+    kept = read_with_json_load(file_path, symbol) if reader == "json.load" else read_streaming(file_path, symbol)
+    seconds = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"kept": kept, "seconds": seconds, "peak_kb": peak_kb}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark json.load against the streaming JSON reader")
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--symbol", default="IBM")
+    parser.add_argument("--workdir", default=None, help="directory for the generated file, defaults to a temp dir")
+    parser.add_argument("--file", default=None, help="price history to read, defaults to " + PRICE_FILE +
+                        " in the workdir, generated when missing")
+    parser.add_argument("--reader", choices=READERS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.reader:
+        run_reader(args.reader, args.file, args.symbol)
+        return
+
+    file_path = args.file or os.path.join(args.workdir or tempfile.mkdtemp(prefix="bench_json_stream_"), PRICE_FILE)
+    if not os.path.exists(file_path):
+        sd.write_price_json(file_path, args.records)
+    size_mb = os.path.getsize(file_path) / float(1 << 20)
+    print("{0}: {1:.1f} MB".format(file_path, size_mb))
+    for reader in READERS:
+        output = subprocess.check_output([sys.executable, __file__, "--reader", reader, "--file", file_path,
+                                          "--symbol", args.symbol])
+        result = json.loads(output.decode())
+        print("{0:<10} kept {1:>9,}  peak RSS {2:>8.1f} MB  {3:>7.1f} MB/s  {4:>6.2f} s".format(
+            reader, result["kept"], result["peak_kb"] / 1024.0, size_mb / result["seconds"], result["seconds"]))
+
+
+if __name__ == "__main__":
+    main()
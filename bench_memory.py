@@ -0,0 +1,88 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Report bytes per lot for the original dict based #
+#             Stock layout, the slotted Stock objects and the  #
+#             array backed lot containers.                     #
+################################################################
+"""
+
+import argparse
+from datetime import datetime
+import gc
+import random
+import tracemalloc
+
+import week_7_nittala as w7
+
+SYMBOLS = ["GOOGL", "MSFT", "RDS-A", "AIG", "FB", "M", "F", "IBM"]
+
+
+class DictStock(object):
+    def __init__(self, purchase_id, stock_symbol, purchase_price, current_price, shares, purchase_date):
+        """Stock layout before slots: instance dict, own symbol copy, date object and string results"""
+        self._purchase_id = purchase_id
+        self._stock_symbol = "".join(stock_symbol)
+        self._purchase_price = float(purchase_price)
+        self._current_price = float(current_price)
+        self._shares = int(shares)
+        self._purchase_date = datetime.strptime(purchase_date, "%m/%d/%Y").date()
+        self._loss_gain = str(round((self._current_price - self._purchase_price) * self._shares, 2))
+        self._annual_percent_yield_loss = "0.0%"
+
+
+def lot_rows(count, seed=7):
+    """Synthetic lot rows as they come out of the CSV loader"""
+    rnd = random.Random(seed)
+    for purchase_id in range(1, count + 1):
+        yield (purchase_id, "".join(rnd.choice(SYMBOLS)), "{0:.2f}".format(rnd.uniform(10, 900)),
+               "{0:.2f}".format(rnd.uniform(10, 900)), str(rnd.randint(1, 500)),
+               "{0}/{1}/{2}".format(rnd.randint(1, 12), rnd.randint(1, 28), rnd.randint(2010, 2017)))
+
+
+def measure(build, count):
+    """Bytes per lot still allocated after build(rows) returns"""
+    rows = list(lot_rows(count))
+    gc.collect()
+    tracemalloc.start()
+    holder = build(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del holder
+    return current / float(count)
+
+
+def build_dict_lots(rows):
+    return [DictStock(*row) for row in rows]
+
+
+def build_slotted_lots(rows):
+    investor_obj = w7.Investor(1, "Bob", "Address", "303-303-3033")
+    for row in rows:
+        investor_obj.add_stock(w7.Stock(*row))
+    return investor_obj
+
+
+def build_compact_lots(rows):
+    investor_obj = w7.Investor(1, "Bob", "Address", "303-303-3033", compact=True)
+    for row in rows:
+        investor_obj.add_stock(w7.Stock(*row))
+    return investor_obj
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory per stock lot")
+    parser.add_argument("--lots", type=int, default=200000)
+    args = parser.parse_args()
+
+    results = [("dict objects (before)", measure(build_dict_lots, args.lots)),
+               ("slotted objects", measure(build_slotted_lots, args.lots)),
+               ("array backed", measure(build_compact_lots, args.lots))]
+    baseline = results[0][1]
+    for name, per_lot in results:
+        print("{0:<24}{1:>10.1f} bytes/lot {2:>8.1f}x".format(name, per_lot, baseline / per_lot))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: End to end benchmark of the major stages on      #
+#             synthetic inputs of several sizes: CSV load,     #
+#             Stock/Bond construction, SQLite insert and       #
+#             reload, report rendering, and the AllStocks.json #
+#             filter and chart. Results are written as JSON    #
+#             and can be compared with an earlier run.         #
+################################################################
+"""
+
+import argparse
+from datetime import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import chart_batch
+import csv_columns as cc
+import holdings_loader as hl
+import holdings_store as hs
+import investment_db as idb
+import json_stream as js
+import price_cache as pc
+import report_renderer as rr
+import synthetic_data as sd
+import week_7_nittala as w7
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+LOTS_PER_INVESTOR = 100
+AS_OF_DATE = "10/18/2026"
+CHART_SYMBOL = "IBM"
+RESULTS_FILE = "bench_results.json"
+
+
+class StageTimer(object):
+    def __init__(self, verbose=True):
+        """Collects one result per (size, stage)"""
+        self.results = []
+        self.verbose = verbose
+
+    def run(self, size, stage, rows, func, *args):
+        """Time func(*args) and record it.
+        :param rows: Rows processed by the stage, for the rows/sec figure
+        :return: Whatever func returns
+        """
+        gc.collect()
+        start = time.perf_counter()
+        value = func(*args)
+        seconds = time.perf_counter() - start
+        self.results.append({"size": size, "stage": stage, "rows": rows, "seconds": seconds,
+                             "rows_per_second": rows / seconds if seconds > 0 else None})
+        if self.verbose:
+            print("{0:>10,} {1:<18} {2:>12,} rows {3:>9.3f}s {4:>14,.0f} rows/sec".format(
+                size, stage, rows, seconds, rows / seconds if seconds > 0 else 0))
+        return value
+
+
+def _count_rows(stock_file, bond_file):
+    return (sum(1 for _ in hl.iter_rows(stock_file, hl.STOCK_COLUMNS, "Stock")) +
+            sum(1 for _ in hl.iter_rows(bond_file, hl.BOND_COLUMNS, "Bond")))
+
+
+def _parse_columns(stock_file, bond_file):
+    return len(cc.parse_file(stock_file)) + len(cc.parse_file(bond_file))
+
+
+def _convert_store(stock_file, bond_file):
+    return hs.convert(stock_file)["rows"] + hs.convert(bond_file)["rows"]
+
+
+def _load_store(stock_file, bond_file):
+    return len(hs.load(stock_file)) + len(hs.load(bond_file))
+
+
+def _construct(investors, stock_file, bond_file):
+    w7.load_stock_data(AS_OF_DATE, investors, stock_file, verbose=False)
+    w7.load_bond_data(AS_OF_DATE, investors, bond_file, verbose=False)
+
+
+def _insert(db_file, investors):
+    conn = w7.create_connection(db_file)
+    idb.configure_pragmas(conn)
+    w7.create_tables(conn)
+    idb.bulk_insert(conn, investors, verbose=False)
+    conn.close()
+
+
+def _reload(db_file):
+    conn = w7.create_connection(db_file)
+    try:
+        return list(w7.load_investors_from_db(conn))
+    finally:
+        conn.close()
+
+
+def _render(report_file, investors):
+    with open(report_file, "w") as report, rr.ReportRenderer(report) as renderer:
+        for investor_obj in investors:
+            renderer.render_investor(investor_obj)
+
+
+def _filter_json(price_file):
+    return sum(1 for _ in js.iter_price_records(price_file, CHART_SYMBOL))
+
+
+def bench_size(timer, size, workdir):
+    """Generate inputs of one size and time every stage on them"""
+    directory = os.path.join(workdir, str(size))
+    investors_count = max(1, size // LOTS_PER_INVESTOR)
+    paths = timer.run(size, "generate", size, sd.generate, directory, size, investors_count)
+    bond_rows = max(1, size // 10)
+    holdings_rows = size + bond_rows
+
+    timer.run(size, "csv_load", holdings_rows, _count_rows, paths["stock"], paths["bond"])
+    timer.run(size, "csv_columns", holdings_rows, _parse_columns, paths["stock"], paths["bond"])
+    timer.run(size, "store_convert", holdings_rows, _convert_store, paths["stock"], paths["bond"])
+    timer.run(size, "store_load", holdings_rows, _load_store, paths["stock"], paths["bond"])
+    w7.Stock.set_as_of_date(AS_OF_DATE)
+    investors = [w7.Investor(*row) for row in sd.investor_rows(investors_count)]
+    timer.run(size, "construct", holdings_rows, _construct, investors, paths["stock"], paths["bond"])
+
+    db_file = os.path.join(directory, "investments.db")
+    if os.path.exists(db_file):
+        os.remove(db_file)
+    timer.run(size, "db_insert", holdings_rows + investors_count, _insert, db_file, investors)
+    del investors
+    reloaded = timer.run(size, "db_reload", holdings_rows, _reload, db_file)
+    timer.run(size, "render", holdings_rows, _render, os.path.join(directory, "investor_report.txt"), reloaded)
+    del reloaded
+
+    timer.run(size, "json_filter", size, _filter_json, paths["price"])
+    cache_dir = pc.cache_dir_for(paths["price"])
+    timer.run(size, "price_cache_build", size, pc.build_cache, paths["price"], cache_dir)
+    prices = timer.run(size, "price_cache_load", 1, pc.load_symbol, paths["price"], CHART_SYMBOL, cache_dir)
+    timer.run(size, "plot", len(prices), chart_batch.render_chart, CHART_SYMBOL, prices,
+              os.path.join(directory, "chart.png"))
+
+
+def environment():
+    """Where the numbers came from"""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"timestamp": datetime.now().isoformat(timespec="seconds"), "commit": commit,
+            "python": sys.version.split()[0], "numpy": np.__version__, "platform": platform.platform(),
+            "cpu_count": os.cpu_count()}
+
+
+def compare(results, baseline_file):
+    """Print the time ratio of every (size, stage) against an earlier results file"""
+    with open(baseline_file) as f:
+        baseline = dict(((r["size"], r["stage"]), r["seconds"]) for r in json.load(f)["results"])
+    print("\n{0:>10} {1:<18} {2:>10} {3:>10} {4:>8}".format("size", "stage", "before", "after", "ratio"))
+    for result in results:
+        before = baseline.get((result["size"], result["stage"]))
+        if before:
+            print("{0:>10,} {1:<18} {2:>9.3f}s {3:>9.3f}s {4:>7.2f}x".format(
+                result["size"], result["stage"], before, result["seconds"], result["seconds"] / before))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the major stages on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="stock lots and price records per run, e.g. 1000 100000 10000000")
+    parser.add_argument("--workdir", default=None, help="directory for generated files, defaults to a temp dir")
+    parser.add_argument("--output", default=None, help="results file, defaults to bench_results.json in the workdir")
+    parser.add_argument("--compare", default=None, help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_suite_")
+    output = args.output or os.path.join(workdir, RESULTS_FILE)
+    timer = StageTimer()
+    for size in args.sizes:
+        bench_size(timer, size, workdir)
+    with open(output, "w") as f:
+        json.dump({"environment": environment(), "results": timer.results}, f, indent=1)
+    print("Results written to {0}".format(output))
+    if args.compare:
+        compare(timer.results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
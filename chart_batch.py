@@ -0,0 +1,150 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Batch rendering of open/close price charts for   #
+#             many symbols. Each chart is its own Agg Figure,  #
+#             rendering is spread over worker processes, and   #
+#             charts whose data hash is unchanged since the    #
+#             last run are skipped. The cache manifest is read #
+#             once; workers only map the files it lists.       #
+################################################################
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import downsample as ds
+import price_analytics as pa
+import price_cache as pc
+from worker_pool import default_workers, split_shards
+
+# Bump when the chart layout changes so every chart is rendered again
+CHART_VERSION = 2
+INDEX_FILE = "charts.json"
+CHUNKS_PER_WORKER = 4
+FIGURE_SIZE = (8, 6)
+DPI = 100
+
+
+def chart_file_name(symbol):
+    """PNG file name for a symbol, safe for any file system.
+    Symbols that had to be rewritten get a short hash of the symbol, so distinct symbols never share a file.
+    """
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", symbol)
+    if safe_name != symbol:
+        safe_name += "-" + hashlib.sha1(symbol.encode("utf-8")).hexdigest()[:8]
+    return safe_name + ".png"
+
+
+def chart_hash(prices, sma_windows=()):
+    """Hash of everything that is drawn on a symbol's chart"""
+    digest = hashlib.sha1(repr((CHART_VERSION, tuple(sma_windows))).encode("ascii"))
+    digest.update(np.ascontiguousarray(prices).tobytes())
+    return digest.hexdigest()
+
+
+def plotted_columns(prices):
+    """Dates, open and close prices of the rows with an Open price"""
+    prices = prices[~np.isnan(prices["open"])]
+    return prices["date"].astype("datetime64[D]"), prices["open"], prices["close"]
+
+
+def render_chart(symbol, prices, output_file, max_points=None, method=ds.MINMAX, sma_windows=()):
+    """Draw one symbol's open and close prices into a PNG without touching pyplot's global state.
+    :param symbol: Stock symbol, used in the title
+    :param prices: Structured price array as returned by price_cache.load_symbol
+    :param output_file: PNG file to write
+    :param max_points: Points kept per line after downsampling, defaults to a few per pixel of the figure
+    :param method: Downsampling method, ds.MINMAX or ds.LTTB
+    :param sma_windows: Moving average window lengths overlaid on the close price
+    """
+    figure = Figure(figsize=FIGURE_SIZE, dpi=DPI)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot(1, 1, 1)
+    max_points = max_points or ds.target_points(FIGURE_SIZE[0], DPI)
+    date_list, open_price, close_price = plotted_columns(prices)
+    axes.plot(*ds.downsample(date_list, open_price, max_points, method), linestyle='solid', marker='None',
+              label="Open Price")
+    axes.plot(*ds.downsample(date_list, close_price, max_points, method), linestyle='solid', marker='None',
+              label="Close Price")
+    for window, average in pa.moving_averages(close_price, sma_windows).items():
+        axes.plot(*ds.downsample(date_list, average, max_points, method), linestyle='dashed', marker='None',
+                  label="{0} day SMA".format(window))
+    axes.legend()
+    axes.set_title("{0} Stock Info of Open or Close price v/s Date".format(symbol))
+    axes.set_xlabel('Date')
+    axes.set_ylabel('Price')
+    figure.savefig(output_file)
+
+
+def _render_symbols(cache_dir, jobs, sma_windows=()):
+    """Worker: render a chunk of (symbol, manifest entry, output_file) charts from the memory mapped cache"""
+    for symbol, entry, output_file in jobs:
+        render_chart(symbol, pc.load_entry(cache_dir, entry), output_file, sma_windows=sma_windows)
+    return len(jobs)
+
+
+def _read_index(output_dir):
+    try:
+        with open(os.path.join(output_dir, INDEX_FILE)) as index:
+            return json.load(index)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def render_charts(source_file, symbols=None, output_dir="charts", workers=None, force=False, sma_windows=()):
+    """Render the charts of many symbols, skipping the ones that are already current.
+    :param source_file: Price history JSON file
+    :param symbols: Symbols to chart, None for every symbol in the file
+    :param output_dir: Directory of the PNG files
+    :param workers: Number of worker processes, defaults to the CPU count
+    :param force: Render every chart even when its hash is unchanged
+    :param sma_windows: Moving average window lengths overlaid on every chart
+    :return: (number of charts rendered, number skipped)
+    :raises ValueError: When a requested symbol has no price history in source_file
+    """
+    workers = workers or default_workers()
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    # Build or validate the cache once here; workers get the manifest entries and never open it themselves
+    cache_dir = pc.cache_dir_for(source_file)
+    known = pc.open_cache(source_file, cache_dir)["symbols"]
+    if symbols is None:
+        symbols = sorted(known)
+    else:
+        unknown = [symbol for symbol in symbols if symbol not in known]
+        if unknown:
+            raise ValueError("No price history for {0} in {1}".format(", ".join(unknown), source_file))
+
+    index = _read_index(output_dir)
+    hashes = {}
+    jobs = []
+    for symbol in symbols:
+        hashes[symbol] = chart_hash(pc.load_entry(cache_dir, known[symbol]), sma_windows)
+        output_file = os.path.join(output_dir, chart_file_name(symbol))
+        if force or index.get(symbol) != hashes[symbol] or not os.path.exists(output_file):
+            jobs.append((symbol, known[symbol], output_file))
+
+    if workers == 1 or len(jobs) <= 1:
+        _render_symbols(cache_dir, jobs, sma_windows)
+    else:
+        chunks = split_shards(jobs, workers * CHUNKS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(_render_symbols, [cache_dir] * len(chunks), chunks,
+                                  [sma_windows] * len(chunks)):
+                pass
+
+    index.update(hashes)
+    temp_file = os.path.join(output_dir, INDEX_FILE + ".tmp")
+    with open(temp_file, "w") as f:
+        json.dump(index, f)
+    os.replace(temp_file, os.path.join(output_dir, INDEX_FILE))
+    return len(jobs), len(symbols) - len(jobs)
@@ -0,0 +1,281 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Chunk parallel parser for large holdings CSVs.   #
+#             The file is memory mapped and split at newline   #
+#             boundaries; worker processes parse their chunks  #
+#             straight into NumPy column arrays, which are     #
+#             merged back in file order.                       #
+################################################################
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+import time
+
+import numpy as np
+
+import date_parser as dp
+from worker_pool import default_workers
+
+CHUNK_BYTES = 64 << 20
+# Chunks per worker when a pool parses the file, so files smaller than CHUNK_BYTES still reach every worker
+CHUNKS_PER_WORKER = 4
+# Columns parsed into numbers; date columns become epoch days, every other column is dictionary encoded text
+INTEGER_COLUMNS = ("NO_SHARES", "INVESTOR_ID")
+FLOAT_COLUMNS = ("PURCHASE_PRICE", "CURRENT_VALUE")
+DATE_COLUMNS = ("PURCHASE_DATE",)
+# Rows turned into Python values at a time, so iterating a memory mapped store never copies whole columns
+ROW_SLICE = 1 << 16
+INVESTOR_ID_COLUMN = "INVESTOR_ID"
+
+
+def _open_map(f):
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_header(file_path):
+    """Column names and the byte offset where the data rows start"""
+    with open(file_path, "rb") as f:
+        line = f.readline()
+    return [col.strip() for col in line.decode().rstrip("\r\n").split(",")], len(line)
+
+
+def chunk_ranges(file_path, chunk_bytes=CHUNK_BYTES, chunks=None):
+    """Split the data rows of a file into byte ranges that start and end on line boundaries.
+    :param chunk_bytes: Target size of each chunk
+    :param chunks: Split into at least this many chunks; chunk_bytes still caps their size
+    :return: List of (start, end) offsets in file order
+    """
+    size = os.path.getsize(file_path)
+    _, start = read_header(file_path)
+    if start >= size:
+        return []
+    if chunks:
+        chunk_bytes = min(chunk_bytes, max(1, -(-(size - start) // chunks)))
+    ranges = []
+    with open(file_path, "rb") as f, _open_map(f) as mm:
+        while start < size:
+            end = min(size, start + chunk_bytes)
+            if end < size:
+                newline = mm.find(b"\n", end - 1)
+                end = size if newline < 0 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _encode(values):
+    """Dictionary encode a text column: (list of distinct strings, int32 codes) in first seen order"""
+    ids = {}
+    codes = np.fromiter([ids.setdefault(value, len(ids)) for value in values], dtype=np.int32, count=len(values))
+    return [value.decode() for value in ids], codes
+
+
+def _split_fields(data, width, start, file_path):
+    """Split a chunk into one flat list of fields.
+    :return: (row count, fields), row r holding fields[r * width:(r + 1) * width]
+    """
+    text = data.replace(b"\r", b"").rstrip(b"\n")
+    if not text:
+        return 0, []
+    rows = text.count(b"\n") + 1
+    fields = text.replace(b"\n", b",").split(b",")
+    if len(fields) == rows * width:
+        return rows, fields
+    # Blank lines or a malformed row; drop the first and report the second
+    lines = [line for line in text.split(b"\n") if line.strip()]
+    for line in lines:
+        if line.count(b",") + 1 != width:
+            raise ValueError("Row at byte {0} of {1} has {2} columns, expected {3}".format(
+                start + data.find(line), file_path, line.count(b",") + 1, width))
+    return len(lines), b",".join(lines).split(b",") if lines else []
+
+
+def _parse_chunk(file_path, header, start, end, date_format=dp.DATE_FORMAT):
+    """Worker: parse the rows in [start, end) of file_path into column arrays.
+    :return: (row count, dictionary of column -> array or (distinct strings, codes))
+    """
+    with open(file_path, "rb") as f, _open_map(f) as mm:
+        data = mm[start:end]
+    width = len(header)
+    rows, fields = _split_fields(data, width, start, file_path)
+
+    columns = {}
+    for index, name in enumerate(header):
+        values = fields[index::width]
+        if name in INTEGER_COLUMNS:
+            columns[name] = np.fromiter(map(int, values), dtype=np.int64, count=rows)
+        elif name in FLOAT_COLUMNS:
+            columns[name] = np.fromiter(map(float, values), dtype=np.float64, count=rows)
+        elif name in DATE_COLUMNS:
+            texts, codes = _encode(values)
+            days = np.array([dp.parse_epoch_day(text.strip(), date_format) for text in texts], dtype=np.int32)
+            columns[name] = days[codes] if texts else np.empty(0, dtype=np.int32)
+        else:
+            columns[name] = _encode(values)
+    return rows, columns
+
+
+class HoldingsColumns(object):
+    def __init__(self, file_path, header, columns, rows):
+        """Parsed holdings file in column form.
+        :param columns: Dictionary of column -> array; text columns are (distinct strings, integer codes)
+        """
+        self.file_path = file_path
+        self.header = header
+        self.columns = columns
+        self.rows = rows
+        self._lookups = {}
+
+    def __len__(self):
+        return self.rows
+
+    def column(self, name):
+        """Numeric array for a numeric or date column, integer codes for a text column"""
+        column = self.columns[name]
+        return column[1] if isinstance(column, tuple) else column
+
+    def strings(self, name):
+        """Distinct strings of a text column, indexed by its codes"""
+        return self.columns[name][0]
+
+    def _lookup(self, name):
+        """Object array of a text column's distinct strings, indexed by its codes"""
+        lookup = self._lookups.get(name)
+        if lookup is None:
+            strings = self.columns[name][0]
+            lookup = self._lookups[name] = np.empty(len(strings), dtype=object)
+            lookup[:] = strings
+        return lookup
+
+    def decoded(self, name, start=0, end=None):
+        """Rows [start, end) of a text column as an object array of strings"""
+        return self._lookup(name)[self.columns[name][1][start:end]]
+
+    def take(self, name, rows):
+        """The given rows of a column: numbers as an array, text as an object array of strings
+        :param rows: Index array or slice
+        """
+        column = self.columns[name]
+        if isinstance(column, tuple):
+            return self._lookup(name)[column[1][rows]]
+        return column[rows]
+
+    def investor_rows(self, investor_ids, investor_column=INVESTOR_ID_COLUMN):
+        """Row indices of each investor, in file order.
+        Files without the investor column are shared, so every investor gets every row.
+        :param investor_ids: Investor ids to look up
+        :return: Dictionary of investor_id -> index array
+        """
+        if investor_column not in self.header:
+            everything = np.arange(self.rows)
+            return dict((investor_id, everything) for investor_id in investor_ids)
+        column = self.columns[investor_column]
+        # A stable sort keeps each investor's rows in file order
+        order = np.argsort(column, kind="stable")
+        owners = column[order]
+        return dict((investor_id, order[np.searchsorted(owners, investor_id, "left"):
+                                         np.searchsorted(owners, investor_id, "right")])
+                    for investor_id in investor_ids)
+
+    def _slices(self):
+        """(start, end) row ranges of at most ROW_SLICE rows"""
+        return [(start, min(start + ROW_SLICE, self.rows)) for start in range(0, self.rows, ROW_SLICE)]
+
+    def _python_values(self, names, start, end):
+        """Rows [start, end) of the given columns as lists of Python values"""
+        return [self.decoded(name, start, end).tolist() if isinstance(self.columns[name], tuple)
+                else self.columns[name][start:end].tolist() for name in names]
+
+    def values(self, names):
+        """Rows of the given columns as tuples of Python values, in file order, converted ROW_SLICE rows at a time"""
+        for start, end in self._slices():
+            for row in zip(*self._python_values(names, start, end)):
+                yield row
+
+    def iter_rows(self, columns, kind="Stock", investor_column=INVESTOR_ID_COLUMN):
+        """Rows in the form of holdings_loader.iter_rows: (row_number, investor_id or None, values tuple).
+        Numbers come back parsed, dates as epoch days; other columns keep their text.
+        """
+        if not all(col in self.header for col in columns):
+            raise ValueError("Incorrect Columns in {0} file".format(kind))
+        return self._iter_rows(columns, investor_column if investor_column in self.header else None)
+
+    def _iter_rows(self, columns, investor_column):
+        for start, end in self._slices():
+            if investor_column is None:
+                investor_ids = [None] * (end - start)
+            else:
+                investor_ids = self.columns[investor_column][start:end].tolist()
+            for row in zip(range(start + 1, end + 1), investor_ids, zip(*self._python_values(columns, start, end))):
+                yield row
+
+    def portfolio(self, rows=slice(None)):
+        """StockCalculator.Portfolio over the parsed lots
+        :param rows: Index array or slice of the lots to include, e.g. one investor's investor_rows()
+        """
+        import StockCalculator as sc
+
+        return sc.Portfolio(*[self.take(name, rows) for name in ("SYMBOL", "NO_SHARES", "PURCHASE_PRICE",
+                                                                 "CURRENT_VALUE", "PURCHASE_DATE")])
+
+
+def _merge(header, parts):
+    """Concatenate chunk results in order, remapping each chunk's text codes onto one shared table"""
+    columns = {}
+    for name in header:
+        pieces = [part[name] for _, part in parts]
+        if pieces and isinstance(pieces[0], tuple):
+            ids = {}
+            remapped = []
+            for chunk_strings, codes in pieces:
+                remap = np.array([ids.setdefault(text, len(ids)) for text in chunk_strings], dtype=np.int32)
+                remapped.append(remap[codes] if len(remap) else codes)
+            strings = [None] * len(ids)
+            for text, code in ids.items():
+                strings[code] = text
+            columns[name] = (strings, np.concatenate(remapped) if remapped else np.empty(0, dtype=np.int32))
+        else:
+            columns[name] = np.concatenate(pieces) if pieces else np.empty(0)
+    return columns
+
+
+def parse_file(file_path, workers=None, chunk_bytes=CHUNK_BYTES, date_format=dp.DATE_FORMAT):
+    """Parse a holdings CSV into column arrays with a pool of worker processes.
+    :param file_path: CSV file with a header row
+    :param workers: Worker processes, defaults to the CPU count; 1 parses in this process
+    :param chunk_bytes: Largest chunk; with several workers the file is split into CHUNKS_PER_WORKER chunks per
+                        worker even when that makes them smaller
+    :param date_format: strptime format of the date columns
+    :return: HoldingsColumns
+    """
+    workers = workers or default_workers()
+    header, _ = read_header(file_path)
+    ranges = chunk_ranges(file_path, chunk_bytes, workers * CHUNKS_PER_WORKER if workers > 1 else None)
+    args = [(file_path, header, start, end, date_format) for start, end in ranges]
+    if workers == 1 or len(args) <= 1:
+        parts = [_parse_chunk(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_parse_chunk, *zip(*args)))
+    if not parts:
+        parts = [_parse_chunk(file_path, header, 0, 0, date_format)]
+    return HoldingsColumns(file_path, header, _merge(header, parts), sum(rows for rows, _ in parts))
+
+
+def iter_rows(file_path, columns, kind="Stock", stats=None, workers=None, investor_column=INVESTOR_ID_COLUMN):
+    """Parallel counterpart of holdings_loader.iter_rows, yielding HoldingsColumns.iter_rows of the parsed file"""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            "{0} File not found!! Please make sure input file exists in same directory as the Python program.".format(
+                kind))
+    start = time.perf_counter()
+    parsed = parse_file(file_path, workers)
+    rows = parsed.iter_rows(columns, kind, investor_column)
+    if stats is not None:
+        stats.rows += len(parsed)
+        stats.seconds += time.perf_counter() - start
+    return rows
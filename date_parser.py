@@ -0,0 +1,74 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Shared date parsing for the loaders and          #
+#             validators. Parsed dates are memoized in a       #
+#             bounded cache since feeds repeat the same dates, #
+#             and whole columns convert to epoch day arrays.   #
+################################################################
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
+
+DATE_FORMAT = "%m/%d/%Y"
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_epoch_day(text, date_format):
+    return datetime.strptime(text, date_format).toordinal() - EPOCH_ORDINAL
+
+
+def parse_epoch_day(text, date_format=DATE_FORMAT):
+    """Parse a date string into an epoch day integer, using the memo cache
+    :param text: Date string
+    :param date_format: strptime format of the string
+    :return: Days since 1970-01-01
+    """
+    return _parse_epoch_day(text.strip(), date_format)
+
+
+def parse_date(text, date_format=DATE_FORMAT):
+    """Parse a date string into a date, using the memo cache"""
+    return date.fromordinal(EPOCH_ORDINAL + parse_epoch_day(text, date_format))
+
+
+def from_epoch_day(epoch_day):
+    """Date for an epoch day integer"""
+    return date.fromordinal(EPOCH_ORDINAL + int(epoch_day))
+
+
+def parse_column(values, date_format=DATE_FORMAT):
+    """Convert a whole column of date strings into an int32 array of epoch days.
+    Each distinct string is parsed at most once.
+    :param values: Sequence of date strings
+    :param date_format: strptime format of the strings
+    :return: numpy array of epoch days
+    """
+    values = np.asarray(values, dtype=str)
+    if values.size == 0:
+        return np.empty(0, dtype=np.int32)
+    uniques, inverse = np.unique(values, return_inverse=True)
+    days = np.fromiter((parse_epoch_day(text, date_format) for text in uniques), dtype=np.int32,
+                       count=len(uniques))
+    return days[inverse.reshape(-1)]
+
+
+def cache_stats():
+    """Memo cache counters
+    :return: Dictionary with hits, misses, size, maxsize and hit_rate
+    """
+    info = _parse_epoch_day.cache_info()
+    lookups = info.hits + info.misses
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize,
+            "hit_rate": info.hits / float(lookups) if lookups else 0.0}
+
+
+def clear_cache():
+    """Drop every memoized date and reset the counters"""
+    _parse_epoch_day.cache_clear()
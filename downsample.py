@@ -0,0 +1,108 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Reduce long price series to a few points per     #
+#             pixel before plotting. Min/max bucket decimation #
+#             keeps every peak and trough; LTTB keeps the      #
+#             visual shape with one point per bucket.          #
+################################################################
+"""
+
+import numpy as np
+
+MINMAX = "minmax"
+LTTB = "lttb"
+# Points kept per horizontal pixel of the plot
+POINTS_PER_PIXEL = 2
+
+
+def target_points(width_inches, dpi, points_per_pixel=POINTS_PER_PIXEL):
+    """Number of points worth plotting on a figure of the given width"""
+    return max(3, int(width_inches * dpi * points_per_pixel))
+
+
+def minmax_indices(y, max_points):
+    """Indices of the minimum and maximum of each bucket, plus the first and last point, in order.
+    NaN values never win a bucket unless the whole bucket is NaN.
+    :param y: Series values
+    With fewer than 4 points there is no room for a bucket, so only the first and last point and,
+    given 3 points, the extreme farthest from them are kept.
+    :param max_points: Upper bound on the number of indices returned, at least 2 for series longer than that
+    :return: Sorted numpy array of indices
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2 to keep the first and last point, got {0}".format(max_points))
+    if max_points < 4:
+        indices = [0, n - 1]
+        if max_points == 3 and not np.isnan(y[1:-1]).all():
+            middle = y[1:-1] - np.nanmean(y[[0, n - 1]])
+            indices.append(1 + int(np.nanargmax(np.abs(middle))))
+        return np.unique(indices)
+    buckets = (max_points - 2) // 2
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1) + offsets
+    highs = np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1) + offsets
+    indices = np.unique(np.concatenate(([0, n - 1], lows, highs)))
+    return indices[indices < n]
+
+
+def lttb_indices(x, y, max_points):
+    """Largest-Triangle-Three-Buckets selection: one point per bucket, keeping the visual shape.
+    Buckets are visited in order since each choice depends on the previous one, but each bucket
+    is scored in one vectorized step.
+    :param x: Series positions, numbers or datetime64
+    :param y: Series values
+    :param max_points: Number of indices returned
+    :return: Sorted numpy array of indices
+    """
+    x = np.asarray(x).astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        if next_end > end:
+            next_x, next_y = np.nanmean(x[end:next_end]), np.nanmean(y[end:next_end])
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs((x[previous] - next_x) * (y[start:end] - y[previous]) -
+                      (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        indices[bucket + 1] = previous
+    return indices
+
+
+def downsample(x, y, max_points, method=MINMAX):
+    """Reduce a series to at most about max_points points.
+    :param x: Series positions
+    :param y: Series values
+    :param max_points: Target number of points
+    :param method: MINMAX or LTTB
+    :return: (x, y) numpy arrays
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == MINMAX:
+        indices = minmax_indices(y, max_points)
+    elif method == LTTB:
+        indices = lttb_indices(x, y, max_points)
+    else:
+        raise ValueError("Unknown downsampling method {0!r}".format(method))
+    return x[indices], y[indices]
@@ -0,0 +1,156 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Single pass streaming loader for the stock and   #
+#             bond holdings files. Column positions are        #
+#             resolved once from the header and every row is   #
+#             routed to its investors in the same pass.        #
+################################################################
+"""
+
+from operator import itemgetter
+import os
+import time
+
+import csv_columns
+import holdings_store
+import metrics
+
+STOCK_FILE = "Lesson6_Data_Stocks.csv"
+BOND_FILE = "Lesson6_Data_Bonds.csv"
+STOCK_COLUMNS = ("SYMBOL", "NO_SHARES", "PURCHASE_PRICE", "CURRENT_VALUE", "PURCHASE_DATE")
+BOND_COLUMNS = STOCK_COLUMNS + ("Coupon", "Yield")
+INVESTOR_ID_COLUMN = "INVESTOR_ID"
+
+
+class LoadStats(object):
+    def __init__(self, file_path):
+        """Row counters and timing for a single file load"""
+        self.file_path = file_path
+        self.rows = 0
+        self.routed = 0
+        self.skipped = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+    def __str__(self):
+        return "Loaded {0} rows from {1} in {2:.3f}s ({3:,.0f} rows/sec)".format(self.rows, self.file_path,
+                                                                               self.seconds, self.rows_per_second)
+
+
+def iter_rows(file_path, columns, kind="Stock", stats=None):
+    """Stream the rows of a holdings file.
+    :param file_path: Path of the CSV file
+    :param columns: Required column names, in the order the values are yielded
+    :param kind: Used in error messages ("Stock" or "Bond")
+    :param stats: Optional LoadStats that is updated while streaming
+    :return: Generator of (row_number, investor_id or None, values tuple)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            "{0} File not found!! Please make sure input file exists in same directory as the Python program.".format(
+                kind))
+
+    start = time.perf_counter()
+    with open(file_path, "r") as holdings_file:
+        header = [col.strip() for col in holdings_file.readline().split(",")]
+        if not all(col in header for col in columns):
+            raise ValueError("Incorrect Columns in {0} file".format(kind))
+        get_values = itemgetter(*[header.index(col) for col in columns])
+        investor_index = header.index(INVESTOR_ID_COLUMN) if INVESTOR_ID_COLUMN in header else None
+
+        try:
+            for index, row in enumerate(holdings_file, 1):
+                attributes = row.rstrip("\r\n").split(",")
+                if len(attributes) < len(header):
+                    if not row.strip():
+                        continue
+                    raise ValueError("Row {0} of {1} has {2} columns, expected {3}".format(
+                        index, file_path, len(attributes), len(header)))
+                if stats is not None:
+                    stats.rows += 1
+                investor_id = int(attributes[investor_index]) if investor_index is not None else None
+                yield index, investor_id, get_values(attributes)
+        finally:
+            if stats is not None:
+                stats.seconds += time.perf_counter() - start
+
+
+def route_rows(file_path, columns, investors, add_lot, kind="Stock", verbose=True, workers=None, columnar=False):
+    """Parse a holdings file once and hand every row to the investors that own it.
+    Rows carrying an INVESTOR_ID column go to that investor only; files without the
+    column are shared by every investor.
+    :param file_path: Path of the CSV file
+    :param columns: Required column names
+    :param investors: Dictionary of investor_id -> Investor object
+    :param add_lot: Callable(investor, row_number, values) that builds and attaches the lot
+    :param kind: Used in error messages ("Stock" or "Bond")
+    :param verbose: Print the rows/sec summary when done
+    :param workers: Parse the file in this many worker processes with csv_columns; None reads it line by line
+    :param columnar: Read the memory mapped holdings_store copy of the file, converting it when stale
+    :return: LoadStats for the file
+    """
+    stats = LoadStats(file_path)
+    everyone = list(investors.values())
+    collector = metrics.active()
+    if collector is not None:
+        # Split the time spent building lots from the time spent parsing
+        construct_timer = metrics.CallTimer()
+        add_lot = construct_timer.wrap(add_lot)
+    streamed = not columnar and not workers
+    if columnar:
+        rows = holdings_store.iter_rows(file_path, columns, kind, stats, workers, INVESTOR_ID_COLUMN)
+    elif workers:
+        rows = csv_columns.iter_rows(file_path, columns, kind, stats, workers, INVESTOR_ID_COLUMN)
+    else:
+        rows = iter_rows(file_path, columns, kind, stats)
+    for index, investor_id, values in rows:
+        if investor_id is None:
+            for investor_obj in everyone:
+                add_lot(investor_obj, index, values)
+            stats.routed += len(everyone)
+        else:
+            investor_obj = investors.get(investor_id)
+            if investor_obj is None:
+                stats.skipped += 1
+                continue
+            add_lot(investor_obj, index, values)
+            stats.routed += 1
+    if collector is not None:
+        # Only the line reader parses while lots are built; the column readers finish parsing before the first row
+        parse_seconds = stats.seconds - construct_timer.seconds if streamed else stats.seconds
+        collector.record(kind.lower() + "_csv_parse", parse_seconds, stats.rows, os.path.getsize(file_path))
+        collector.record(kind.lower() + "_construct", construct_timer.seconds, construct_timer.calls)
+        collector.count(kind.lower() + "_rows_routed", stats.routed)
+        collector.count(kind.lower() + "_rows_skipped", stats.skipped)
+    if verbose:
+        print(stats)
+    return stats
+
+
+def load_columns(file_path, columns, kind="Stock", workers=None, columnar=False):
+    """Parse a holdings file into column arrays without building lots.
+    :param file_path: Path of the CSV file
+    :param columns: Required column names
+    :param kind: Used in error messages ("Stock" or "Bond")
+    :param workers: Worker processes parsing the file; None parses it in this process
+    :param columnar: Read the memory mapped holdings_store copy of the file, converting it when stale
+    :return: csv_columns.HoldingsColumns
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            "{0} File not found!! Please make sure input file exists in same directory as the Python program.".format(
+                kind))
+    with metrics.span(kind.lower() + "_column_parse", nbytes=os.path.getsize(file_path)) as stage:
+        if columnar:
+            holdings = holdings_store.load(file_path, workers=workers)
+        else:
+            holdings = csv_columns.parse_file(file_path, workers or 1)
+        stage.add(rows=len(holdings))
+    if not all(col in holdings.header for col in columns):
+        raise ValueError("Incorrect Columns in {0} file".format(kind))
+    return holdings
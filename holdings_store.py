@@ -0,0 +1,161 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Binary columnar store for the holdings CSVs.     #
+#             Each column is a fixed width .npy file, integers #
+#             narrowed to int32 when they fit; text            #
+#             columns such as SYMBOL are dictionary encoded    #
+#             with their strings kept in the manifest. Loads   #
+#             memory map the columns, and the store is rebuilt #
+#             when the source CSV's mtime and hash change.     #
+################################################################
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+import csv_columns as cc
+import date_parser as dp
+import price_cache as pc
+
+FORMAT_VERSION = 1
+
+
+def store_dir_for(source_file):
+    """Store directory kept next to the source CSV"""
+    return source_file + ".cols"
+
+
+def _code_dtype(distinct):
+    """Smallest unsigned integer type that holds codes for this many distinct strings"""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if distinct <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint64
+
+
+def _narrow(values):
+    """Store an int64 column as int32 when every value fits"""
+    if values.dtype == np.int64 and len(values):
+        limits = np.iinfo(np.int32)
+        if limits.min <= values.min() and values.max() <= limits.max:
+            return values.astype(np.int32)
+    return values
+
+
+def convert(source_file, store_dir=None, workers=None, date_format=dp.DATE_FORMAT):
+    """Convert a holdings CSV into the columnar store.
+    :param source_file: Holdings CSV with a header row
+    :param store_dir: Store directory, defaults to store_dir_for(source_file)
+    :param workers: Worker processes for csv_columns.parse_file
+    :param date_format: strptime format of the date columns
+    :return: The manifest dictionary
+    """
+    store_dir = store_dir or store_dir_for(source_file)
+    if not os.path.isdir(store_dir):
+        os.makedirs(store_dir)
+    old_manifest = pc.read_manifest(store_dir)
+    if old_manifest is not None:
+        os.remove(os.path.join(store_dir, pc.MANIFEST))
+
+    stat = os.stat(source_file)
+    parsed = cc.parse_file(source_file, workers, date_format=date_format)
+    columns = {}
+    for number, name in enumerate(parsed.header):
+        entry = {"file": "{0:03d}.npy".format(number)}
+        values = parsed.columns[name]
+        if isinstance(values, tuple):
+            strings, codes = values
+            entry["strings"] = strings
+            values = codes.astype(_code_dtype(len(strings)))
+        else:
+            values = _narrow(values)
+        np.save(os.path.join(store_dir, entry["file"]), values)
+        columns[name] = entry
+
+    if old_manifest is not None:
+        kept = set(entry["file"] for entry in columns.values())
+        for entry in old_manifest.get("columns", {}).values():
+            if entry["file"] not in kept and os.path.exists(os.path.join(store_dir, entry["file"])):
+                os.remove(os.path.join(store_dir, entry["file"]))
+
+    manifest = {"version": FORMAT_VERSION, "source": os.path.abspath(source_file), "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size, "sha1": pc.file_hash(source_file), "date_format": date_format,
+                "rows": len(parsed), "header": parsed.header, "columns": columns}
+    pc.write_manifest(store_dir, manifest)
+    return manifest
+
+
+def open_store(source_file, store_dir=None, workers=None, date_format=dp.DATE_FORMAT):
+    """Manifest of an up to date store, converting the CSV when needed.
+    A changed mtime alone only costs a hash of the source; the store is rebuilt when the contents changed.
+    :return: The manifest dictionary
+    """
+    store_dir = store_dir or store_dir_for(source_file)
+    manifest = pc.read_manifest(store_dir)
+    if manifest is None or manifest.get("version") != FORMAT_VERSION or manifest.get("date_format") != date_format:
+        return convert(source_file, store_dir, workers, date_format)
+    stat = os.stat(source_file)
+    if manifest["mtime_ns"] == stat.st_mtime_ns and manifest["size"] == stat.st_size:
+        return manifest
+    if manifest["size"] == stat.st_size and manifest["sha1"] == pc.file_hash(source_file):
+        manifest["mtime_ns"] = stat.st_mtime_ns
+        pc.write_manifest(store_dir, manifest)
+        return manifest
+    return convert(source_file, store_dir, workers, date_format)
+
+
+def load(source_file, store_dir=None, workers=None, date_format=dp.DATE_FORMAT):
+    """Memory map the columns of a holdings CSV, converting it first when the store is missing or stale.
+    :return: csv_columns.HoldingsColumns over read-only memory mapped arrays
+    """
+    store_dir = store_dir or store_dir_for(source_file)
+    manifest = open_store(source_file, store_dir, workers, date_format)
+    columns = {}
+    for name in manifest["header"]:
+        entry = manifest["columns"][name]
+        # mmap of a zero length file fails, so empty columns are read normally
+        values = np.load(os.path.join(store_dir, entry["file"]), mmap_mode="r" if manifest["rows"] else None)
+        columns[name] = (entry["strings"], values) if "strings" in entry else values
+    return cc.HoldingsColumns(source_file, manifest["header"], columns, manifest["rows"])
+
+
+def iter_rows(file_path, columns, kind="Stock", stats=None, workers=None, investor_column=cc.INVESTOR_ID_COLUMN):
+    """Counterpart of holdings_loader.iter_rows reading the columnar store of file_path.
+    The memory mapped columns are converted to Python values csv_columns.ROW_SLICE rows at a time.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            "{0} File not found!! Please make sure input file exists in same directory as the Python program.".format(
+                kind))
+    start = time.perf_counter()
+    holdings = load(file_path, workers=workers)
+    rows = holdings.iter_rows(columns, kind, investor_column)
+    if stats is not None:
+        stats.rows += len(holdings)
+        stats.seconds += time.perf_counter() - start
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert holdings CSVs into the binary columnar store")
+    parser.add_argument("files", nargs="+", help="holdings CSV files, e.g. Lesson6_Data_Stocks.csv")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes parsing each CSV")
+    parser.add_argument("--force", action="store_true", help="convert even when the store is up to date")
+    args = parser.parse_args()
+    for source_file in args.files:
+        start = time.perf_counter()
+        if args.force:
+            manifest = convert(source_file, workers=args.workers)
+        else:
+            manifest = open_store(source_file, workers=args.workers)
+        print("{0}: {1:,} rows in {2} ({3:.3f}s)".format(source_file, manifest["rows"], store_dir_for(source_file),
+                                                        time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Incremental investor report regeneration. Each   #
+#             investor's holdings and prices are fingerprinted #
+#             and only investors whose fingerprint changed are #
+#             re-rendered; every other block is copied from    #
+#             the previous report by its byte offsets.         #
+################################################################
+"""
+
+import hashlib
+import json
+import os
+
+ENCODING = "utf-8"
+
+
+def state_file_for(output_report_file):
+    """State file kept next to the report"""
+    return output_report_file + ".state.json"
+
+
+def investor_fingerprint(investor_obj, as_of_day):
+    """Hash of everything that shows up in an investor's report block.
+    Purchase ids are left out since they do not change the rendered block.
+    :param investor_obj: Investor with its stocks and bonds loaded
+    :param as_of_day: Valuation date as an epoch day
+    :return: Hex digest
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((as_of_day, investor_obj._first_name, investor_obj._address,
+                        investor_obj._phone_number)).encode(ENCODING))
+    for lots in (investor_obj._list_of_stocks, investor_obj._list_of_bonds):
+        digest.update(b"|")
+        for lot in lots:
+            digest.update(repr(tuple(getattr(lot, name) for name, _ in lot.compact_fields
+                                     if name != "_purchase_id")).encode(ENCODING))
+    return digest.hexdigest()
+
+
+class ReportState(object):
+    def __init__(self, blocks=None):
+        """Fingerprint and byte range of every investor block in the last report.
+        :param blocks: List of [investor_id, fingerprint, offset, length] in report order
+        """
+        self.blocks = blocks or []
+        self._by_id = dict((block[0], block) for block in self.blocks)
+
+    @classmethod
+    def load(cls, state_file, output_report_file):
+        """Read the saved state; an empty state is returned when it does not match the report on disk"""
+        if not (os.path.exists(state_file) and os.path.exists(output_report_file)):
+            return cls()
+        try:
+            with open(state_file, "r") as state:
+                blocks = json.load(state)["blocks"]
+        except (ValueError, KeyError) as e:
+            print("Ignoring unreadable report state: {0}".format(e))
+            return cls()
+        expected_size = blocks[-1][2] + blocks[-1][3] if blocks else 0
+        if os.path.getsize(output_report_file) != expected_size:
+            return cls()
+        return cls(blocks)
+
+    def save(self, state_file):
+        with open(state_file, "w") as state:
+            json.dump({"blocks": self.blocks}, state)
+
+    def fingerprint(self, investor_id):
+        block = self._by_id.get(investor_id)
+        return block[1] if block else None
+
+    def investor_ids(self):
+        return [block[0] for block in self.blocks]
+
+    def block_range(self, investor_id):
+        block = self._by_id[investor_id]
+        return block[2], block[3]
+
+
+def find_dirty(investors, state, as_of_day):
+    """Fingerprint every investor and compare with the previous run.
+    :return: (fingerprints by investor_id, list of changed investors, list of removed investor_ids)
+    """
+    fingerprints = {}
+    dirty = []
+    for investor_obj in investors:
+        investor_id = investor_obj._investor_id
+        fingerprints[investor_id] = investor_fingerprint(investor_obj, as_of_day)
+        if state.fingerprint(investor_id) != fingerprints[investor_id]:
+            dirty.append(investor_obj)
+    removed = [investor_id for investor_id in state.investor_ids() if investor_id not in fingerprints]
+    return fingerprints, dirty, removed
+
+
+def write_report(output_report_file, order, fingerprints, rendered, state):
+    """Write the report, taking changed blocks from rendered and every other block from the old report.
+    Blocks are patched in place when the layout is unchanged, otherwise the report is spliced into a new file.
+    :param output_report_file: Report file
+    :param order: investor_ids in report order
+    :param fingerprints: Fingerprint per investor_id
+    :param rendered: Newly rendered block text per changed investor_id
+    :param state: ReportState of the previous run
+    :return: ReportState of the new report
+    """
+    encoded = dict((investor_id, text.encode(ENCODING)) for investor_id, text in rendered.items())
+    same_layout = (state.blocks and order == state.investor_ids() and
+                   all(len(block) == state.block_range(investor_id)[1] for investor_id, block in encoded.items()))
+
+    blocks = []
+    if same_layout:
+        with open(output_report_file, "r+b") as report:
+            for investor_id, block in encoded.items():
+                report.seek(state.block_range(investor_id)[0])
+                report.write(block)
+        for investor_id in order:
+            offset, length = state.block_range(investor_id)
+            blocks.append([investor_id, fingerprints[investor_id], offset, length])
+        return ReportState(blocks)
+
+    temp_file = output_report_file + ".tmp"
+    old_report = open(output_report_file, "rb") if state.blocks else None
+    try:
+        with open(temp_file, "wb") as report:
+            offset = 0
+            for investor_id in order:
+                block = encoded.get(investor_id)
+                if block is None:
+                    old_offset, length = state.block_range(investor_id)
+                    old_report.seek(old_offset)
+                    block = old_report.read(length)
+                report.write(block)
+                blocks.append([investor_id, fingerprints[investor_id], offset, len(block)])
+                offset += len(block)
+    finally:
+        if old_report is not None:
+            old_report.close()
+    os.replace(temp_file, output_report_file)
+    return ReportState(blocks)
@@ -0,0 +1,313 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: SQLite helpers for the investments database:     #
+#             connection pragmas and a bulk ingest path that   #
+#             streams row batches through executemany inside   #
+#             a single transaction, and a set based reader     #
+#             that rebuilds investors without N+1 queries.     #
+#             Also owns the versioned, typed schema.           #
+################################################################
+"""
+
+from itertools import groupby, islice
+from operator import itemgetter
+import time
+
+import StockCalculator as sc
+
+DEFAULT_BATCH_SIZE = 50000
+
+INSERT_INVESTOR = """INSERT INTO investor(investor_id, first_name, address, phone_number) VALUES(?, ?, ?, ?);"""
+INSERT_STOCK = """INSERT INTO stock(purchase_id, investor_id, stock_symbol, purchase_price, current_price,
+number_of_shares, purchase_date) VALUES (?, ?, ?, ?, ?, ?, ?)"""
+INSERT_BOND = """INSERT INTO bond(purchase_id, investor_id, stock_symbol, purchase_price, current_price,
+number_of_shares, purchase_date, coupon, yld) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def configure_pragmas(conn, journal_mode="WAL", synchronous="NORMAL", cache_size_kb=None):
+    """Tune journal and sync behaviour of a connection for bulk loads.
+    :param conn: SQLite connection
+    :param journal_mode: Journal mode, e.g. WAL, DELETE or MEMORY
+    :param synchronous: Sync level, e.g. NORMAL, FULL or OFF
+    :param cache_size_kb: Optional page cache size in KiB
+    """
+    cur = conn.cursor()
+    if journal_mode:
+        cur.execute("PRAGMA journal_mode={0}".format(journal_mode))
+    if synchronous:
+        cur.execute("PRAGMA synchronous={0}".format(synchronous))
+    if cache_size_kb:
+        cur.execute("PRAGMA cache_size=-{0}".format(int(cache_size_kb)))
+
+
+def iter_batches(rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Split a row stream into lists of at most batch_size rows"""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_investor_rows(investors):
+    """Investor table rows for a list of Investor objects"""
+    for investor_obj in investors:
+        yield investor_obj.to_row()
+
+
+def iter_stock_rows(investors):
+    """Stock table rows for every stock of every investor"""
+    for investor_obj in investors:
+        investor_id = investor_obj._investor_id
+        for stock in investor_obj._list_of_stocks:
+            yield stock.to_row(investor_id)
+
+
+def iter_bond_rows(investors):
+    """Bond table rows for every bond of every investor"""
+    for investor_obj in investors:
+        investor_id = investor_obj._investor_id
+        for bond in investor_obj._list_of_bonds:
+            yield bond.to_row(investor_id)
+
+
+def executemany_batched(cur, sql, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Insert a row stream batch by batch and return the number of rows written"""
+    count = 0
+    for batch in iter_batches(rows, batch_size):
+        cur.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def bulk_insert(conn, investors, batch_size=DEFAULT_BATCH_SIZE, verbose=True):
+    """Insert investors with all their stocks and bonds in one transaction.
+    :param conn: SQLite connection
+    :param investors: List of Investor objects
+    :param batch_size: Number of rows per executemany call
+    :param verbose: Print row counts and throughput
+    :return: Dictionary of table name -> rows inserted
+    """
+    start = time.perf_counter()
+    cur = conn.cursor()
+    try:
+        counts = {"investor": executemany_batched(cur, INSERT_INVESTOR, iter_investor_rows(investors), batch_size),
+                  "stock": executemany_batched(cur, INSERT_STOCK, iter_stock_rows(investors), batch_size),
+                  "bond": executemany_batched(cur, INSERT_BOND, iter_bond_rows(investors), batch_size)}
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if verbose:
+        seconds = time.perf_counter() - start
+        total = sum(counts.values())
+        print("Bulk inserted {0} investors, {1} stocks and {2} bonds in {3:.3f}s ({4:,.0f} rows/sec)".format(
+            counts["investor"], counts["stock"], counts["bond"], seconds, total / seconds if seconds else total))
+    return counts
+
+
+def delete_investors(conn, investor_ids, batch_size=DEFAULT_BATCH_SIZE):
+    """Delete the given investors with all their stocks and bonds (caller commits)"""
+    cur = conn.cursor()
+    for table in ("stock", "bond", "investor"):
+        executemany_batched(cur, "DELETE FROM {0} WHERE investor_id = ?".format(table),
+                            ((investor_id,) for investor_id in investor_ids), batch_size)
+
+
+SELECT_INVESTORS = """SELECT investor_id, first_name, address, phone_number FROM investor
+WHERE investor_id BETWEEN ? AND ? ORDER BY investor_id"""
+SELECT_STOCKS = """SELECT purchase_id, investor_id, stock_symbol, purchase_price, current_price, number_of_shares,
+purchase_date FROM stock WHERE investor_id BETWEEN ? AND ? ORDER BY investor_id, purchase_id"""
+SELECT_BONDS = """SELECT purchase_id, investor_id, stock_symbol, purchase_price, current_price, number_of_shares,
+purchase_date, coupon, yld FROM bond WHERE investor_id BETWEEN ? AND ? ORDER BY investor_id, purchase_id"""
+MIN_ID = -2 ** 63
+MAX_ID = 2 ** 63 - 1
+
+def _grouped(rows):
+    """Group an investor ordered row stream into (investor_id, rows) pairs"""
+    for investor_id, group in groupby(rows, key=itemgetter(1)):
+        yield investor_id, list(group)
+
+
+def _take_group(groups, current, investor_id):
+    """Advance an ordered group stream to investor_id.
+    :return: (rows for investor_id, next pending group)
+    """
+    while current is not None and current[0] < investor_id:
+        current = next(groups, None)
+    if current is not None and current[0] == investor_id:
+        return current[1], next(groups, None)
+    return [], current
+
+
+def iter_investor_holdings(conn, first_id=MIN_ID, last_id=MAX_ID):
+    """Stream every investor with its stock and bond rows using one ordered query per table.
+    Holdings are grouped by investor_id in a single merge pass, so there is no query per investor.
+    :param conn: SQLite connection
+    :param first_id: Lowest investor_id to read
+    :param last_id: Highest investor_id to read
+    :return: Generator of (investor row, stock rows, bond rows)
+    """
+    id_range = (first_id, last_id)
+    stock_groups = _grouped(conn.execute(SELECT_STOCKS, id_range))
+    bond_groups = _grouped(conn.execute(SELECT_BONDS, id_range))
+    pending_stock = next(stock_groups, None)
+    pending_bond = next(bond_groups, None)
+    for investor_row in conn.execute(SELECT_INVESTORS, id_range):
+        investor_id = investor_row[0]
+        stock_rows, pending_stock = _take_group(stock_groups, pending_stock, investor_id)
+        bond_rows, pending_bond = _take_group(bond_groups, pending_bond, investor_id)
+        yield investor_row, stock_rows, bond_rows
+
+
+SCHEMA_VERSION = 3
+
+INVESTOR_TABLE = """CREATE TABLE IF NOT EXISTS investor(
+    investor_id INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    phone_number TEXT NOT NULL);"""
+
+STOCK_TABLE = """CREATE TABLE IF NOT EXISTS stock(
+    purchase_id INTEGER PRIMARY KEY,
+    investor_id INTEGER NOT NULL,
+    stock_symbol TEXT NOT NULL,
+    purchase_price REAL NOT NULL,
+    current_price REAL NOT NULL,
+    number_of_shares INTEGER NOT NULL,
+    purchase_date INTEGER NOT NULL);"""
+
+BOND_TABLE = """CREATE TABLE IF NOT EXISTS bond(
+    purchase_id INTEGER PRIMARY KEY,
+    investor_id INTEGER NOT NULL,
+    stock_symbol TEXT NOT NULL,
+    purchase_price REAL NOT NULL,
+    current_price REAL NOT NULL,
+    number_of_shares INTEGER NOT NULL,
+    purchase_date INTEGER NOT NULL,
+    coupon REAL NOT NULL,
+    yld TEXT NOT NULL);"""
+
+SCHEMA_INDEXES = ["CREATE INDEX IF NOT EXISTS idx_stock_investor_symbol ON stock(investor_id, stock_symbol)",
+                  "CREATE INDEX IF NOT EXISTS idx_stock_symbol_date ON stock(stock_symbol, purchase_date)",
+                  "CREATE INDEX IF NOT EXISTS idx_bond_investor_symbol ON bond(investor_id, stock_symbol)",
+                  "CREATE INDEX IF NOT EXISTS idx_bond_symbol_date ON bond(stock_symbol, purchase_date)"]
+# Single column investor_id indexes of earlier layouts; the (investor_id, stock_symbol) indexes cover those lookups
+LEGACY_INDEXES = ("idx_stock_investor", "idx_bond_investor")
+
+# Version 1 stored prices as integer columns and purchase dates as '%m/%d/%Y' text.
+MIGRATE_V1_TO_V2 = [
+    ("stock", STOCK_TABLE, """INSERT INTO stock SELECT purchase_id, investor_id, stock_symbol, CAST(purchase_price AS REAL),
+    CAST(current_price AS REAL), number_of_shares, epoch_day(purchase_date) FROM stock_v1"""),
+    ("bond", BOND_TABLE, """INSERT INTO bond SELECT purchase_id, investor_id, stock_symbol, CAST(purchase_price AS REAL),
+    CAST(current_price AS REAL), number_of_shares, epoch_day(purchase_date), coupon, CAST(yld AS TEXT)
+    FROM bond_v1"""),
+    ("investor", INVESTOR_TABLE, """INSERT INTO investor SELECT investor_id, first_name, address,
+    CAST(phone_number AS TEXT) FROM investor_v1"""),
+]
+
+# Version 2 declared yld REAL although it holds percentage text such as '3.88%'.
+MIGRATE_V2_TO_V3 = [
+    ("bond", BOND_TABLE, """INSERT INTO bond SELECT purchase_id, investor_id, stock_symbol, purchase_price,
+    current_price, number_of_shares, purchase_date, coupon, CAST(yld AS TEXT) FROM bond_v2"""),
+]
+
+
+def investor_ids(conn):
+    """Every investor_id in ascending order"""
+    return [row[0] for row in conn.execute("SELECT investor_id FROM investor ORDER BY investor_id")]
+
+
+def schema_version(conn):
+    """Current schema version recorded in the database"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _table_exists(conn, table):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+
+def _create_schema(cur):
+    cur.execute(INVESTOR_TABLE)
+    cur.execute(STOCK_TABLE)
+    cur.execute(BOND_TABLE)
+    for index_name in LEGACY_INDEXES:
+        cur.execute("DROP INDEX IF EXISTS {0}".format(index_name))
+    for statement in SCHEMA_INDEXES:
+        cur.execute(statement)
+
+
+def _rebuild_tables(conn, cur, steps, old_version):
+    """Rewrite tables in place by copying them into a freshly created layout"""
+    for table, create_table, copy_rows in steps:
+        if not _table_exists(conn, table):
+            continue
+        for index_name, in cur.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+                                       "AND sql IS NOT NULL", (table,)).fetchall():
+            cur.execute("DROP INDEX {0}".format(index_name))
+        cur.execute("ALTER TABLE {0} RENAME TO {0}_v{1}".format(table, old_version))
+        cur.execute(create_table)
+        cur.execute(copy_rows)
+        cur.execute("DROP TABLE {0}_v{1}".format(table, old_version))
+
+
+def _migrate_v1(conn, cur):
+    """Rewrite the version 1 tables in place into the typed layout"""
+    conn.create_function("epoch_day", 1, lambda value: sc.to_epoch_day(value) if isinstance(value, str) else value)
+    _rebuild_tables(conn, cur, MIGRATE_V1_TO_V2, 1)
+
+
+def _migrate_v2(conn, cur):
+    """Rewrite the version 2 bond table with a TEXT yld column"""
+    _rebuild_tables(conn, cur, MIGRATE_V2_TO_V3, 2)
+
+
+def ensure_schema(conn):
+    """Create the investments schema, migrating an older layout in place when needed.
+    Existing data is kept; the schema version is stored in PRAGMA user_version.
+    :param conn: SQLite connection
+    :return: Schema version after the call
+    """
+    version = schema_version(conn)
+    if version == SCHEMA_VERSION:
+        return version
+    if version > SCHEMA_VERSION:
+        raise ValueError("Database schema version {0} is newer than supported version {1}".format(
+            version, SCHEMA_VERSION))
+
+    cur = conn.cursor()
+    if conn.in_transaction:
+        conn.commit()
+    cur.execute("BEGIN")
+    try:
+        if version < 2 and _table_exists(conn, "stock"):
+            _migrate_v1(conn, cur)
+        elif version == 2:
+            _migrate_v2(conn, cur)
+        _create_schema(cur)
+        cur.execute("PRAGMA user_version = {0}".format(SCHEMA_VERSION))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return SCHEMA_VERSION
+
+
+def select_lots(conn, symbol, start_date=None, end_date=None, table="stock"):
+    """Lots of one symbol, optionally limited to a purchase date range, via the (symbol, purchase_date) index.
+    :param conn: SQLite connection
+    :param symbol: Stock or bond symbol
+    :param start_date: First purchase date included (date, '%m/%d/%Y' string or epoch day)
+    :param end_date: Last purchase date included
+    :param table: "stock" or "bond"
+    :return: List of rows
+    """
+    if table not in ("stock", "bond"):
+        raise ValueError("Unknown holdings table {0}".format(table))
+    first = sc.to_epoch_day(start_date) if start_date is not None else -2 ** 31
+    last = sc.to_epoch_day(end_date) if end_date is not None else 2 ** 31
+    return conn.execute("SELECT * FROM {0} WHERE stock_symbol = ? AND purchase_date BETWEEN ? AND ? "
+                        "ORDER BY purchase_date".format(table), (symbol, first, last)).fetchall()
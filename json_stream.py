@@ -0,0 +1,91 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Incremental reader for a top level JSON array    #
+#             such as AllStocks.json. Records are decoded one  #
+#             at a time from a fixed size buffer, so memory    #
+#             stays bounded by the largest record instead of   #
+#             the size of the file.                            #
+################################################################
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+MISSING = "-"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# The ',' or ']' following an array element, with the whitespace around it
+_DELIMITER = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+
+def _skip_whitespace(f, text, pos, chunk_size):
+    """Move pos past whitespace, reading more chunks as needed.
+    :return: (text, pos) with pos on the next token, or at the end of text when the file is exhausted
+    """
+    pos = _WHITESPACE.match(text, pos).end()
+    while pos == len(text):
+        text = f.read(chunk_size)
+        if not text:
+            break
+        pos = _WHITESPACE.match(text).end()
+    return text, pos
+
+
+def iter_json_array(file_path, chunk_size=CHUNK_SIZE):
+    """Yield the elements of the top level JSON array in file_path one at a time.
+    Only the current chunk and the element being decoded are held in memory.
+    :param file_path: JSON file holding one array
+    :param chunk_size: Characters read per chunk
+    :return: Generator of decoded elements
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    with open(file_path) as f:
+        text, pos = _skip_whitespace(f, f.read(chunk_size), 0, chunk_size)
+        if text[pos:pos + 1] != "[":
+            raise ValueError("{0} does not hold a JSON array".format(file_path))
+        text, pos = _skip_whitespace(f, text, pos + 1, chunk_size)
+        if text[pos:pos + 1] == "]":
+            return
+        eof = False
+        while True:
+            # An element is only taken once the delimiter after it is in the buffer, so a value cut
+            # short at the end of a chunk (e.g. a number) is decoded again once more text is read
+            delimiter = None
+            pos = _WHITESPACE.match(text, pos).end()
+            try:
+                value, end = raw_decode(text, pos)
+                delimiter = _DELIMITER.match(text, end)
+            except ValueError:
+                if eof:
+                    raise
+            if delimiter is None:
+                if eof:
+                    raise ValueError("Expected ',' or ']' after element in {0}".format(file_path))
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                text = text[pos:] + chunk
+                pos = 0
+                continue
+            pos = delimiter.end()
+            yield value
+            if delimiter.group(1) == "]":
+                return
+
+
+def iter_price_records(file_path, symbol=None, skip_missing=True, chunk_size=CHUNK_SIZE):
+    """Yield the price records of one symbol from a stock history file such as AllStocks.json.
+    :param file_path: JSON file holding an array of price records
+    :param symbol: Only keep records of this symbol; None keeps every symbol
+    :param skip_missing: Drop records whose Open price is '-'
+    :param chunk_size: Characters read per chunk
+    :return: Generator of record dictionaries
+    """
+    for record in iter_json_array(file_path, chunk_size):
+        if symbol is not None and record.get("Symbol") != symbol:
+            continue
+        if skip_missing and record.get("Open") == MISSING:
+            continue
+        yield record
@@ -0,0 +1,108 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Array backed container for an investor's stock  #
+#             and bond lots. Each attribute is kept in a typed #
+#             array and symbols are dictionary encoded, so a   #
+#             lot costs a few dozen bytes instead of an object.#
+################################################################
+"""
+
+from array import array
+import sys
+
+# Pseudo type code for dictionary encoded string columns
+SYMBOL = "sym"
+
+
+def _all_slots(lot_class):
+    """Every slot name declared on a class and its parents"""
+    names = []
+    for klass in reversed(lot_class.__mro__):
+        names.extend(getattr(klass, "__slots__", ()))
+    return names
+
+
+class LotArray(object):
+    def __init__(self, lot_class):
+        """Create an empty container for lots of lot_class.
+        :param lot_class: Stock or Bond class; its compact_fields lists (attribute, type code) pairs
+        """
+        self._lot_class = lot_class
+        self._fields = lot_class.compact_fields
+        self._field_index = dict((name, i) for i, (name, _) in enumerate(self._fields))
+        self._columns = [array("I" if typecode == SYMBOL else typecode) for _, typecode in self._fields]
+        self._encoded = [typecode == SYMBOL for _, typecode in self._fields]
+        self._cleared = [name for name in _all_slots(lot_class) if name not in self._field_index]
+        self._symbols = []
+        self._symbol_ids = {}
+
+    def _encode(self, value):
+        symbol_id = self._symbol_ids.get(value)
+        if symbol_id is None:
+            symbol_id = len(self._symbols)
+            value = sys.intern(value) if isinstance(value, str) else value
+            self._symbols.append(value)
+            self._symbol_ids[value] = symbol_id
+        return symbol_id
+
+    def append(self, lot):
+        """Store the lot's attributes in the columns"""
+        for (name, _), column, encoded in zip(self._fields, self._columns, self._encoded):
+            value = getattr(lot, name)
+            column.append(self._encode(value) if encoded else value)
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        """Rebuild the lot at index as a read-only snapshot"""
+        lot = self._lot_class.__new__(self._lot_class)
+        for name in self._cleared:
+            setattr(lot, name, None)
+        symbols = self._symbols
+        for (name, _), column, encoded in zip(self._fields, self._columns, self._encoded):
+            value = column[index]
+            setattr(lot, name, symbols[value] if encoded else value)
+        return lot
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def value(self, index, name):
+        """One attribute of the lot at index, read without building a snapshot"""
+        field = self._field_index[name]
+        value = self._columns[field][index]
+        return self._symbols[value] if self._encoded[field] else value
+
+    def column(self, name):
+        """Raw array for one attribute; symbol columns are returned decoded as a list"""
+        column = self._columns[self._field_index[name]]
+        if self._encoded[self._field_index[name]]:
+            return [self._symbols[value] for value in column]
+        return column
+
+    def set_prices(self, prices):
+        """Update the current price of every lot whose symbol is in prices"""
+        symbol_column = self._columns[self._field_index["_stock_symbol"]]
+        price_column = self._columns[self._field_index["_current_price"]]
+        new_prices = dict((self._symbol_ids[symbol], float(price)) for symbol, price in prices.items()
+                          if symbol in self._symbol_ids)
+        if not new_prices:
+            return
+        for index, symbol_id in enumerate(symbol_column):
+            if symbol_id in new_prices:
+                price_column[index] = new_prices[symbol_id]
+
+    def total_loss_gain(self):
+        """Loss or gain over all lots computed straight from the columns"""
+        return sum((current - purchase) * shares for current, purchase, shares in
+                   zip(self._columns[self._field_index["_current_price"]],
+                       self._columns[self._field_index["_purchase_price"]],
+                       self._columns[self._field_index["_shares"]]))
+
+    def nbytes(self):
+        """Bytes used by the column buffers"""
+        return sum(column.itemsize * len(column) for column in self._columns)
@@ -0,0 +1,225 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Stage level instrumentation for the report       #
+#             pipeline: timing spans, row and byte counters,   #
+#             and opt-in tracemalloc peak memory and cProfile  #
+#             dumps per stage. Disabled unless turned on by a  #
+#             flag or environment variable; when off, a span   #
+#             is a shared no-op object.                        #
+################################################################
+"""
+
+import cProfile
+import json
+import os
+import re
+import time
+import tracemalloc
+
+METRICS_ENV = "NITTALA_METRICS"
+PROFILE_ENV = "NITTALA_PROFILE_DIR"
+TRACE_MEMORY_ENV = "NITTALA_TRACE_MEMORY"
+
+_collector = None
+
+
+class _NullSpan(object):
+    """Stand-in used while metrics are off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add(self, rows=0, nbytes=0):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span(object):
+    __slots__ = ("collector", "name", "parent", "rows", "bytes", "seconds", "peak_bytes", "_start", "_profile")
+
+    def __init__(self, collector, name, rows=0, nbytes=0):
+        self.collector = collector
+        self.name = name
+        self.parent = None
+        self.rows = rows
+        self.bytes = nbytes
+        self.seconds = 0.0
+        self.peak_bytes = 0
+        self._start = None
+        self._profile = None
+
+    def add(self, rows=0, nbytes=0):
+        """Count rows and bytes handled by the stage"""
+        self.rows += rows
+        self.bytes += nbytes
+
+    def __enter__(self):
+        self.collector._push(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds = time.perf_counter() - self._start
+        self.collector._pop(self)
+        return False
+
+
+class CallTimer(object):
+    def __init__(self):
+        """Accumulates the time spent in a wrapped function, to split a stage from its callbacks"""
+        self.seconds = 0.0
+        self.calls = 0
+
+    def wrap(self, func):
+        perf_counter = time.perf_counter
+
+        def timed(*args):
+            start = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.seconds += perf_counter() - start
+                self.calls += 1
+        return timed
+
+
+class Collector(object):
+    def __init__(self, output_file=None, profile_dir=None, trace_memory=False):
+        """Metrics of one run.
+        :param output_file: JSON summary written by write_summary
+        :param profile_dir: Directory for one cProfile dump per top level stage, or None
+        :param trace_memory: Record tracemalloc peaks per stage; tracing slows allocation heavy stages down
+        """
+        self.output_file = output_file
+        self.profile_dir = profile_dir
+        self.trace_memory = trace_memory
+        self.spans = []
+        self.counters = {}
+        self._stack = []
+        self._started = time.perf_counter()
+        # Only stop tracing on disable() when this collector started it
+        self.started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+        if profile_dir and not os.path.isdir(profile_dir):
+            os.makedirs(profile_dir)
+
+    def _push(self, span):
+        if self.trace_memory:
+            # The enclosing stage keeps the peak reached so far; the new stage starts from the current usage
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak_bytes = max(parent.peak_bytes, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if self.profile_dir and not self._stack:
+            span._profile = cProfile.Profile()
+            span._profile.enable()
+        span.parent = self._stack[-1].name if self._stack else None
+        self._stack.append(span)
+
+    def _pop(self, span):
+        self._stack.pop()
+        if span._profile is not None:
+            span._profile.disable()
+            file_name = re.sub(r"[^A-Za-z0-9._-]", "_", span.name) + ".prof"
+            span._profile.dump_stats(os.path.join(self.profile_dir, file_name))
+            span._profile = None
+        if self.trace_memory:
+            span.peak_bytes = max(span.peak_bytes, tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1].peak_bytes = max(self._stack[-1].peak_bytes, span.peak_bytes)
+        self.spans.append(span)
+
+    def record(self, name, seconds, rows=0, nbytes=0):
+        """Add a stage measured elsewhere, e.g. time split out with a CallTimer"""
+        span = Span(self, name, rows, nbytes)
+        span.parent = self._stack[-1].name if self._stack else None
+        span.seconds = seconds
+        self.spans.append(span)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        """Machine readable summary of the run"""
+        stages = []
+        for span in self.spans:
+            stage = {"stage": span.name, "parent": span.parent, "seconds": span.seconds, "rows": span.rows,
+                     "bytes": span.bytes, "rows_per_second": span.rows / span.seconds if span.seconds > 0 else None}
+            if self.trace_memory and span._start is not None:
+                stage["peak_bytes"] = span.peak_bytes
+            stages.append(stage)
+        return {"total_seconds": time.perf_counter() - self._started, "stages": stages, "counters": self.counters,
+                "peak_bytes": tracemalloc.get_traced_memory()[1] if self.trace_memory else None}
+
+
+def enable(output_file=None, profile_dir=None, trace_memory=False):
+    """Turn metrics on for this process
+    :return: The Collector
+    """
+    global _collector
+    _collector = Collector(output_file, profile_dir, trace_memory)
+    return _collector
+
+
+def configure(output_file=None, profile_dir=None, trace_memory=False):
+    """Enable metrics when a flag value is given or NITTALA_METRICS / NITTALA_PROFILE_DIR /
+    NITTALA_TRACE_MEMORY are set. NITTALA_METRICS holds the JSON summary path ("1" prints the summary instead).
+    Memory tracing is off unless trace_memory or NITTALA_TRACE_MEMORY=1 asks for it.
+    :return: The Collector, or None when metrics stay off
+    """
+    output_file = output_file or os.environ.get(METRICS_ENV)
+    profile_dir = profile_dir or os.environ.get(PROFILE_ENV)
+    trace_memory = trace_memory or os.environ.get(TRACE_MEMORY_ENV, "") not in ("", "0")
+    if not (output_file or profile_dir or trace_memory):
+        return None
+    return enable(None if output_file in (None, "1") else output_file, profile_dir, trace_memory)
+
+
+def disable():
+    global _collector
+    if _collector is not None and _collector.started_tracing and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _collector = None
+
+
+def enabled():
+    return _collector is not None
+
+
+def active():
+    """The current Collector, or None when metrics are off"""
+    return _collector
+
+
+def span(name, rows=0, nbytes=0):
+    """Context manager timing one stage; a shared no-op when metrics are off"""
+    if _collector is None:
+        return _NULL_SPAN
+    return Span(_collector, name, rows, nbytes)
+
+
+def count(name, value=1):
+    if _collector is not None:
+        _collector.count(name, value)
+
+
+def write_summary():
+    """Write the JSON summary to the configured file, or print it; does nothing when metrics are off"""
+    if _collector is None:
+        return None
+    summary = _collector.summary()
+    if _collector.output_file:
+        with open(_collector.output_file, "w") as f:
+            json.dump(summary, f, indent=1)
+    else:
+        print(json.dumps(summary, indent=1))
+    return summary
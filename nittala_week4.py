@@ -7,7 +7,7 @@
 """
 
 import StockCalculator as sc
-from datetime import datetime
+import schema_validator as sv
 
 
 def stock_report(investor, stock_symbols, shares, purchase_price, current_price, current_date, purchase_date):
@@ -26,70 +26,20 @@ def stock_report(investor, stock_symbols, shares, purchase_price, current_price,
               sc.calculate_percent_yield_loss(i, purchase_price, current_price, current_date, purchase_date))
 
 
-def validate_lists(investor_attributes):
-    """ Validates that the lists have values and are all aligned.
-    """
-    try:
-        stock_symbols = investor_attributes['stock_symbols']
-        shares = investor_attributes['shares']
-        purchase_price = investor_attributes['purchase_price']
-        current_price = investor_attributes['current_price']
-        current_date = investor_attributes['current_date']
-        purchase_date = investor_attributes['purchase_date']
-        if (len(stock_symbols) > 0 and
-                    len(stock_symbols) == len(shares) and
-                    len(stock_symbols) == len(purchase_price) and
-                    len(stock_symbols) == len(current_price) and
-                    len(stock_symbols) == len(current_date) and
-                    len(stock_symbols) == len(purchase_date)):
-            return 1
-        else:
-            print("Please check lists for errors!!!")
-            return 0
-    except Exception as e:
-        print("Exception occurred while validating lists!!!", e)
+# Compiled once; checks keys, list lengths and element types of an investor in one pass
+STOCK_SCHEMA = sv.InvestorSchema([('stock_symbols', str), ('shares', int), ('purchase_price', float),
+                                  ('current_price', float), ('current_date', sv.DATE), ('purchase_date', sv.DATE)])
 
 
-def validate_keys(investor_attributes):
-    """Validates that all the expected keys exist in the stock data dictionary for each of the investors
+def validate_investors(stock_data_dict):
+    """Validate every investor of stock_data_dict and print the problems found
+    :return: Dictionary of investor -> ValidationResult
     """
-    try:
-        if (('stock_symbols') in investor_attributes.keys() and
-                    ('shares') in investor_attributes.keys() and
-                    ('purchase_price') in investor_attributes.keys() and
-                    ('current_price') in investor_attributes.keys() and
-                    ('current_date') in investor_attributes.keys() and
-                    ('purchase_date') in investor_attributes.keys()):
-            return True
-        else:
-            print("Missing Keys. Please check input.")
-            return False
-    except Exception as e:
-        print("Exception occurred while validating keys!!! ", e)
-
-
-def validate_types(investor_attributes):
-    """Validates that all the values in the dictionary are of the expected data types
-    """
-    try:
-        stock_symbols = investor_attributes['stock_symbols']
-        shares = investor_attributes['shares']
-        purchase_price = investor_attributes['purchase_price']
-        current_price = investor_attributes['current_price']
-        current_date = investor_attributes['current_date']
-        purchase_date = investor_attributes['purchase_date']
-
-        if (all(isinstance(stock, str) for stock in stock_symbols) and
-                all(isinstance(share, int) for share in shares) and
-                all(isinstance(pp, float) for pp in purchase_price) and
-                all(isinstance(cp, float) for cp in current_price) and
-                all(isinstance(datetime.strptime(cd, "%m/%d/%Y"), datetime) for cd in current_date) and
-                all(isinstance(datetime.strptime(pd, "%m/%d/%Y"), datetime) for pd in purchase_date)):
-            return True
-        else:
-            print("The types are invalid")
-    except Exception as e:
-        print("Exception occurred while validating types!!! ", e)
+    results = STOCK_SCHEMA.validate_many(stock_data_dict)
+    for result in results.values():
+        if not result:
+            print(result)
+    return results
 
 
 if __name__ == "__main__":
@@ -107,9 +57,9 @@ if __name__ == "__main__":
                                  '10/8/2017', '10/8/2017']
             }}
 
+    results = validate_investors(stock_data_dict)
     for investor, investor_attributes in stock_data_dict.items():
-        if (validate_keys(investor_attributes) and validate_types(investor_attributes) and validate_lists(
-                investor_attributes)):
+        if results[investor]:
             stock_report(investor, investor_attributes['stock_symbols'], investor_attributes['shares'],
                          investor_attributes['purchase_price'], investor_attributes['current_price'],
                          investor_attributes['current_date'], investor_attributes['purchase_date'])
@@ -10,9 +10,19 @@
 
 import StockCalculator as sc
 from datetime import datetime
+import schema_validator as sv
+import sys
+
+# Compiled once; check keys, list lengths and element types of an investor in one pass
+STOCK_SCHEMA = sv.InvestorSchema([('stock_symbols', str), ('purchase_id', int), ('shares', int),
+                                  ('purchase_price', float), ('current_price', float), ('current_date', sv.DATE),
+                                  ('purchase_date', sv.DATE)])
+BOND_SCHEMA = sv.InvestorSchema(STOCK_SCHEMA.fields + [('coupon', float), ('yield', float)])
 
 
 class Investor():
+    __slots__ = ("investor_id", "first_name", "address", "phone_number", "list_of_stocks")
+
     def __init__(self, investor_id, first_name, address, phone_number, list_of_stocks):
         """Initialize the investor."""
         self.investor_id = investor_id
@@ -23,10 +33,13 @@ class Investor():
 
 
 class Stocks():
+    __slots__ = ("purchase_id", "stock_symbol", "purchase_price", "current_price", "shares", "current_date",
+                 "purchase_date")
+
     def __init__(self, purchase_id, stock_symbol, purchase_price, current_price, shares, current_date, purchase_date):
         """Assign values to stock attributes"""
         self.purchase_id = purchase_id
-        self.stock_symbol = stock_symbol
+        self.stock_symbol = sys.intern(stock_symbol)
         self.purchase_price = purchase_price
         self.current_price = current_price
         self.shares = shares
@@ -44,6 +57,8 @@ class Stocks():
 
 
 class Bonds(Stocks):
+    __slots__ = ("coupon", "yld")
+
     def __init__(self, purchase_id, symbol, purchase_price, current_price, shares, current_date, purchase_date, coupon,
                  yld):
         """Assign values to Bond attributes."""
@@ -67,77 +82,6 @@ if __name__ == "__main__":
     today = str(datetime.now().strftime("%m/%d/%Y"))
 
 
-    def validate_lists(investor_attributes):
-        """ Validates that the lists have values and are all aligned.
-        """
-        try:
-            stock_symbols = investor_attributes['stock_symbols']
-            purchase_id = investor_attributes['purchase_id']
-            shares = investor_attributes['shares']
-            purchase_price = investor_attributes['purchase_price']
-            current_price = investor_attributes['current_price']
-            current_date = investor_attributes['current_date']
-            purchase_date = investor_attributes['purchase_date']
-            if (len(stock_symbols) > 0 and
-                        len(stock_symbols) == len(shares) and
-                        len(stock_symbols) == len(purchase_id) and
-                        len(stock_symbols) == len(purchase_price) and
-                        len(stock_symbols) == len(current_price) and
-                        len(stock_symbols) == len(current_date) and
-                        len(stock_symbols) == len(purchase_date)):
-                return 1
-            else:
-                print("Please check lists for errors!!!")
-                return 0
-        except Exception as e:
-            print("Exception occurred while validating lists!!!", e)
-
-
-    def validate_keys(investor_attributes):
-        """Validates that all the expected keys exist in the stock data dictionary for each of the investors
-        """
-        try:
-            if (('stock_symbols') in investor_attributes.keys() and
-                        ('purchase_id') in investor_attributes.keys() and
-                        ('shares') in investor_attributes.keys() and
-                        ('purchase_price') in investor_attributes.keys() and
-                        ('current_price') in investor_attributes.keys() and
-                        ('current_date') in investor_attributes.keys() and
-                        ('purchase_date') in investor_attributes.keys()):
-                return True
-            else:
-                print("Missing Keys. Please check input.")
-                return False
-        except Exception as e:
-            print("Exception occurred while validating keys!!! ", e)
-
-
-    def validate_types(investor_attributes):
-        """Validates that all the values in the dictionary are of the expected data types
-        """
-        try:
-            stock_symbols = investor_attributes['stock_symbols']
-            purchase_id = investor_attributes['purchase_id']
-            shares = investor_attributes['shares']
-            purchase_price = investor_attributes['purchase_price']
-            current_price = investor_attributes['current_price']
-            current_date = investor_attributes['current_date']
-            purchase_date = investor_attributes['purchase_date']
-
-            if (all(isinstance(stock, str) for stock in stock_symbols) and
-                    all(isinstance(pid, int) for pid in purchase_id) and
-                    all(isinstance(share, int) for share in shares) and
-                    all(isinstance(pp, float) for pp in purchase_price) and
-                    all(isinstance(cp, float) for cp in current_price) and
-                    all(isinstance(datetime.strptime(cd, "%m/%d/%Y"), datetime) for cd in current_date) and
-                    all(isinstance(datetime.strptime(pd, "%m/%d/%Y"), datetime) for pd in purchase_date)):
-                return True
-            else:
-                print("The types are invalid")
-        except Exception as e:
-            print("Exception occurred while validating types!!! ", e)
-
-
     # Dictionary of stock symbols, shares, purchase price, current price, current_date, and purchase date.
     data_dict = {"1":
                      {'investor_name': 'Bob',
@@ -170,6 +114,12 @@ if __name__ == "__main__":
                       }
                  }
 
+    stock_results = STOCK_SCHEMA.validate_many(data_dict, lambda investor: investor['investor_data']['Stocks'])
+    bond_results = BOND_SCHEMA.validate_many(data_dict, lambda investor: investor['investor_data']['Bonds'])
+    for result in list(stock_results.values()) + list(bond_results.values()):
+        if not result:
+            print(result)
+
     for investor_id, investor_data_dict in data_dict.items():
         investor_id = investor_id
         investor_name = investor_data_dict['investor_name']
@@ -181,8 +131,7 @@ if __name__ == "__main__":
         investor = Investor(investor_id, investor_name, investor_address, investor_phone,
                             investor_stock_data['stock_symbols'])
 
-        if (validate_keys(investor_stock_data) and validate_types(investor_stock_data) and validate_lists(
-                investor_stock_data)):
+        if stock_results[investor_id]:
             justification = max(len(stock) for stock in investor_stock_data['stock_symbols'])
             # Process Stock Data
             print("Stock ownership for " + str(investor_name))
@@ -203,10 +152,11 @@ if __name__ == "__main__":
             print("BOND".ljust(justification), "\t""\t", "#SHARES", "\t", "EARNINGS/LOSS", "\t""\t",
                   "YEARLY EARNING/LOSS", "\t\t", "COUPON", "\t\t", "YIELD")
             print("----------------------------------------------------------------------------")
-            for i in range(0, len(investor_bond_data['stock_symbols'])):
-                bonds = Bonds(investor_bond_data['purchase_id'][i], investor_bond_data['stock_symbols'][i],
-                              investor_bond_data['purchase_price'][i],
-                              investor_bond_data['current_price'][i], investor_bond_data['shares'][i],
-                              investor_bond_data['current_date'][i], investor_bond_data['purchase_date'][i],
-                              investor_bond_data['coupon'][i], investor_bond_data['yield'][i])
-                bonds.bond_report()
+            if bond_results[investor_id]:
+                for i in range(0, len(investor_bond_data['stock_symbols'])):
+                    bonds = Bonds(investor_bond_data['purchase_id'][i], investor_bond_data['stock_symbols'][i],
+                                  investor_bond_data['purchase_price'][i],
+                                  investor_bond_data['current_price'][i], investor_bond_data['shares'][i],
+                                  investor_bond_data['current_date'][i], investor_bond_data['purchase_date'][i],
+                                  investor_bond_data['coupon'][i], investor_bond_data['yield'][i])
+                    bonds.bond_report()
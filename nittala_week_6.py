@@ -8,65 +8,90 @@
 ################################################################
 """
 
+import argparse
 from datetime import datetime
 import os
+import sys
+
+import holdings_loader as hl
+from lot_store import LotArray, SYMBOL
+import metrics
+import parallel_report
+from quote_table import DEFAULT_QUOTES
+import report_renderer as rr
+import StockCalculator as sc
+import symbol_index as si
 
 
 class Investor(object):
-    def __init__(self, investor_id, first_name, address, phone_number):
+    __slots__ = ("_investor_id", "_first_name", "_address", "_phone_number", "_list_of_stocks", "_list_of_bonds",
+                 "_index")
+
+    def __init__(self, investor_id, first_name, address, phone_number, compact=False, index=None):
         """Initialize the investor.
+        :param compact: Keep lots in array backed containers instead of lists of objects
+        :param index: Optional SymbolIndex updated with every stock and bond added
         """
         self._investor_id = investor_id
         self._first_name = first_name
         self._address = address
         self._phone_number = phone_number
-        self._list_of_stocks = []
-        self._list_of_bonds = []
+        self._list_of_stocks = LotArray(Stock) if compact else []
+        self._list_of_bonds = LotArray(Bond) if compact else []
+        self._index = index
 
     def add_stock(self, stock):
         """
         :param stock: This is the current Stock Object
         """
         self._list_of_stocks.append(stock)
+        if self._index is not None:
+            self._index.add(self, self._list_of_stocks, len(self._list_of_stocks) - 1)
 
     def add_bond(self, bond):
         """
         :param bond: This is the current Bond Object
         """
         self._list_of_bonds.append(bond)
+        if self._index is not None:
+            self._index.add(self, self._list_of_bonds, len(self._list_of_bonds) - 1)
+
+    def revalue(self, prices=None):
+        """Reprice the investor's lots from the shared quote table and return the total loss or gain.
+        Lots of symbols without a quote keep the price they were loaded with.
+        :param prices: Optional dictionary of symbol -> current price, stored in the quote table first
+        """
+        if prices:
+            Stock.quotes.update_many(prices)
+        total = 0.0
+        for lots in (self._list_of_stocks, self._list_of_bonds):
+            if isinstance(lots, LotArray):
+                lots.set_prices(Stock.quotes.prices(set(lots.column("_stock_symbol"))))
+                total += lots.total_loss_gain()
+                continue
+            quoted = Stock.quotes.prices(set(lot._stock_symbol for lot in lots))
+            for lot in lots:
+                if lot._stock_symbol in quoted:
+                    lot.current_price = quoted[lot._stock_symbol]
+                total += lot.loss_gain
+        return total
 
     def print_investments(self, report):
         """Print each of the investor's investments into a report file"""
-
-        report.write("##################################################")
-        report.write("\n#### Investment Report for {0}".format(self._first_name))
-        report.write("\n#### Address:- {0}".format(self._address))
-        report.write("\n#### Phone:- {0}".format(self._phone_number))
-        report.write("\n##################################################")
-
-        # Stock headers
-        report.write('\n-------------------------------------------------------------------------------------')
-        report.write('\n{:<16}{:<16}{:<16}{:<16}'.format('STOCK', '#SHARES', 'EARNINGS/LOSS', 'YEARLY RATE'))
-        report.write('\n-------------------------------------------------------------------------------------')
-        for stock in self._list_of_stocks:
-            stock.stock_report(report)
-
-        # Bond headers
-        report.write('\n\n-------------------------------------------------------------------------------------')
-        report.write(
-            '\n{:<16}{:<16}{:<16}{:<16}{:<16}{:<16}'.format('BOND', '#QTY', 'EARNINGS/LOSS', 'YEARLY RATE',
-                                                            'COUPON', 'YIELD'))
-        report.write('\n-------------------------------------------------------------------------------------')
-        for bond in self._list_of_bonds:
-            bond.bond_report(report)
-        report.write('\n\n\n\n')
+        report.write(rr.render_investor_block(self))
 
 
 class Stock(object):
+    __slots__ = ("_purchase_id", "_stock_symbol", "_purchase_price", "_current_price", "_shares", "_current_day",
+                 "_purchase_day", "_loss_gain", "_annual_percent_yield_loss")
+    compact_fields = (("_purchase_id", "q"), ("_stock_symbol", SYMBOL), ("_purchase_price", "d"),
+                      ("_current_price", "d"), ("_shares", "q"), ("_current_day", "i"), ("_purchase_day", "i"))
+    quotes = DEFAULT_QUOTES
+
     def __init__(self, purchase_id, stock_symbol, purchase_price, current_price, shares, current_date, purchase_date):
         """Assign values to stock attributes"""
         self._purchase_id = purchase_id
-        self._stock_symbol = stock_symbol
+        self._stock_symbol = sys.intern(stock_symbol)
 
         try:
             self._purchase_price = float(purchase_price)
@@ -87,48 +112,92 @@ class Stock(object):
             raise
 
         try:
-            self._current_date = datetime.strptime(current_date, "%m/%d/%Y").date()
+            self._current_day = sc.to_epoch_day(current_date)
         except Exception as e:
             print(str(e))
             raise
 
         try:
-            self._purchase_date = datetime.strptime(purchase_date, "%m/%d/%Y").date()
+            self._purchase_day = sc.to_epoch_day(purchase_date)
         except Exception as e:
             print(str(e))
             raise
 
-        if self._current_date < self._purchase_date:
+        if self._current_day < self._purchase_day:
             raise ValueError("Purchase Date should be prior to today")
 
-        self._loss_gain = self.calculate_loss_gain(self._purchase_price, self._current_price, self._shares)
-        self._annual_percent_yield_loss = self.calculate_annual_percent_yield_loss(self._purchase_price,
-                                                                                   self._current_price,
-                                                                                   self._current_date,
-                                                                                   self._purchase_date)
+        # Results are computed on first use and recomputed when the price changes
+        self._loss_gain = None
+        self._annual_percent_yield_loss = None
+
+    @property
+    def _current_date(self):
+        return sc.to_date(self._current_day)
+
+    @property
+    def _purchase_date(self):
+        return sc.to_date(self._purchase_day)
+
+    @property
+    def current_price(self):
+        return self._current_price
+
+    @current_price.setter
+    def current_price(self, current_price):
+        """Reprice this lot only; Investor.revalue applies shared quotes"""
+        self._current_price = float(current_price)
+
+    @property
+    def loss_gain(self):
+        """Loss or gain as a number"""
+        price = self._current_price
+        if self._loss_gain is None or self._loss_gain[0] != price:
+            self._loss_gain = price, self.calculate_loss_gain(self._purchase_price, price, self._shares)
+        return self._loss_gain[1]
+
+    @property
+    def annual_percent_yield_loss(self):
+        """Annual percent yield or loss as a number"""
+        price = self._current_price
+        if self._annual_percent_yield_loss is None or self._annual_percent_yield_loss[0] != price:
+            self._annual_percent_yield_loss = price, self.calculate_annual_percent_yield_loss(self._purchase_price,
+                                                                                              price,
+                                                                                              self._current_day,
+                                                                                              self._purchase_day)
+        return self._annual_percent_yield_loss[1]
 
     def calculate_loss_gain(self, purchase_price, current_price, shares):
         """Calculates the loss or gain
         """
-        return str(round((current_price - purchase_price) * shares, 2))
+        return (current_price - purchase_price) * shares
 
-    def calculate_annual_percent_yield_loss(self, purchase_price, current_price, current_date, purchase_date):
-        """Calculates the annual percent yield or loss
+    def calculate_annual_percent_yield_loss(self, purchase_price, current_price, current_day, purchase_day):
+        """Calculates the annual percent yield or loss. Dates are epoch days.
         """
-        return str(round(
-            (((current_price - purchase_price) / purchase_price) / (
-                (current_date - purchase_date).days)) * 100 * 365, 2)) + "%"
+        return (((current_price - purchase_price) / purchase_price) / (current_day - purchase_day)) * 100 * 365
+
+    def format_loss_gain(self):
+        """Loss or gain as it is printed in the report"""
+        return rr.format_loss_gain(self.loss_gain)
+
+    def format_annual_percent_yield_loss(self):
+        """Annual percent yield or loss as it is printed in the report"""
+        return rr.format_annual_percent_yield_loss(self.annual_percent_yield_loss)
+
+    def report_values(self):
+        """Report columns for this stock"""
+        return self._stock_symbol, str(self._shares), self.format_loss_gain(), self.format_annual_percent_yield_loss()
 
     def stock_report(self, report_file):
         """Print stock report for a given investor
         """
-
-        report_file.write(
-            "\n{:<16}{:<16}{:<16}{:<16}".format(str(self._stock_symbol), str(self._shares), str(self._loss_gain),
-                                                str(self._annual_percent_yield_loss)))
+        report_file.write(rr.STOCK_ROW(*self.report_values()))
 
 
 class Bond(Stock):
+    __slots__ = ("coupon", "yld")
+    compact_fields = Stock.compact_fields + (("coupon", SYMBOL), ("yld", SYMBOL))
+
     def __init__(self, purchase_id, symbol, purchase_price, current_price, shares, current_date, purchase_date, coupon,
                  yld):
         """Assign values to Bond attributes."""
@@ -136,111 +205,148 @@ class Bond(Stock):
         self.coupon = coupon
         self.yld = yld
 
+    def report_values(self):
+        """Report columns for this bond"""
+        return super().report_values() + (str(self.coupon), str(self.yld))
+
     def bond_report(self, report_file):
         """Print bond report for all investors
         """
-
-        report_file.write("\n{:<16}{:<16}{:<16}{:<16}{:<16}{:<16}".format(str(self._stock_symbol), str(self._shares),
-                                                                          str(self._loss_gain),
-                                                                          str(self._annual_percent_yield_loss),
-                                                                          str(self.coupon), str(self.yld)))
-
-
-def load_stock_data(today, investor_obj):
-    """Loads and adds stock data for a given investor object"""
-    try:
-        file_path = "Lesson6_Data_Stocks.csv"
-        if os.path.exists(file_path):
-            with open(file_path, "r") as stockFile:
-                header = []
-                for index, row in enumerate(stockFile):
-                    attributes = row.split(",")
-                    if index == 0:
-                        header = attributes
-                    else:
-                        if all(col in header for col in
-                               ["SYMBOL", "NO_SHARES", "PURCHASE_PRICE", "CURRENT_VALUE", "PURCHASE_DATE\n"]):
-                            symbol_index = header.index("SYMBOL")
-                            symbol = attributes[symbol_index]
-                            symbol_index = header.index("NO_SHARES")
-                            shares = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_PRICE")
-                            purchase_price = attributes[symbol_index]
-                            symbol_index = header.index("CURRENT_VALUE")
-                            current_value = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_DATE\n")
-                            purchase_date = attributes[symbol_index]
-                            stock = Stock(index, symbol, purchase_price, current_value, shares, today,
-                                          purchase_date.strip())
-                            investor_obj.add_stock(stock)
-                        else:
-                            raise ValueError("Incorrect Columns in Stock file")
-                stockFile.close()
-        else:
-            raise FileNotFoundError(
-                "Stock File not found!! Please make sure input file exists in same directory as the Python program.")
-    except Exception as e:
-        raise e
-
-
-def load_bond_data(today, investor_obj):
-    """Loads and adds Bond data for a given investor object"""
-    try:
-        file_path = "Lesson6_Data_Bonds.csv"
-        if os.path.exists(file_path):
-            with open(file_path, "r") as bondFile:
-                header = []
-                for index, row in enumerate(bondFile):
-                    attributes = row.split(",")
-                    if index == 0:
-                        header = attributes
-                    else:
-                        if all(col in header for col in
-                               ["SYMBOL", "NO_SHARES", "PURCHASE_PRICE", "CURRENT_VALUE", "PURCHASE_DATE", "Coupon",
-                                "Yield\n"]):
-                            symbol_index = header.index("SYMBOL")
-                            symbol = attributes[symbol_index]
-                            symbol_index = header.index("NO_SHARES")
-                            shares = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_PRICE")
-                            purchase_price = attributes[symbol_index]
-                            symbol_index = header.index("CURRENT_VALUE")
-                            current_value = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_DATE")
-                            purchase_date = attributes[symbol_index]
-                            symbol_index = header.index("Coupon")
-                            coupon = attributes[symbol_index]
-                            symbol_index = header.index("Yield\n")
-                            yld = attributes[symbol_index]
-                            bond = Bond(index, symbol, purchase_price, current_value, shares, today, purchase_date,
-                                        coupon, yld.strip())
-                            investor_obj.add_bond(bond)
-                        else:
-                            raise ValueError("Incorrect Columns in Bond file")
-                bondFile.close()
-        else:
-            raise FileNotFoundError(
-                "Bond File not found!! Please make sure input file exists in same directory as the Python program.")
-    except Exception as e:
-        raise e
-
-
-def main():
+        report_file.write(rr.BOND_ROW(*self.report_values()))
+
+
+def _investor_map(investors):
+    """Accept a single Investor or a list of them and key them by investor id"""
+    if isinstance(investors, Investor):
+        investors = [investors]
+    return dict((investor_obj._investor_id, investor_obj) for investor_obj in investors)
+
+
+def stock_from_values(index, values, today):
+    """Build a Stock from the hl.STOCK_COLUMNS values of holdings row index"""
+    symbol, shares, purchase_price, current_value, purchase_date = values
+    return Stock(index, symbol, purchase_price, current_value, shares, today, purchase_date)
+
+
+def bond_from_values(index, values, today):
+    """Build a Bond from the hl.BOND_COLUMNS values of holdings row index"""
+    symbol, shares, purchase_price, current_value, purchase_date, coupon, yld = values
+    return Bond(index, symbol, purchase_price, current_value, shares, today, purchase_date, coupon, yld)
+
+
+def load_stock_data(today, investors, file_path=hl.STOCK_FILE, verbose=True, parse_workers=None,
+                    columnar=False):
+    """Loads stock data once and adds it to each of the given investor objects"""
+
+    def add_lot(investor_obj, index, values):
+        investor_obj.add_stock(stock_from_values(index, values, today))
+
+    return hl.route_rows(file_path, hl.STOCK_COLUMNS, _investor_map(investors), add_lot, "Stock", verbose,
+                         parse_workers, columnar)
+
+
+def load_bond_data(today, investors, file_path=hl.BOND_FILE, verbose=True, parse_workers=None,
+                   columnar=False):
+    """Loads Bond data once and adds it to each of the given investor objects"""
+
+    def add_lot(investor_obj, index, values):
+        investor_obj.add_bond(bond_from_values(index, values, today))
+
+    return hl.route_rows(file_path, hl.BOND_COLUMNS, _investor_map(investors), add_lot, "Bond", verbose,
+                         parse_workers, columnar)
+
+
+def write_columns_report(output_report_file, investors, today, parse_workers=None, columnar=False):
+    """Write the report straight from the parsed holdings columns, one investor slice at a time, without
+    building Stock and Bond objects.
+    :param investors: Investor objects, without holdings, in report order
+    :param parse_workers: Worker processes parsing each holdings file; None parses it in this process
+    :param columnar: Read the holdings through the memory mapped columnar store
+    :return: Number of lots rendered
+    """
+    stocks = hl.load_columns(hl.STOCK_FILE, hl.STOCK_COLUMNS, "Stock", parse_workers, columnar)
+    bonds = hl.load_columns(hl.BOND_FILE, hl.BOND_COLUMNS, "Bond", parse_workers, columnar)
+    investor_ids = [investor_obj._investor_id for investor_obj in investors]
+    stock_rows = stocks.investor_rows(investor_ids)
+    bond_rows = bonds.investor_rows(investor_ids)
+    lots = 0
+    with open(output_report_file, "w") as report, rr.ReportRenderer(report) as renderer:
+        for investor_obj in investors:
+            rows = stock_rows[investor_obj._investor_id]
+            bond_slice = bond_rows[investor_obj._investor_id]
+            renderer.render_columns(investor_obj._first_name, investor_obj._address, investor_obj._phone_number,
+                                    rr.portfolio_columns(stocks.portfolio(rows), today),
+                                    rr.portfolio_columns(bonds.portfolio(bond_slice), today) +
+                                    (bonds.take("Coupon", bond_slice), bonds.take("Yield", bond_slice)))
+            lots += len(rows) + len(bond_slice)
+    return lots
+
+
+def main(workers=1, parse_workers=None, columnar=False, holders=None, render_columns=False):
+    """Load the holdings files and write the investor report.
+    :param workers: Number of worker processes rendering the report; 1 renders in this process
+    :param parse_workers: Parse the holdings files in chunks with this many processes; None reads them line by line
+    :param columnar: Read the holdings through the memory mapped columnar store
+    :param holders: Symbols whose holders and exposure are printed after the report, looked up in a SymbolIndex
+    :param render_columns: Render the report straight from the parsed holdings columns instead of lot objects
+    """
     output_report_file = "investor_report.txt"
-    today = str(datetime.now().strftime("%m/%d/%Y"))
+    # One valuation date shared by every lot in the run
+    today = datetime.now().date()
+    index = si.SymbolIndex() if holders else None
     investor_id = 1
     list_of_investors = []
-    investor_obj1 = Investor(investor_id, "Bob", "71 Pilgrim Avenue Chevy Chase, MD 20815", "303-303-3033")
+    investor_obj1 = Investor(investor_id, "Bob", "71 Pilgrim Avenue Chevy Chase, MD 20815", "303-303-3033",
+                             index=index)
     list_of_investors.append(investor_obj1)
-    investor_obj2 = Investor(investor_id, "Carl", "271 East Orchard Ave, CO 80112", "720-909-1234")
+    investor_obj2 = Investor(investor_id + 1, "Carl", "271 East Orchard Ave, CO 80112", "720-909-1234", index=index)
     list_of_investors.append(investor_obj2)
-    with open(output_report_file, "w") as report:
-        for investor_obj in list_of_investors:
-            load_stock_data(today, investor_obj)
-            load_bond_data(today, investor_obj)
-            investor_obj.print_investments(report)
-    report.close()
+    # Holder lookups need the lots in this process, so they use the single process path
+    if workers > 1 and index is None:
+        investor_rows = [(investor_obj._investor_id, investor_obj._first_name, investor_obj._address,
+                          investor_obj._phone_number) for investor_obj in list_of_investors]
+        with metrics.span("parallel_report", rows=len(investor_rows)) as stage:
+            parallel_report.write_report_from_csv(investor_rows, output_report_file, today, workers,
+                                                  parse_workers=parse_workers, columnar=columnar)
+            stage.add(nbytes=os.path.getsize(output_report_file))
+        return
+    if render_columns and index is None:
+        with metrics.span("report_write", rows=len(list_of_investors)) as stage:
+            write_columns_report(output_report_file, list_of_investors, today, parse_workers, columnar)
+            stage.add(nbytes=os.path.getsize(output_report_file))
+        return
+    with metrics.span("load_holdings"):
+        load_stock_data(today, list_of_investors, parse_workers=parse_workers, columnar=columnar)
+        load_bond_data(today, list_of_investors, parse_workers=parse_workers, columnar=columnar)
+    with metrics.span("report_write", rows=len(list_of_investors)) as stage:
+        with open(output_report_file, "w") as report, rr.ReportRenderer(report) as renderer:
+            for investor_obj in list_of_investors:
+                renderer.render_investor(investor_obj)
+        stage.add(nbytes=os.path.getsize(output_report_file))
+    if index is not None:
+        print(si.holders_report(index, holders), end="")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate the investor report from the holdings files")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes used to render the report")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="parse the holdings files in memory mapped chunks with this many processes")
+    parser.add_argument("--columnar", action="store_true",
+                        help="read the holdings through the memory mapped columnar store, converting it when stale")
+    parser.add_argument("--render-columns", action="store_true",
+                        help="render the report straight from the parsed holdings columns, without lot objects")
+    parser.add_argument("--holders", nargs="+", default=None, metavar="SYMBOL",
+                        help="print the investors holding each symbol and the total exposure")
+    parser.add_argument("--metrics", default=None,
+                        help="write stage timings and memory as JSON to this file; '1' prints them "
+                             "(or set " + metrics.METRICS_ENV + ")")
+    parser.add_argument("--profile-dir", default=None,
+                        help="dump a cProfile file per stage here (or set " + metrics.PROFILE_ENV + ")")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record tracemalloc peak memory per stage (or set " + metrics.TRACE_MEMORY_ENV + "=1)")
+    args = parser.parse_args()
+    metrics.configure(args.metrics, args.profile_dir, args.trace_memory)
+    main(workers=args.workers, parse_workers=args.parse_workers, columnar=args.columnar, holders=args.holders,
+         render_columns=args.render_columns)
+    metrics.write_summary()
@@ -6,55 +6,68 @@
 ######################################################################
 """
 
-import json
-import datetime
+import argparse
 from matplotlib import pyplot
-from matplotlib import dates
+import numpy as np
 
+import chart_batch
+import downsample as ds
+import price_analytics as pa
+import price_cache as pc
 
-def read_file(file_path):
-    """Read a json file.
-      :param file_path: This is the input file path.
-      :return: json data
-     """
-    with open(file_path) as f:
-        data = json.load(f)
-        return data
 
-
-def add_data_to_graph(open_price, close_price, date):
+def add_data_to_graph(open_price, close_price, date, max_points=None, method=ds.MINMAX):
     """Plot graph using price,date Parameters:
     :param open_price: Open price
     :param close_price: Close price
     :param date: Date
+    :param max_points: Points kept per line after downsampling, defaults to a few per pixel of the figure
+    :param method: Downsampling method, ds.MINMAX or ds.LTTB
     :return: The graph with the data
     """
     # date = dates.date2num(date)
-    pyplot.plot(date, open_price, linestyle='solid', marker='None', label="Open Price")
-    pyplot.plot(date, close_price, linestyle='solid', marker='None', label="Close Price")
+    if max_points is None:
+        figure = pyplot.gcf()
+        max_points = ds.target_points(figure.get_size_inches()[0], figure.dpi)
+    pyplot.plot(*ds.downsample(date, open_price, max_points, method), linestyle='solid', marker='None',
+                label="Open Price")
+    pyplot.plot(*ds.downsample(date, close_price, max_points, method), linestyle='solid', marker='None',
+                label="Close Price")
+    return pyplot
+
+
+def add_moving_averages_to_graph(close_price, date, windows, max_points=None, method=ds.MINMAX):
+    """Overlay moving averages of the close price on the graph
+    :param close_price: Close price
+    :param date: Date
+    :param windows: Moving average window lengths in days
+    :return: The graph with the moving averages
+    """
+    if max_points is None:
+        figure = pyplot.gcf()
+        max_points = ds.target_points(figure.get_size_inches()[0], figure.dpi)
+    for window, average in pa.moving_averages(close_price, windows).items():
+        pyplot.plot(*ds.downsample(date, average, max_points, method), linestyle='dashed', marker='None',
+                    label="{0} day SMA".format(window))
     return pyplot
 
 
-def main():
+def main(sma_windows=()):
     """
     Add Stock data of IBM to price and date lists.
     """
     file_path = "AllStocks.json"
-    data = read_file(file_path)
-    open_price = []
-    close_price = []
-    date_list = []
-    for i in data:
-        # filter by symbol
-        if i["Symbol"] == "IBM":
-            # filter out of all -
-            if i['Open'] != '-':
-                open_price.append(float(i["Open"]))
-                close_price.append(float(i["Close"]))
-                date = datetime.datetime.strptime(i['Date'], '%d-%b-%y').date()
-                date_list.append(date)
-                # generate 2 lines within one graph
+    # columns come memory mapped from the per-symbol cache, built from the json file on first use
+    prices = pc.load_symbol(file_path, "IBM")
+    # filter out of all -
+    prices = prices[~np.isnan(prices["open"])]
+    open_price = prices["open"]
+    close_price = prices["close"]
+    date_list = prices["date"].astype("datetime64[D]")
+    # generate 2 lines within one graph
     graph = add_data_to_graph(open_price, close_price, date_list)
+    if sma_windows:
+        graph = add_moving_averages_to_graph(close_price, date_list, sma_windows)
     graph.legend()
     graph.title("Stock Info of Open or Close price v/s Date")
     graph.xlabel('Date')
@@ -62,5 +75,24 @@ def main():
     graph.savefig('nittala_stock_graph_week8.png')
     graph.show()
 
+
+def batch_main(file_path, symbols, output_dir, workers, force, sma_windows=()):
+    """Render a PNG per symbol on the Agg backend without opening any window"""
+    rendered, skipped = chart_batch.render_charts(file_path, symbols, output_dir, workers, force, sma_windows)
+    print("Rendered {0} charts, {1} already current, in {2}".format(rendered, skipped, output_dir))
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Chart open and close prices")
+    parser.add_argument("--symbols", nargs="+", help="Render charts for these symbols in batch mode")
+    parser.add_argument("--all", action="store_true", help="Render charts for every symbol in batch mode")
+    parser.add_argument("--file", default="AllStocks.json")
+    parser.add_argument("--out-dir", default="charts")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="Render charts even when they are current")
+    parser.add_argument("--sma", type=int, nargs="+", default=[], help="Overlay moving averages of these lengths")
+    args = parser.parse_args()
+    if args.symbols or args.all:
+        batch_main(args.file, None if args.all else args.symbols, args.out_dir, args.workers, args.force, args.sma)
+    else:
+        main(args.sma)
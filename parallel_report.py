@@ -0,0 +1,124 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Parallel investor report generation. Investors  #
+#             are split into contiguous shards, each worker    #
+#             process loads and renders its shard, and the     #
+#             report is assembled in investor order. Holdings  #
+#             files are parsed once and routed rows shipped.   #
+################################################################
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import sqlite3
+
+import holdings_loader as hl
+import investment_db as idb
+import report_renderer as rr
+from worker_pool import default_workers, split_shards
+
+SHARDS_PER_WORKER = 4
+
+
+def _render_db_shard(db_file, first_id, last_id, as_of_date):
+    """Worker: load one investor_id range from the database and render its report blocks"""
+    import week_7_nittala as w7
+
+    w7.Stock.set_as_of_date(as_of_date)
+    conn = sqlite3.connect(db_file)
+    try:
+        return "".join(rr.render_investor_block(investor_obj)
+                       for investor_obj in w7.load_investors_from_db(conn, first_id, last_id))
+    finally:
+        conn.close()
+
+
+def _render_csv_shard(investor_rows, as_of_date, stock_rows, bond_rows):
+    """Worker: build one shard of investors from their routed holdings rows and render their report blocks.
+    :param stock_rows: Per investor lists of (row_number, values) stock rows, aligned with investor_rows
+    :param bond_rows: Per investor lists of (row_number, values) bond rows, aligned with investor_rows
+    """
+    import nittala_week_6 as w6
+
+    blocks = []
+    for row, stocks, bonds in zip(investor_rows, stock_rows, bond_rows):
+        investor_obj = w6.Investor(*row)
+        for index, values in stocks:
+            investor_obj.add_stock(w6.stock_from_values(index, values, as_of_date))
+        for index, values in bonds:
+            investor_obj.add_bond(w6.bond_from_values(index, values, as_of_date))
+        blocks.append(rr.render_investor_block(investor_obj))
+    return "".join(blocks)
+
+
+def route_holdings(investor_ids, file_path, columns, kind="Stock", parse_workers=None, columnar=False):
+    """Parse a holdings file once and group its rows by investor.
+    :param investor_ids: Investor ids in report order
+    :return: Dictionary of investor_id -> list of (row_number, values)
+    """
+    routed = dict((investor_id, []) for investor_id in investor_ids)
+
+    def add_row(investor_id, index, values):
+        routed[investor_id].append((index, values))
+
+    hl.route_rows(file_path, columns, dict((investor_id, investor_id) for investor_id in routed), add_row, kind,
+                  False, parse_workers, columnar)
+    return routed
+
+
+def _write_shards(output_report_file, worker, shard_args, workers):
+    """Run worker over every shard in a process pool and write the results in shard order"""
+    with ProcessPoolExecutor(max_workers=workers) as executor, open(output_report_file, "w") as report:
+        for block in executor.map(worker, *zip(*shard_args)):
+            report.write(block)
+
+
+def write_report_from_db(db_file, output_report_file, as_of_date, workers=None):
+    """Render the investor report from the investments database with a pool of worker processes.
+    :param db_file: SQLite database file
+    :param output_report_file: Report file to write
+    :param as_of_date: Valuation date shared by every worker
+    :param workers: Number of worker processes, defaults to the CPU count
+    :return: Number of investors in the report
+    """
+    workers = workers or default_workers()
+    conn = sqlite3.connect(db_file)
+    try:
+        ids = idb.investor_ids(conn)
+    finally:
+        conn.close()
+    shards = split_shards(ids, workers * SHARDS_PER_WORKER)
+    shard_args = [(db_file, shard[0], shard[-1], as_of_date) for shard in shards]
+    if shard_args:
+        _write_shards(output_report_file, _render_db_shard, shard_args, workers)
+    else:
+        open(output_report_file, "w").close()
+    return len(ids)
+
+
+def write_report_from_csv(investor_rows, output_report_file, as_of_date, workers=None,
+                          stock_file=hl.STOCK_FILE, bond_file=hl.BOND_FILE, parse_workers=None, columnar=False):
+    """Render the investor report from the holdings files with a pool of worker processes.
+    The files are parsed once here; each shard receives only the rows routed to its investors.
+    :param investor_rows: (investor_id, first_name, address, phone_number) tuples in report order
+    :param output_report_file: Report file to write
+    :param as_of_date: Valuation date shared by every worker
+    :param workers: Number of worker processes, defaults to the CPU count
+    :param parse_workers: Parse the holdings files in chunks with this many processes; None reads them line by line
+    :param columnar: Read the holdings through the memory mapped columnar store
+    :return: Number of investors in the report
+    """
+    workers = workers or default_workers()
+    investor_rows = list(investor_rows)
+    ids = [row[0] for row in investor_rows]
+    stocks = route_holdings(ids, stock_file, hl.STOCK_COLUMNS, "Stock", parse_workers, columnar)
+    bonds = route_holdings(ids, bond_file, hl.BOND_COLUMNS, "Bond", parse_workers, columnar)
+    shards = split_shards(investor_rows, workers * SHARDS_PER_WORKER)
+    shard_args = [(shard, as_of_date, [stocks[row[0]] for row in shard], [bonds[row[0]] for row in shard])
+                  for shard in shards]
+    if shard_args:
+        _write_shards(output_report_file, _render_csv_shard, shard_args, workers)
+    else:
+        open(output_report_file, "w").close()
+    return len(investor_rows)
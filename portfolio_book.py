@@ -0,0 +1,148 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Struct of arrays book for the dictionary of      #
+#             dictionaries investor model. Every investor's    #
+#             lots share one set of contiguous columns, with   #
+#             an offsets array marking each investor's slice,  #
+#             so validation and valuation run once per book.   #
+################################################################
+"""
+
+from itertools import chain
+import sys
+
+import numpy as np
+
+import StockCalculator as sc
+
+# Keys of each investor's dictionary, in column order
+FIELDS = ("stock_symbols", "shares", "purchase_price", "current_price")
+INVALID_MESSAGE = "Please check lists for errors!!!\n"
+_RULE = "--------------------------------------------\n"
+_HEADER = "Stock ownership for {0}\n" + _RULE + "\n" + "STOCK \t SHARE# \t EARNINGS/LOSS\n" + _RULE
+_ROW = "{0} \t {1} \t\t {2}\n"
+
+
+def validate_lengths(lengths):
+    """Check the list lengths of many investors at once.
+    :param lengths: (investors, len(FIELDS)) array with the length of every list
+    :return: Boolean array, True where the lists have values and are all aligned
+    """
+    lengths = np.asarray(lengths, dtype=np.int64).reshape(-1, len(FIELDS))
+    return (lengths[:, 0] > 0) & (lengths == lengths[:, :1]).all(axis=1)
+
+
+class PortfolioBook(object):
+    def __init__(self, investors, offsets, symbols, symbol_codes, shares, purchase_price, current_price, valid=None):
+        """Lots of many investors in shared columns.
+        :param investors: Investor names, in book order
+        :param offsets: len(investors) + 1 offsets; investor i owns lots offsets[i]:offsets[i + 1]
+        :param symbols: Distinct symbols, indexed by symbol_codes
+        :param symbol_codes: Symbol code of every lot
+        :param shares: Number of shares per lot; stored as int64 unless some lot holds fractional shares
+        :param purchase_price: Purchase price per share
+        :param current_price: Current price per share
+        :param valid: Boolean per investor, False when the source lists failed validation; defaults to all True
+        """
+        self.investors = list(investors)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.symbols = list(symbols)
+        self.symbol_codes = np.asarray(symbol_codes, dtype=np.int32)
+        self.shares = np.asarray(shares)
+        self.purchase_price = np.asarray(purchase_price, dtype=np.float64)
+        self.current_price = np.asarray(current_price, dtype=np.float64)
+        self.valid = np.ones(len(self.investors), dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+        self._positions = None
+
+        lots = len(self.symbol_codes)
+        if len(self.offsets) != len(self.investors) + 1 or len(self.valid) != len(self.investors):
+            raise ValueError("Offsets and validity must match the number of investors")
+        if self.offsets[0] != 0 or self.offsets[-1] != lots or (np.diff(self.offsets) < 0).any():
+            raise ValueError("Offsets must rise from 0 to the number of lots")
+        if not all(len(column) == lots for column in (self.shares, self.purchase_price, self.current_price)):
+            raise ValueError("All portfolio columns must have the same length")
+        if self.shares.dtype.kind == "f" and (self.shares != np.trunc(self.shares)).any():
+            self.shares = self.shares.astype(np.float64)
+        else:
+            self.shares = self.shares.astype(np.int64)
+
+    @classmethod
+    def from_dict(cls, stock_data_dict):
+        """Pack a dictionary of investor -> {field: list} into one book.
+        Investors whose lists fail validation keep their place but own no lots.
+        :param stock_data_dict: Dictionary shaped like the Nittala-3 stock_data_dict
+        :return: PortfolioBook
+        """
+        investors = list(stock_data_dict)
+        holdings = list(stock_data_dict.values())
+        lengths = np.array([[len(attributes.get(field, ())) for field in FIELDS] for attributes in holdings],
+                           dtype=np.int64).reshape(-1, len(FIELDS))
+        valid = validate_lengths(lengths)
+        counts = np.where(valid, lengths[:, 0], 0)
+        offsets = np.zeros(len(investors) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        kept = [attributes for attributes, ok in zip(holdings, valid.tolist()) if ok]
+        lots = int(offsets[-1])
+
+        symbol_ids = {}
+        symbol_codes = np.fromiter([symbol_ids.setdefault(symbol, len(symbol_ids)) for symbol in
+                                    chain.from_iterable(attributes["stock_symbols"] for attributes in kept)],
+                                   dtype=np.int32, count=lots)
+        # Shares are read as floats so fractional shares are kept instead of being truncated
+        columns = [np.fromiter(chain.from_iterable(attributes[field] for attributes in kept), dtype=np.float64,
+                               count=lots) for field in ("shares", "purchase_price", "current_price")]
+        return cls(investors, offsets, list(symbol_ids), symbol_codes, *columns, valid=valid)
+
+    def __len__(self):
+        return len(self.investors)
+
+    @property
+    def lots(self):
+        return len(self.symbol_codes)
+
+    def position(self, investor):
+        """Book position of an investor name"""
+        if self._positions is None:
+            self._positions = dict((name, i) for i, name in enumerate(self.investors))
+        return self._positions[investor]
+
+    def investor_slice(self, position):
+        """Slice of the lot columns owned by the investor at position"""
+        return slice(int(self.offsets[position]), int(self.offsets[position + 1]))
+
+    def lot_counts(self):
+        return np.diff(self.offsets)
+
+    def loss_gain(self):
+        """Rounded loss or gain of every lot in the book"""
+        return sc.calculate_loss_gain(self.purchase_price, self.current_price, self.shares)
+
+    def investor_loss_gain(self):
+        """Total loss or gain per investor, 0 for investors without lots"""
+        owners = np.repeat(np.arange(len(self.investors)), self.lot_counts())
+        gains = sc.loss_gain(self.purchase_price, self.current_price, self.shares)
+        return np.bincount(owners, weights=gains, minlength=len(self.investors))
+
+    def write_report(self, out=None):
+        """Write the stock report of every investor in book order, in the layout of the Nittala-3 report.
+        Investors that failed validation get the validation message instead.
+        """
+        out = out or sys.stdout
+        symbols = self.symbols
+        codes = self.symbol_codes.tolist()
+        shares = self.shares.tolist()
+        if self.shares.dtype.kind == "f":
+            # Whole share counts print like the integers they came from
+            shares = [int(share) if share.is_integer() else share for share in shares]
+        gains = self.loss_gain().tolist()
+        offsets = self.offsets.tolist()
+        for position, (investor, ok) in enumerate(zip(self.investors, self.valid.tolist())):
+            if not ok:
+                out.write(INVALID_MESSAGE)
+                continue
+            start, end = offsets[position], offsets[position + 1]
+            out.write(_HEADER.format(investor) + "".join(
+                [_ROW.format(symbols[code], share, gain) for code, share, gain in
+                 zip(codes[start:end], shares[start:end], gains[start:end])]))
@@ -0,0 +1,108 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Rolling analytics over price columns: moving     #
+#             averages, daily returns, rolling volatility and  #
+#             drawdowns. Windows are computed from cumulative  #
+#             sums, so every window length costs O(n) and     #
+#             many lengths are evaluated in one pass.          #
+################################################################
+"""
+
+import numpy as np
+
+TRADING_DAYS = 252
+DEFAULT_WINDOWS = (20, 50, 200)
+
+
+def _window_sums(values, windows):
+    """Rolling sums of values and of values squared for every window length.
+    A window holding a NaN, or not yet full, yields NaN.
+    :param values: 1-d array
+    :param windows: Window lengths
+    :return: (sums, squared sums), each of shape (len(windows), len(values))
+    """
+    values = np.asarray(values, dtype=np.float64)
+    windows = np.asarray(windows, dtype=np.int64).reshape(-1, 1)
+    if np.any(windows < 1):
+        raise ValueError("Window lengths must be positive")
+    missing = np.isnan(values)
+    clean = np.where(missing, 0.0, values)
+    totals = np.concatenate(([0.0], np.cumsum(clean)))
+    squares = np.concatenate(([0.0], np.cumsum(clean * clean)))
+    gaps = np.concatenate(([0], np.cumsum(missing)))
+
+    ends = np.arange(1, len(values) + 1)
+    starts = ends - windows
+    full = starts >= 0
+    starts = np.where(full, starts, 0)
+    valid = full & (gaps[ends] - gaps[starts] == 0)
+    sums = np.where(valid, totals[ends] - totals[starts], np.nan)
+    squared_sums = np.where(valid, squares[ends] - squares[starts], np.nan)
+    return sums, squared_sums
+
+
+def moving_averages(values, windows=DEFAULT_WINDOWS):
+    """Simple moving averages for several window lengths.
+    :return: Dictionary of window length -> array aligned with values
+    """
+    sums, _ = _window_sums(values, windows)
+    return dict((window, row / window) for window, row in zip(windows, sums))
+
+
+def daily_returns(close):
+    """Simple returns between consecutive closes; the first element is NaN"""
+    close = np.asarray(close, dtype=np.float64)
+    returns = np.full(len(close), np.nan)
+    returns[1:] = close[1:] / close[:-1] - 1.0
+    return returns
+
+
+def rolling_volatility(returns, windows=DEFAULT_WINDOWS, annualize=TRADING_DAYS):
+    """Rolling sample standard deviation of returns for several window lengths.
+    :param returns: Daily returns
+    :param annualize: Periods per year to scale by, or None for per-period volatility
+    :return: Dictionary of window length -> array aligned with returns
+    """
+    sums, squared_sums = _window_sums(returns, windows)
+    scale = np.sqrt(annualize) if annualize else 1.0
+    result = {}
+    for window, total, squared in zip(windows, sums, squared_sums):
+        if window < 2:
+            result[window] = np.full(len(total), np.nan)
+            continue
+        variance = np.maximum((squared - total * total / window) / (window - 1), 0.0)
+        result[window] = np.sqrt(variance) * scale
+    return result
+
+
+def drawdown(close):
+    """Fall from the running peak, as a fraction (0 at a new high, -0.25 when 25% below it)"""
+    close = np.asarray(close, dtype=np.float64)
+    peaks = np.fmax.accumulate(close)
+    return close / peaks - 1.0
+
+
+def max_drawdown(close):
+    """Deepest drawdown of the series"""
+    return float(np.nanmin(drawdown(close))) if len(close) else 0.0
+
+
+def indicators(close, windows=DEFAULT_WINDOWS, annualize=TRADING_DAYS):
+    """Every indicator for one close price series.
+    :return: Dictionary with sma and volatility (by window), returns, drawdown and max_drawdown
+    """
+    returns = daily_returns(close)
+    falls = drawdown(close)
+    return {"sma": moving_averages(close, windows), "returns": returns,
+            "volatility": rolling_volatility(returns, windows, annualize), "drawdown": falls,
+            "max_drawdown": float(np.nanmin(falls)) if len(falls) else 0.0}
+
+
+def indicators_by_symbol(closes, windows=DEFAULT_WINDOWS, annualize=TRADING_DAYS):
+    """Indicators for many symbols and window lengths in one call.
+    :param closes: Dictionary of symbol -> close prices
+    :return: Dictionary of symbol -> indicators()
+    """
+    return dict((symbol, indicators(close, windows, annualize)) for symbol, close in closes.items())
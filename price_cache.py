@@ -0,0 +1,163 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Per-symbol columnar cache of a price history     #
+#             file such as AllStocks.json. The JSON is parsed  #
+#             once into one .npy file per symbol; later runs   #
+#             memory map only the symbol they need. The cache  #
+#             is rebuilt when the source file's mtime and      #
+#             content hash no longer match.                    #
+################################################################
+"""
+
+from array import array
+import hashlib
+import json
+import os
+
+import numpy as np
+
+import date_parser as dp
+import json_stream as js
+
+DATE_FORMAT = "%d-%b-%y"
+MANIFEST = "manifest.json"
+MISSING_VOLUME = -1
+HASH_BLOCK = 1 << 20
+
+# date is an epoch day, prices are NaN where the source has '-'
+PRICE_DTYPE = np.dtype([("date", np.int32), ("open", np.float64), ("high", np.float64), ("low", np.float64),
+                        ("close", np.float64), ("volume", np.int64)])
+_PRICE_FIELDS = (("open", "Open"), ("high", "High"), ("low", "Low"), ("close", "Close"))
+
+
+def cache_dir_for(source_file):
+    """Cache directory kept next to the source file"""
+    return source_file + ".cache"
+
+
+def file_hash(file_path):
+    """sha1 of the file contents"""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _price(value):
+    return float("nan") if value == js.MISSING or value is None else float(value)
+
+
+def _volume(value):
+    return MISSING_VOLUME if value == js.MISSING or value is None else int(value)
+
+
+def read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST)) as manifest:
+            return json.load(manifest)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_manifest(cache_dir, manifest):
+    """Write the manifest last and atomically, so a half built cache is never picked up"""
+    temp_file = os.path.join(cache_dir, MANIFEST + ".tmp")
+    with open(temp_file, "w") as f:
+        json.dump(manifest, f)
+    os.replace(temp_file, os.path.join(cache_dir, MANIFEST))
+
+
+def build_cache(source_file, cache_dir=None, date_format=DATE_FORMAT):
+    """Convert the price history into one columnar .npy file per symbol.
+    :param source_file: JSON array of price records
+    :param cache_dir: Cache directory, defaults to cache_dir_for(source_file)
+    :param date_format: strptime format of the Date field
+    :return: The manifest dictionary
+    """
+    cache_dir = cache_dir or cache_dir_for(source_file)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    old_manifest = read_manifest(cache_dir)
+    if old_manifest is not None:
+        os.remove(os.path.join(cache_dir, MANIFEST))
+
+    stat = os.stat(source_file)
+    columns = {}
+    for record in js.iter_json_array(source_file):
+        symbol = record["Symbol"]
+        symbol_columns = columns.get(symbol)
+        if symbol_columns is None:
+            symbol_columns = columns[symbol] = dict((name, array(PRICE_DTYPE[name].char))
+                                                    for name in PRICE_DTYPE.names)
+        symbol_columns["date"].append(dp.parse_epoch_day(record["Date"], date_format))
+        for name, key in _PRICE_FIELDS:
+            symbol_columns[name].append(_price(record.get(key)))
+        symbol_columns["volume"].append(_volume(record.get("Volume")))
+
+    symbols = {}
+    for number, (symbol, symbol_columns) in enumerate(sorted(columns.items())):
+        prices = np.empty(len(symbol_columns["date"]), dtype=PRICE_DTYPE)
+        for name in PRICE_DTYPE.names:
+            prices[name] = np.frombuffer(symbol_columns[name], dtype=PRICE_DTYPE[name])
+        file_name = "{0:05d}.npy".format(number)
+        np.save(os.path.join(cache_dir, file_name), prices)
+        symbols[symbol] = {"file": file_name, "rows": len(prices)}
+
+    if old_manifest is not None:
+        kept = set(entry["file"] for entry in symbols.values())
+        for entry in old_manifest.get("symbols", {}).values():
+            if entry["file"] not in kept and os.path.exists(os.path.join(cache_dir, entry["file"])):
+                os.remove(os.path.join(cache_dir, entry["file"]))
+
+    manifest = {"source": os.path.abspath(source_file), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                "sha1": file_hash(source_file), "date_format": date_format, "symbols": symbols}
+    write_manifest(cache_dir, manifest)
+    return manifest
+
+
+def open_cache(source_file, cache_dir=None, date_format=DATE_FORMAT):
+    """Manifest of an up to date cache, building or rebuilding it when needed.
+    A changed mtime alone only costs a hash of the source; the cache is rebuilt when the contents changed.
+    :return: The manifest dictionary
+    """
+    cache_dir = cache_dir or cache_dir_for(source_file)
+    manifest = read_manifest(cache_dir)
+    if manifest is None or manifest.get("date_format") != date_format:
+        return build_cache(source_file, cache_dir, date_format)
+    stat = os.stat(source_file)
+    if manifest["mtime_ns"] == stat.st_mtime_ns and manifest["size"] == stat.st_size:
+        return manifest
+    if manifest["size"] == stat.st_size and manifest["sha1"] == file_hash(source_file):
+        manifest["mtime_ns"] = stat.st_mtime_ns
+        write_manifest(cache_dir, manifest)
+        return manifest
+    return build_cache(source_file, cache_dir, date_format)
+
+
+def load_entry(cache_dir, entry):
+    """Memory map one symbol of a cache already validated by open_cache, without reading the manifest again.
+    :param cache_dir: Cache directory
+    :param entry: The symbol's entry in the manifest's "symbols", or None
+    :return: Read-only structured array with PRICE_DTYPE fields, in source order; empty when entry is None
+    """
+    if entry is None or entry["rows"] == 0:
+        return np.empty(0, dtype=PRICE_DTYPE)
+    return np.load(os.path.join(cache_dir, entry["file"]), mmap_mode="r")
+
+
+def load_symbol(source_file, symbol, cache_dir=None, date_format=DATE_FORMAT):
+    """Memory map the price history of one symbol.
+    :param source_file: JSON array of price records
+    :param symbol: Stock symbol
+    :return: Read-only structured array with PRICE_DTYPE fields, in source order; empty for unknown symbols
+    """
+    cache_dir = cache_dir or cache_dir_for(source_file)
+    return load_entry(cache_dir, open_cache(source_file, cache_dir, date_format)["symbols"].get(symbol))
+
+
+def symbols(source_file, cache_dir=None, date_format=DATE_FORMAT):
+    """Symbols present in the price history"""
+    return sorted(open_cache(source_file, cache_dir, date_format)["symbols"])
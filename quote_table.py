@@ -0,0 +1,134 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Shared quote table keyed by symbol. Lots keep    #
+#             the price they were loaded with; a quote set     #
+#             here reprices every lot of its symbol when an    #
+#             investor is revalued. Quotes live in a bounded   #
+#             LRU with TTL based staleness; quotes not yet     #
+#             applied are kept out of the LRU until they are.  #
+################################################################
+"""
+
+from collections import OrderedDict
+from itertools import chain
+import sys
+import time
+
+DEFAULT_MAXSIZE = 100000
+DEFAULT_TTL = 15 * 60.0
+
+
+class Quote(object):
+    __slots__ = ("symbol", "price", "updated_at")
+
+    def __init__(self, symbol, price, updated_at):
+        """Current price of one symbol"""
+        self.symbol = symbol
+        self.price = price
+        self.updated_at = updated_at
+
+    def __repr__(self):
+        return "Quote({0!r}, {1!r})".format(self.symbol, self.price)
+
+
+class QuoteTable(object):
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL, clock=time.monotonic):
+        """Create a quote table.
+        :param maxsize: Number of recently used quotes kept alive by the table itself
+        :param ttl: Seconds after which a quote is considered stale and no longer priced
+        :param clock: Time source, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # Applied quotes, least recently used first; only these are evicted
+        self._recent = OrderedDict()
+        # Quotes updated since they were last applied, never evicted
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._recent) + len(self._pending)
+
+    def __contains__(self, symbol):
+        return symbol in self._pending or symbol in self._recent
+
+    def _evict(self):
+        while len(self) > self.maxsize and self._recent:
+            self._recent.popitem(last=False)
+
+    def _quotes(self):
+        return chain(self._recent.items(), self._pending.items())
+
+    def get(self, symbol):
+        """Quote for symbol, or None when the symbol has not been quoted or was evicted"""
+        quote = self._pending.get(symbol)
+        if quote is None:
+            quote = self._recent.get(symbol)
+            if quote is None:
+                self.misses += 1
+                return None
+            self._recent.move_to_end(symbol)
+        self.hits += 1
+        return quote
+
+    def update(self, symbol, price):
+        """Set the price of symbol. The quote stays pending until applied.
+        :return: The Quote of symbol
+        """
+        price = float(price)
+        quote = self._pending.get(symbol) or self._recent.pop(symbol, None)
+        if quote is None:
+            quote = Quote(sys.intern(symbol), price, self._clock())
+        else:
+            quote.price = price
+            quote.updated_at = self._clock()
+        self._pending[quote.symbol] = quote
+        self._evict()
+        return quote
+
+    def update_many(self, prices):
+        """Apply a dictionary of symbol -> price"""
+        for symbol, price in prices.items():
+            self.update(symbol, price)
+
+    def pending(self):
+        """Symbols updated since their quotes were last applied"""
+        return list(self._pending)
+
+    def applied(self, symbols):
+        """Mark the quotes of symbols as applied to every lot, making them evictable again"""
+        for symbol in symbols:
+            quote = self._pending.pop(symbol, None)
+            if quote is not None:
+                self._recent[symbol] = quote
+        self._evict()
+
+    def prices(self, symbols):
+        """Quoted price of every symbol in symbols that has a fresh quote.
+        Stale quotes are skipped, so their lots keep the last price applied to them.
+        :return: Dictionary of symbol -> price
+        """
+        oldest = self._clock() - self.ttl
+        quoted = {}
+        for symbol in symbols:
+            quote = self.get(symbol)
+            if quote is not None and quote.updated_at >= oldest:
+                quoted[symbol] = quote.price
+        return quoted
+
+    def is_stale(self, symbol):
+        """True when the symbol is unknown or its quote is older than the TTL"""
+        quote = self._pending.get(symbol) or self._recent.get(symbol)
+        return quote is None or self._clock() - quote.updated_at > self.ttl
+
+    def stale_symbols(self):
+        """Symbols whose quotes are older than the TTL"""
+        now = self._clock()
+        return [symbol for symbol, quote in self._quotes() if now - quote.updated_at > self.ttl]
+
+
+DEFAULT_QUOTES = QuoteTable()
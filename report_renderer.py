@@ -0,0 +1,130 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Buffered investor report renderer. Row templates #
+#             are compiled once, each investor block is built  #
+#             in memory and large chunks are flushed to file.  #
+#             Blocks can also be formatted straight from       #
+#             numeric columns, one column at a time.           #
+################################################################
+"""
+
+RULE = "\n-------------------------------------------------------------------------------------"
+
+INVESTOR_HEADER = ("##################################################"
+                   "\n#### Investment Report for {0}"
+                   "\n#### Address:- {1}"
+                   "\n#### Phone:- {2}"
+                   "\n##################################################").format
+STOCK_HEADER = RULE + '\n{:<16}{:<16}{:<16}{:<16}'.format('STOCK', '#SHARES', 'EARNINGS/LOSS', 'YEARLY RATE') + RULE
+BOND_HEADER = ("\n" + RULE + '\n{:<16}{:<16}{:<16}{:<16}{:<16}{:<16}'.format('BOND', '#QTY', 'EARNINGS/LOSS',
+                                                                             'YEARLY RATE', 'COUPON', 'YIELD') + RULE)
+INVESTOR_FOOTER = "\n\n\n\n"
+
+STOCK_ROW = "\n{:<16}{:<16}{:<16}{:<16}".format
+BOND_ROW = "\n{:<16}{:<16}{:<16}{:<16}{:<16}{:<16}".format
+
+DEFAULT_FLUSH_SIZE = 1 << 20
+
+
+def format_loss_gain(value):
+    """Loss or gain as it is printed in the report"""
+    return str(round(value, 2))
+
+
+def format_annual_percent_yield_loss(value):
+    """Annual percent yield or loss as it is printed in the report"""
+    return str(round(value, 2)) + "%"
+
+
+def render_investor_block(investor_obj):
+    """Render one investor's report block as a single string.
+    :param investor_obj: Investor whose lots provide report_values()
+    """
+    parts = [INVESTOR_HEADER(investor_obj._first_name, investor_obj._address, investor_obj._phone_number),
+             STOCK_HEADER]
+    parts.extend(STOCK_ROW(*stock.report_values()) for stock in investor_obj._list_of_stocks)
+    parts.append(BOND_HEADER)
+    parts.extend(BOND_ROW(*bond.report_values()) for bond in investor_obj._list_of_bonds)
+    parts.append(INVESTOR_FOOTER)
+    return "".join(parts)
+
+
+def _as_list(column):
+    """NumPy arrays convert to Python scalars in one call; other sequences pass through"""
+    return column.tolist() if hasattr(column, "tolist") else column
+
+
+def _format_column(values, suffix=""):
+    """Format a column of results the way format_loss_gain does, with an optional suffix"""
+    return [str(round(value, 2)) + suffix for value in _as_list(values)]
+
+
+def render_columns_block(first_name, address, phone_number, stock_columns, bond_columns=None):
+    """Render one investor's report block straight from value columns.
+    Each column is converted and formatted in one pass instead of one report_values() call per lot.
+    :param stock_columns: (symbols, shares, loss_gain, yearly_rate) arrays or sequences
+    :param bond_columns: (symbols, quantity, loss_gain, yearly_rate, coupon, yield) arrays or sequences
+    """
+    parts = [INVESTOR_HEADER(first_name, address, phone_number), STOCK_HEADER]
+    if stock_columns is not None:
+        symbols, shares, loss_gain, yearly = stock_columns
+        parts.extend(map(STOCK_ROW, _as_list(symbols), map(str, _as_list(shares)), _format_column(loss_gain),
+                         _format_column(yearly, "%")))
+    parts.append(BOND_HEADER)
+    if bond_columns is not None:
+        symbols, shares, loss_gain, yearly, coupon, yld = bond_columns
+        parts.extend(map(BOND_ROW, _as_list(symbols), map(str, _as_list(shares)), _format_column(loss_gain),
+                         _format_column(yearly, "%"), map(str, _as_list(coupon)), map(str, _as_list(yld))))
+    parts.append(INVESTOR_FOOTER)
+    return "".join(parts)
+
+
+def portfolio_columns(portfolio, as_of):
+    """(symbols, shares, loss_gain, yearly_rate) columns of a StockCalculator.Portfolio for render_columns_block.
+    Raises ValueError, as building the lots would, when a lot was not bought before as_of.
+    """
+    if len(portfolio) and (portfolio.held_days(as_of) <= 0).any():
+        raise ValueError("Purchase Date should be prior to today")
+    return (portfolio.symbols, portfolio.shares, portfolio.loss_gain(), portfolio.annual_percent_yield_loss(as_of))
+
+
+class ReportRenderer(object):
+    def __init__(self, report_file, flush_size=DEFAULT_FLUSH_SIZE):
+        """Collect rendered blocks in a buffer and write them to report_file in large chunks.
+        :param report_file: Open text file
+        :param flush_size: Number of buffered characters that triggers a write
+        """
+        self._report_file = report_file
+        self._flush_size = flush_size
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, text):
+        """Buffer text; file-like so existing report code can target the renderer"""
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self._flush_size:
+            self.flush()
+
+    def render_investor(self, investor_obj):
+        """Render and buffer one investor's block"""
+        self.write(render_investor_block(investor_obj))
+
+    def render_columns(self, first_name, address, phone_number, stock_columns, bond_columns=None):
+        """Render and buffer one investor's block from value columns"""
+        self.write(render_columns_block(first_name, address, phone_number, stock_columns, bond_columns))
+
+    def flush(self):
+        """Write everything buffered so far as one chunk"""
+        if self._buffer:
+            self._report_file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
@@ -0,0 +1,152 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Schema for the investor attribute dictionaries   #
+#             of weeks 4 and 5. The schema is compiled once    #
+#             into per-field checks; each investor dictionary  #
+#             is then validated in one pass over its fields    #
+#             and every problem is collected, not just the     #
+#             first one.                                       #
+################################################################
+"""
+
+import date_parser as dp
+
+# Field kind for date strings, checked by parsing them with the schema's date format
+DATE = "date"
+
+NOT_A_DICT = "not a dictionary"
+MISSING_KEY = "missing key"
+NOT_A_LIST = "not a list"
+EMPTY = "empty"
+LENGTH = "length mismatch"
+TYPE = "wrong type"
+BAD_DATE = "bad date"
+
+
+class ValidationError(object):
+    __slots__ = ("field", "kind", "index", "detail")
+
+    def __init__(self, field, kind, index=None, detail=None):
+        """One problem found in an investor dictionary
+        :param field: Key of the offending list
+        :param kind: One of the error kind constants
+        :param index: Position of the offending element, when the problem is an element
+        :param detail: Offending value or extra information
+        """
+        self.field = field
+        self.kind = kind
+        self.index = index
+        self.detail = detail
+
+    def __str__(self):
+        where = self.field if self.index is None else "{0}[{1}]".format(self.field, self.index)
+        return "{0}: {1}".format(where, self.kind) + ("" if self.detail is None else " ({0!r})".format(self.detail))
+
+    def __repr__(self):
+        return "ValidationError({0!r}, {1!r}, {2!r}, {3!r})".format(self.field, self.kind, self.index, self.detail)
+
+
+class ValidationResult(object):
+    __slots__ = ("investor", "errors")
+
+    def __init__(self, investor, errors):
+        self.investor = investor
+        self.errors = errors
+
+    @property
+    def valid(self):
+        return not self.errors
+
+    def __bool__(self):
+        return not self.errors
+
+    def kinds(self):
+        """Set of error kinds found"""
+        return set(error.kind for error in self.errors)
+
+    def __str__(self):
+        if not self.errors:
+            return "{0}: valid".format(self.investor)
+        return "{0}: {1} error(s)\n  ".format(self.investor, len(self.errors)) + "\n  ".join(
+            str(error) for error in self.errors)
+
+
+def _type_check(expected):
+    def check(field, values, errors):
+        for index, value in enumerate(values):
+            if not isinstance(value, expected):
+                errors.append(ValidationError(field, TYPE, index, value))
+    return check
+
+
+def _date_check(date_format):
+    def check(field, values, errors):
+        for index, value in enumerate(values):
+            try:
+                dp.parse_epoch_day(value, date_format)
+            except (TypeError, ValueError, AttributeError):
+                errors.append(ValidationError(field, BAD_DATE, index, value))
+    return check
+
+
+class InvestorSchema(object):
+    def __init__(self, fields, date_format=dp.DATE_FORMAT):
+        """Compile a schema.
+        :param fields: (key, kind) pairs; kind is a type or tuple of types, or DATE for date strings
+        :param date_format: strptime format of the DATE fields
+        """
+        self.fields = list(fields)
+        self.date_format = date_format
+        self._checks = [(key, _date_check(date_format) if kind == DATE else _type_check(kind))
+                        for key, kind in self.fields]
+
+    def keys(self):
+        return [key for key, _ in self.fields]
+
+    def validate(self, investor_attributes, investor=None):
+        """Check keys, list lengths and element types of one investor dictionary in a single pass.
+        :param investor_attributes: Dictionary of aligned lists
+        :param investor: Name or id reported in the result
+        :return: ValidationResult with every problem found
+        """
+        errors = []
+        if not isinstance(investor_attributes, dict):
+            errors.append(ValidationError(None, NOT_A_DICT, detail=type(investor_attributes).__name__))
+            return ValidationResult(investor, errors)
+        expected_length = None
+        for key, check in self._checks:
+            values = investor_attributes.get(key)
+            if values is None:
+                errors.append(ValidationError(key, MISSING_KEY))
+                continue
+            if not isinstance(values, (list, tuple)):
+                errors.append(ValidationError(key, NOT_A_LIST, detail=type(values).__name__))
+                continue
+            if expected_length is None:
+                expected_length = len(values)
+                if expected_length == 0:
+                    errors.append(ValidationError(key, EMPTY))
+            elif len(values) != expected_length:
+                errors.append(ValidationError(key, LENGTH, detail="{0} != {1}".format(len(values), expected_length)))
+            check(key, values, errors)
+        return ValidationResult(investor, errors)
+
+    def validate_many(self, data_dict, extract=None):
+        """Validate every investor of a stock_data_dict or data_dict.
+        :param data_dict: Dictionary of investor -> attributes
+        :param extract: Optional function returning the attribute dictionary from each value,
+                        e.g. lambda investor: investor['investor_data']['Stocks']
+        :return: Dictionary of investor -> ValidationResult
+        """
+        results = {}
+        for investor, value in data_dict.items():
+            if extract is not None:
+                try:
+                    value = extract(value)
+                except (KeyError, TypeError, IndexError) as e:
+                    results[investor] = ValidationResult(investor, [ValidationError(None, MISSING_KEY, detail=str(e))])
+                    continue
+            results[investor] = self.validate(value, investor)
+        return results
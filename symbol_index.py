@@ -0,0 +1,138 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Inverted index from symbol to the investors and  #
+#             lots holding it. Kept up to date by              #
+#             Investor.add_stock/add_bond so holder lookups    #
+#             and exposure totals never walk every investor,   #
+#             and a quote update revalues only its holders.    #
+#             Postings point at a row of the investor's lot    #
+#             container, so compact lots are read in place.    #
+################################################################
+"""
+
+from lot_store import LotArray
+
+
+def _lot_value(lots, row, name):
+    """Attribute of the lot at row of an investor's list or LotArray"""
+    if isinstance(lots, LotArray):
+        return lots.value(row, name)
+    return getattr(lots[row], name)
+
+
+class SymbolExposure(object):
+    __slots__ = ("symbol", "postings", "shares", "cost")
+
+    def __init__(self, symbol):
+        """Postings and running totals for one symbol"""
+        self.symbol = symbol
+        self.postings = []
+        self.shares = 0
+        self.cost = 0.0
+
+    @property
+    def market_value(self):
+        """Value of every lot at its own current price"""
+        return sum(_lot_value(lots, row, "_shares") * _lot_value(lots, row, "_current_price")
+                   for _, lots, row in self.postings)
+
+    @property
+    def loss_gain(self):
+        return self.market_value - self.cost
+
+
+class SymbolIndex(object):
+    def __init__(self):
+        """Create an empty symbol index"""
+        self._symbols = {}
+
+    def add(self, investor_obj, lots, row):
+        """Record that investor_obj holds the lot at row of lots.
+        :param lots: The investor's list or LotArray of stocks or bonds
+        :param row: Position of the lot in lots
+        """
+        symbol = _lot_value(lots, row, "_stock_symbol")
+        shares = _lot_value(lots, row, "_shares")
+        exposure = self._symbols.get(symbol)
+        if exposure is None:
+            exposure = self._symbols[symbol] = SymbolExposure(symbol)
+        exposure.postings.append((investor_obj, lots, row))
+        exposure.shares += shares
+        exposure.cost += _lot_value(lots, row, "_purchase_price") * shares
+
+    def __contains__(self, symbol):
+        return symbol in self._symbols
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def symbols(self):
+        return list(self._symbols)
+
+    def postings(self, symbol):
+        """(investor, lot) pairs holding symbol, in the order they were added; compact lots are snapshots"""
+        exposure = self._symbols.get(symbol)
+        return [(investor_obj, lots[row]) for investor_obj, lots, row in exposure.postings] if exposure else []
+
+    def holders(self, symbol):
+        """Investors holding symbol, each listed once"""
+        exposure = self._symbols.get(symbol)
+        if exposure is None:
+            return []
+        seen = {}
+        for investor_obj, _, _ in exposure.postings:
+            seen.setdefault(id(investor_obj), investor_obj)
+        return list(seen.values())
+
+    def holdings_by_investor(self, symbol):
+        """Shares of symbol held per investor_id"""
+        exposure = self._symbols.get(symbol)
+        shares = {}
+        for investor_obj, lots, row in exposure.postings if exposure else ():
+            shares[investor_obj._investor_id] = (shares.get(investor_obj._investor_id, 0) +
+                                                 _lot_value(lots, row, "_shares"))
+        return shares
+
+    def revalue(self, quotes, prices=None):
+        """Apply the pending quotes to every holder of their symbols, revaluing each holder once.
+        :param quotes: QuoteTable the investors' lots are priced from
+        :param prices: Optional dictionary of symbol -> current price, stored in quotes first
+        :return: Dictionary of investor_id -> total loss or gain of every investor revalued
+        """
+        if prices:
+            quotes.update_many(prices)
+        symbols = quotes.pending()
+        totals = {}
+        for symbol in symbols:
+            for investor_obj in self.holders(symbol):
+                if investor_obj._investor_id not in totals:
+                    totals[investor_obj._investor_id] = investor_obj.revalue()
+        quotes.applied(symbols)
+        return totals
+
+    def exposure(self, symbol):
+        """Totals for symbol: shares, cost, market_value and loss_gain"""
+        exposure = self._symbols.get(symbol)
+        if exposure is None:
+            return {"shares": 0, "cost": 0.0, "market_value": 0.0, "loss_gain": 0.0}
+        return {"shares": exposure.shares, "cost": exposure.cost, "market_value": exposure.market_value,
+                "loss_gain": exposure.loss_gain}
+
+
+def holders_report(index, symbols):
+    """Holders and exposure of each symbol as report lines.
+    :param index: SymbolIndex built while loading the investors
+    :param symbols: Symbols to look up
+    :return: Report text
+    """
+    lines = []
+    for symbol in symbols:
+        exposure = index.exposure(symbol)
+        shares = index.holdings_by_investor(symbol)
+        holders = ", ".join("{0} ({1})".format(investor_obj._first_name, shares[investor_obj._investor_id])
+                            for investor_obj in index.holders(symbol))
+        lines.append("{0}: {1} shares, market value {2:.2f}, loss/gain {3:.2f}; holders: {4}".format(
+            symbol, exposure["shares"], exposure["market_value"], exposure["loss_gain"], holders or "none"))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,136 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Deterministic generator for synthetic holdings   #
+#             files (Lesson6_Data_Stocks.csv,                  #
+#             Lesson6_Data_Bonds.csv) and price history        #
+#             (AllStocks.json) of any size. The same seed and  #
+#             size always produce byte-identical files.        #
+################################################################
+"""
+
+from datetime import date, timedelta
+import os
+import random
+
+import holdings_loader as hl
+
+SYMBOLS = ["GOOGL", "MSFT", "RDS-A", "AIG", "FB", "M", "F", "IBM"]
+BOND_SYMBOLS = ["GT2:GOV", "GT5:GOV", "GT10:GOV", "GT30:GOV"]
+PRICE_FILE = "AllStocks.json"
+MISSING_OPEN_RATE = 0.05
+WRITE_BATCH = 10000
+
+
+def _between(rnd, low, high):
+    """Integer in [low, high]; cheaper than Random.randint for millions of rows"""
+    return low + int(rnd.random() * (high - low + 1))
+
+
+def _date_text(rnd):
+    return "{0}/{1}/{2}".format(_between(rnd, 1, 12), _between(rnd, 1, 28), _between(rnd, 2010, 2017))
+
+
+def _write_lines(file_path, header, lines):
+    """Write a header and an iterable of lines in batches"""
+    with open(file_path, "w") as f:
+        f.write(header + "\n")
+        batch = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= WRITE_BATCH:
+                f.write("\n".join(batch) + "\n")
+                batch = []
+        if batch:
+            f.write("\n".join(batch) + "\n")
+
+
+def investor_rows(number_of_investors):
+    """(investor_id, first_name, address, phone_number) tuples for synthetic investors"""
+    return [(investor_id, "Investor{0}".format(investor_id), "{0} Synthetic Avenue, CO 80112".format(investor_id),
+             "303-303-{0:04d}".format(investor_id % 10000)) for investor_id in range(1, number_of_investors + 1)]
+
+
+def write_stock_csv(file_path, rows, investors=None, seed=7):
+    """Write a stock holdings file in the Lesson6_Data_Stocks.csv layout.
+    :param rows: Number of lots
+    :param investors: Number of investors to spread the lots over with an INVESTOR_ID column;
+                      None writes the original layout, shared by every investor
+    """
+    rnd = random.Random(seed)
+    columns = list(hl.STOCK_COLUMNS) + ([hl.INVESTOR_ID_COLUMN] if investors else [])
+
+    def lines():
+        for index in range(rows):
+            line = "{0},{1},{2:.2f},{3:.2f},{4}".format(
+                SYMBOLS[_between(rnd, 0, len(SYMBOLS) - 1)], _between(rnd, 1, 500), rnd.uniform(10, 900),
+                rnd.uniform(10, 900), _date_text(rnd))
+            yield line + ",{0}".format(index % investors + 1) if investors else line
+
+    _write_lines(file_path, ",".join(columns), lines())
+
+
+def write_bond_csv(file_path, rows, investors=None, seed=11):
+    """Write a bond holdings file in the Lesson6_Data_Bonds.csv layout.
+    :param rows: Number of lots
+    :param investors: Number of investors to spread the lots over, or None for the original layout
+    """
+    rnd = random.Random(seed)
+    columns = list(hl.BOND_COLUMNS) + ([hl.INVESTOR_ID_COLUMN] if investors else [])
+
+    def lines():
+        for index in range(rows):
+            line = "{0},{1},{2:.2f},{3:.2f},{4},{5:.2f},{6:.2f}%".format(
+                BOND_SYMBOLS[_between(rnd, 0, len(BOND_SYMBOLS) - 1)], _between(rnd, 1, 500), rnd.uniform(95, 105),
+                rnd.uniform(95, 105), _date_text(rnd), rnd.uniform(0.5, 4), rnd.uniform(0.5, 4))
+            yield line + ",{0}".format(index % investors + 1) if investors else line
+
+    _write_lines(file_path, ",".join(columns), lines())
+
+
+def write_price_json(file_path, rows, seed=13):
+    """Write a price history in the AllStocks.json layout: one record per symbol per day,
+    with about MISSING_OPEN_RATE of the Open prices set to '-'.
+    :param rows: Number of records
+    """
+    rnd = random.Random(seed)
+    day = date(2010, 1, 1)
+    record = ('{{\n  "Symbol": "{0}",\n  "Date": "{1}",\n  "Open": {2},\n  "High": {3:.2f},\n  "Low": {4:.2f},\n'
+              '  "Close": {5:.2f},\n  "Volume": {6}\n }}')
+    day_text = day.strftime("%d-%b-%y")
+    with open(file_path, "w") as f:
+        f.write("[")
+        separator = "\n "
+        batch = []
+        for index in range(rows):
+            if index and index % len(SYMBOLS) == 0:
+                day += timedelta(days=1)
+                day_text = day.strftime("%d-%b-%y")
+            close = rnd.uniform(10, 900)
+            open_price = '"-"' if rnd.random() < MISSING_OPEN_RATE else "{0:.2f}".format(close + rnd.uniform(-5, 5))
+            batch.append(record.format(SYMBOLS[index % len(SYMBOLS)], day_text, open_price, close + 2, close - 2,
+                                       close, _between(rnd, 1000, 90000)))
+            if len(batch) >= WRITE_BATCH:
+                f.write(separator + ",\n ".join(batch))
+                separator = ",\n "
+                batch = []
+        if batch:
+            f.write(separator + ",\n ".join(batch))
+        f.write("\n]")
+
+
+def generate(directory, rows, investors=None, seed=7):
+    """Write all three input files for one size into directory.
+    :param rows: Number of stock lots and price records; bonds get a tenth as many
+    :param investors: Number of investors to spread the holdings over, or None for the original layout
+    :return: Dictionary with the stock, bond and price file paths
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    paths = {"stock": os.path.join(directory, hl.STOCK_FILE), "bond": os.path.join(directory, hl.BOND_FILE),
+             "price": os.path.join(directory, PRICE_FILE)}
+    write_stock_csv(paths["stock"], rows, investors, seed)
+    write_bond_csv(paths["bond"], max(1, rows // 10), investors, seed + 1)
+    write_price_json(paths["price"], rows, seed + 2)
+    return paths
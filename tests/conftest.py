@@ -0,0 +1,81 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Shared fixtures for the test suite. Reports are  #
+#             compared with golden files produced by the       #
+#             original week 6/7 scripts at a fixed valuation   #
+#             date, so every run uses that same date.          #
+################################################################
+"""
+
+import contextlib
+import datetime as _datetime
+import io
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+AS_OF = _datetime.date(2026, 10, 18)
+AS_OF_TEXT = AS_OF.strftime("%m/%d/%Y")
+
+
+class FixedDate(_datetime.date):
+    @classmethod
+    def today(cls):
+        return cls(AS_OF.year, AS_OF.month, AS_OF.day)
+
+
+class FixedDateTime(_datetime.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(AS_OF.year, AS_OF.month, AS_OF.day, 9, 30)
+
+
+def copy_dataset(name, target):
+    """Copy the holdings CSVs of a tests/data dataset into target"""
+    for file_name in ("Lesson6_Data_Stocks.csv", "Lesson6_Data_Bonds.csv"):
+        shutil.copy(os.path.join(DATA_DIR, name, file_name), os.path.join(str(target), file_name))
+
+
+def golden_report(name, week):
+    with open(os.path.join(DATA_DIR, name, "{0}_report.txt".format(week))) as f:
+        return f.read()
+
+
+def sorted_lines(text):
+    """Week 7 reads lots back keyed by random purchase ids, so its line order is not stable"""
+    return sorted(text.splitlines())
+
+
+@pytest.fixture
+def fixed_clock(monkeypatch):
+    """Pin datetime.now() in the report scripts to AS_OF"""
+    import nittala_week_6 as w6
+    import week_7_nittala as w7
+
+    for module in (w6, w7):
+        monkeypatch.setattr(module, "datetime", FixedDateTime)
+    monkeypatch.setattr(w7.Stock, "as_of_date", None)
+    return AS_OF
+
+
+@pytest.fixture
+def run_report(tmp_path, monkeypatch, fixed_clock):
+    """Run a report script's main() on a dataset inside a temp directory and return the report text"""
+    monkeypatch.chdir(tmp_path)
+
+    def run(module, dataset, **kwargs):
+        copy_dataset(dataset, tmp_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.main(**kwargs)
+        with open(os.path.join(str(tmp_path), "investor_report.txt")) as f:
+            return f.read()
+    return run
@@ -0,0 +1,146 @@
+import os
+import sqlite3
+
+import pytest
+
+import async_pipeline
+import holdings_loader as hl
+import week_7_nittala as w7
+from conftest import AS_OF_TEXT, golden_report, sorted_lines
+
+
+def investors():
+    return [w7.Investor(1, "Bob", "71 Pilgrim Avenue Chevy Chase, MD 20815", "303-303-3033"),
+            w7.Investor(2, "Carl", "271 East Orchard Ave, CO 80112", "720-909-1234")]
+
+
+def read(file_name):
+    with open(file_name) as f:
+        return f.read()
+
+
+def table_rows(db_file):
+    conn = sqlite3.connect(db_file)
+    try:
+        return dict((table, sorted(conn.execute("SELECT * FROM " + table))) for table in ("investor", "stock", "bond"))
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def pipeline_dir(run_report):
+    """Temp directory holding the sample holdings and the report of one successful pipeline run"""
+    run_report(w7, "sample", pipeline=True)
+    w7.Stock.set_as_of_date(AS_OF_TEXT)
+    return os.getcwd()
+
+
+@pytest.mark.parametrize("dataset", ["sample", "dupes"])
+def test_pipeline_report_matches_original(run_report, dataset):
+    assert sorted_lines(run_report(w7, dataset, pipeline=True)) == sorted_lines(golden_report(dataset, "week7"))
+
+
+def test_database_holds_the_rendered_lots(pipeline_dir):
+    conn = sqlite3.connect("investments.db")
+    try:
+        reloaded = "".join(w7.rr.render_investor_block(investor_obj)
+                           for investor_obj in w7.load_investors_from_db(conn))
+    finally:
+        conn.close()
+    assert sorted_lines(reloaded) == sorted_lines(read("investor_report.txt"))
+
+
+def grouped_holdings(number_of_investors, stock_file, bond_file):
+    """Holdings files with an INVESTOR_ID column, each investor's rows together in ascending order"""
+    stock_line = "GOOGL,125,772.88,941.53,8/1/2015,{0}\n"
+    bond_line = "GT2:GOV,200,100.02,100.05,8/1/2017,1.38,1.35%,{0}\n"
+    with open(stock_file, "w") as stocks, open(bond_file, "w") as bonds:
+        stocks.write(",".join(hl.STOCK_COLUMNS + (hl.INVESTOR_ID_COLUMN,)) + "\n")
+        bonds.write(",".join(hl.BOND_COLUMNS + (hl.INVESTOR_ID_COLUMN,)) + "\n")
+        for investor_id in range(1, number_of_investors + 1):
+            stocks.write(stock_line.format(investor_id) * 2)
+            bonds.write(bond_line.format(investor_id))
+    return [w7.Investor(investor_id, "Investor{0}".format(investor_id), "Address", "555")
+            for investor_id in range(1, number_of_investors + 1)]
+
+
+def test_rows_are_built_when_the_report_is_rendered(pipeline_dir, monkeypatch):
+    render = async_pipeline.rr.render_investor_block
+
+    def reprice_then_render(investor_obj):
+        for lot in investor_obj._list_of_stocks:
+            lot.current_price = 1.0
+        return render(investor_obj)
+    monkeypatch.setattr(async_pipeline.rr, "render_investor_block", reprice_then_render)
+    stats = async_pipeline.run_pipeline(investors(), "investments.db", "investor_report.txt", w7.stock_from_values,
+                                        w7.bond_from_values, batch_size=3)
+    assert set(row[4] for row in table_rows("investments.db")["stock"]) == {1.0}
+    assert stats.rows["db_write"] == 2 + stats.rows["parse"]
+    test_database_holds_the_rendered_lots(pipeline_dir)
+
+
+def test_grouped_investors_render_before_parsing_ends(pipeline_dir, monkeypatch):
+    investors_list = grouped_holdings(20, "grouped_stocks.csv", "grouped_bonds.csv")
+    events = []
+    render = async_pipeline.rr.render_investor_block
+
+    def recorded_render(investor_obj):
+        events.append(("render", investor_obj._investor_id))
+        return render(investor_obj)
+
+    def recorded_stock(values):
+        events.append(("parse", None))
+        return w7.stock_from_values(values)
+    monkeypatch.setattr(async_pipeline.rr, "render_investor_block", recorded_render)
+    monkeypatch.setattr(async_pipeline, "PARSE_BATCH_SIZE", 1)
+    stats = async_pipeline.run_pipeline(investors_list, "investments.db", "grouped_report.txt", recorded_stock,
+                                        w7.bond_from_values, "grouped_stocks.csv", "grouped_bonds.csv",
+                                        queue_size=1, grouped=True)
+    kinds = [kind for kind, _ in events]
+    assert kinds.index("render") < len(kinds) - 1 - kinds[::-1].index("parse")
+    assert [investor_id for kind, investor_id in events if kind == "render"] == list(range(1, 21))
+    assert stats.rows["parse"] == 60 and stats.rows["render"] == 20
+    grouped_report = read("grouped_report.txt")
+    async_pipeline.run_pipeline(grouped_holdings(20, "grouped_stocks.csv", "grouped_bonds.csv"), "investments.db",
+                                "ungrouped_report.txt", w7.stock_from_values, w7.bond_from_values,
+                                "grouped_stocks.csv", "grouped_bonds.csv")
+    assert grouped_report == read("ungrouped_report.txt")
+    assert len(table_rows("investments.db")["stock"]) == 40
+
+
+def test_grouped_rows_out_of_order_are_rejected(pipeline_dir):
+    before_rows = table_rows("investments.db")
+    investors_list = grouped_holdings(3, "grouped_stocks.csv", "grouped_bonds.csv")
+    with open("grouped_stocks.csv", "a") as stocks:
+        stocks.write("IBM,10,150.00,160.00,5/12/2017,1\n")
+    with pytest.raises(ValueError, match="investor 1 follow investor 3"):
+        async_pipeline.run_pipeline(investors_list, "investments.db", "investor_report.txt", w7.stock_from_values,
+                                    w7.bond_from_values, "grouped_stocks.csv", "grouped_bonds.csv", grouped=True)
+    assert table_rows("investments.db") == before_rows
+
+
+def test_failed_run_keeps_the_previous_rows_and_report(pipeline_dir):
+    before_rows = table_rows("investments.db")
+    before_report = read("investor_report.txt")
+
+    def broken_bond(values):
+        raise ValueError("bad bond")
+    with pytest.raises(ValueError, match="bad bond"):
+        async_pipeline.run_pipeline(investors(), "investments.db", "investor_report.txt", w7.stock_from_values,
+                                    broken_bond)
+    assert table_rows("investments.db") == before_rows
+    assert read("investor_report.txt") == before_report
+    assert not os.path.exists("investor_report.txt.tmp")
+
+
+def test_failed_insert_keeps_the_previous_report(pipeline_dir):
+    before_report = read("investor_report.txt")
+
+    def same_purchase_id(values):
+        symbol, shares, purchase_price, current_value, purchase_date = values
+        return w7.Stock(7, symbol, purchase_price, current_value, shares, purchase_date)
+    with pytest.raises(sqlite3.IntegrityError):
+        async_pipeline.run_pipeline(investors(), "investments.db", "investor_report.txt", same_purchase_id,
+                                    w7.bond_from_values)
+    assert read("investor_report.txt") == before_report
+    assert not os.path.exists("investor_report.txt.tmp")
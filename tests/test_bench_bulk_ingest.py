@@ -0,0 +1,29 @@
+import sqlite3
+
+import bench_bulk_ingest as bbi
+import week_7_nittala as w7
+
+
+def test_per_row_baseline_commits_every_row(tmp_path):
+    investors = bbi.build_investors(3, 4)
+    conn = w7.create_connection(str(tmp_path / "per-row.db"))
+    w7.create_tables(conn)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    bbi.insert_per_row(conn, investors)
+    conn.set_trace_callback(None)
+    assert [sql for sql in statements if sql == "COMMIT"] == ["COMMIT"] * (3 * (1 + 4 + 1))
+    conn.close()
+
+
+def test_bulk_and_per_row_store_the_same_rows(tmp_path):
+    investors = bbi.build_investors(3, 4)
+    tables = []
+    for name, bulk in (("per-row", False), ("bulk", True)):
+        db_file = str(tmp_path / (name + ".db"))
+        assert bbi.time_load(db_file, investors, bulk, 5) >= 0
+        conn = sqlite3.connect(db_file)
+        tables.append([sorted(conn.execute("SELECT * FROM " + table)) for table in ("investor", "stock", "bond")])
+        conn.close()
+    assert tables[0] == tables[1]
+    assert all(yld.endswith("%") for *_, yld in tables[0][2])
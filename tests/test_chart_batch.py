@@ -0,0 +1,72 @@
+import json
+import os
+
+import pytest
+
+import chart_batch
+import price_cache as pc
+
+
+def history_records():
+    records = []
+    for day in range(1, 29):
+        for symbol, base in (("AIG", 58.0), ("IBM", 150.0), ("BRK.B", 170.0)):
+            records.append({"Symbol": symbol, "Date": "{0}-Feb-17".format(day), "Open": base + day,
+                            "High": base + day + 1, "Low": base + day - 1, "Close": base + day + 0.5,
+                            "Volume": 1000 + day})
+    return records
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = str(tmp_path / "AllStocks.json")
+    with open(path, "w") as f:
+        json.dump(history_records(), f)
+    return path
+
+
+def test_charts_render_once_and_are_skipped_when_current(source, tmp_path):
+    out = str(tmp_path / "charts")
+    assert chart_batch.render_charts(source, None, out, workers=1) == (3, 0)
+    assert sorted(os.listdir(out)) == ["AIG.png", "BRK.B.png", "IBM.png", chart_batch.INDEX_FILE]
+    assert chart_batch.render_charts(source, ["IBM", "AIG"], out, workers=1) == (0, 2)
+    assert chart_batch.render_charts(source, ["IBM"], out, workers=1, sma_windows=(5,)) == (1, 0)
+    assert chart_batch.render_charts(source, ["AIG"], out, workers=1, force=True) == (1, 0)
+
+
+def test_charts_render_in_a_process_pool(source, tmp_path):
+    out = str(tmp_path / "charts")
+    assert chart_batch.render_charts(source, None, out, workers=2) == (3, 0)
+    with open(os.path.join(out, "IBM.png"), "rb") as png:
+        assert png.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_unknown_symbol_is_an_error(source, tmp_path):
+    out = str(tmp_path / "charts")
+    with pytest.raises(ValueError, match="XYZ"):
+        chart_batch.render_charts(source, ["IBM", "XYZ"], out, workers=1)
+    assert not os.path.exists(os.path.join(out, "IBM.png"))
+
+
+def test_manifest_is_read_once_per_batch(source, tmp_path, monkeypatch):
+    pc.open_cache(source)
+    reads = []
+    read_manifest = pc.read_manifest
+
+    def counted(cache_dir):
+        reads.append(cache_dir)
+        return read_manifest(cache_dir)
+    monkeypatch.setattr(pc, "read_manifest", counted)
+    assert chart_batch.render_charts(source, None, str(tmp_path / "charts"), workers=1) == (3, 0)
+    assert len(reads) == 1
+    assert chart_batch.render_charts(source, ["IBM", "AIG"], str(tmp_path / "charts"), workers=1, force=True) == (2, 0)
+    assert len(reads) == 2
+
+
+def test_chart_file_names_are_safe_and_distinct():
+    assert chart_batch.chart_file_name("IBM") == "IBM.png"
+    assert chart_batch.chart_file_name("BRK.B") == "BRK.B.png"
+    colon, slash = chart_batch.chart_file_name("GT2:GOV"), chart_batch.chart_file_name("GT2/GOV")
+    assert colon.startswith("GT2_GOV-") and slash.startswith("GT2_GOV-") and colon != slash
+    assert chart_batch.chart_file_name("GT2_GOV") == "GT2_GOV.png"
+    assert "/" not in chart_batch.chart_file_name("../x")
@@ -0,0 +1,87 @@
+import os
+import shutil
+import time
+
+import pytest
+
+import csv_columns as cc
+import holdings_loader as hl
+import metrics
+import nittala_week_6 as w6
+from conftest import AS_OF, DATA_DIR
+
+MODES = [{"parse_workers": 2}, {"columnar": True}, {"columnar": True, "parse_workers": 2}]
+
+
+@pytest.fixture(params=["sample", "dupes"])
+def holdings(request, tmp_path):
+    """Holdings files of a dataset copied into tmp_path, so columnar stores are written there"""
+    paths = []
+    for file_name in (hl.STOCK_FILE, hl.BOND_FILE):
+        shutil.copy(os.path.join(DATA_DIR, request.param, file_name), str(tmp_path / file_name))
+        paths.append(str(tmp_path / file_name))
+    return paths
+
+
+def load(stock_file, bond_file, **kwargs):
+    """Rendered blocks and load stats of both investors read with the given reader options"""
+    investors = [w6.Investor(1, "Bob", "71 Pilgrim Avenue", "303-303-3033"),
+                 w6.Investor(2, "Carl", "271 East Orchard Ave", "720-909-1234")]
+    stats = (w6.load_stock_data(AS_OF, investors, stock_file, verbose=False, **kwargs),
+             w6.load_bond_data(AS_OF, investors, bond_file, verbose=False, **kwargs))
+    return [w6.rr.render_investor_block(investor_obj) for investor_obj in investors], stats
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_column_readers_build_the_same_lots_as_the_line_reader(holdings, mode):
+    expected, expected_stats = load(*holdings)
+    blocks, stats = load(*holdings, **mode)
+    assert blocks == expected
+    assert [(s.rows, s.routed, s.skipped) for s in stats] == [(s.rows, s.routed, s.skipped) for s in expected_stats]
+
+
+def test_several_workers_split_a_small_file(holdings):
+    stock_file = holdings[0]
+    assert len(cc.chunk_ranges(stock_file)) == 1
+    ranges = cc.chunk_ranges(stock_file, chunks=3)
+    assert len(ranges) >= 3
+    assert ranges[0][0] == cc.read_header(stock_file)[1] and ranges[-1][1] == os.path.getsize(stock_file)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert len(cc.chunk_ranges(stock_file, chunk_bytes=64, chunks=2)) > 2
+
+
+def test_parallel_parse_uses_the_pool_for_a_small_file(holdings, monkeypatch):
+    pools = []
+
+    class RecordingPool(cc.ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+    monkeypatch.setattr(cc, "ProcessPoolExecutor", RecordingPool)
+    single = cc.parse_file(holdings[0], workers=1)
+    assert pools == []
+    parallel = cc.parse_file(holdings[0], workers=2)
+    assert pools == [2]
+    assert len(parallel) == len(single)
+    assert list(parallel.values(hl.STOCK_COLUMNS)) == list(single.values(hl.STOCK_COLUMNS))
+
+
+@pytest.mark.parametrize("mode", [{}] + MODES)
+def test_parse_time_excludes_lot_construction(holdings, mode, monkeypatch):
+    stock_from_values = w6.stock_from_values
+
+    def slow_stock(index, values, today):
+        time.sleep(0.002)
+        return stock_from_values(index, values, today)
+    monkeypatch.setattr(w6, "stock_from_values", slow_stock)
+    collector = metrics.enable()
+    try:
+        _, stats = load(*holdings, **mode)
+    finally:
+        metrics.disable()
+    stages = dict((span.name, span) for span in collector.spans)
+    construct = stages["stock_construct"]
+    assert construct.rows == stats[0].routed and construct.seconds >= 0.002 * stats[0].routed
+    for kind in ("stock", "bond"):
+        assert stages[kind + "_csv_parse"].seconds >= 0
+        assert stages[kind + "_csv_parse"].rows == stats[kind == "bond"].rows
@@ -0,0 +1,44 @@
+from datetime import date, datetime
+
+import pytest
+
+import date_parser as dp
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    dp.clear_cache()
+    yield
+    dp.clear_cache()
+
+
+def test_parse_matches_strptime():
+    for text, date_format in (("8/1/2015", dp.DATE_FORMAT), (" 12/31/1999 ", dp.DATE_FORMAT),
+                              ("12-Apr-17", "%d-%b-%y")):
+        expected = datetime.strptime(text.strip(), date_format).date()
+        assert dp.parse_date(text, date_format) == expected
+        assert dp.parse_epoch_day(text, date_format) == (expected - date(1970, 1, 1)).days
+    assert dp.from_epoch_day(0) == date(1970, 1, 1)
+
+
+def test_repeated_dates_hit_the_cache():
+    for _ in range(5):
+        dp.parse_epoch_day("8/1/2015")
+    stats = dp.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (4, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(0.8)
+
+
+def test_parse_column_parses_each_distinct_value_once():
+    values = ["8/1/2015", "1/10/2017", "8/1/2015", "8/1/2015"]
+    days = dp.parse_column(values)
+    assert days.tolist() == [dp.parse_epoch_day(text) for text in values]
+    assert dp.cache_stats()["misses"] == 2
+    assert dp.parse_column([]).tolist() == []
+
+
+def test_bad_dates_raise():
+    with pytest.raises(ValueError):
+        dp.parse_epoch_day("2015-08-01")
+    with pytest.raises(ValueError):
+        dp.parse_column(["8/1/2015", "13/1/2015"])
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import downsample as ds
+
+
+def series(n=10000, seed=7):
+    rng = np.random.RandomState(seed)
+    return np.arange(n), np.cumsum(rng.normal(size=n)) + 100
+
+
+def test_short_series_pass_through():
+    x, y = series(50)
+    for method in (ds.MINMAX, ds.LTTB):
+        out_x, out_y = ds.downsample(x, y, 100, method)
+        assert out_x.tolist() == x.tolist() and out_y.tolist() == y.tolist()
+
+
+def test_minmax_keeps_every_peak_and_trough():
+    x, y = series()
+    out_x, out_y = ds.downsample(x, y, 400, ds.MINMAX)
+    assert len(out_x) <= 400
+    assert np.all(np.diff(out_x) > 0)
+    assert out_y.max() == y.max() and out_y.min() == y.min()
+    assert (out_x[0], out_x[-1]) == (0, len(x) - 1)
+
+
+def test_minmax_ignores_nan_unless_the_bucket_is_empty():
+    y = np.array([1.0, np.nan, 5.0, 2.0, np.nan, np.nan, np.nan, np.nan, 3.0, 0.0])
+    indices = ds.minmax_indices(y, 6)
+    assert 2 in indices and 9 in indices
+    assert not np.isnan(y[indices]).all()
+
+
+@pytest.mark.parametrize("max_points", [2, 3, 4, 5])
+def test_minmax_stays_within_small_bounds(max_points):
+    x, y = series(100)
+    indices = ds.minmax_indices(y, max_points)
+    assert len(indices) <= max_points and (indices[0], indices[-1]) == (0, 99)
+    if max_points == 3:
+        assert indices[1] in (np.argmax(y), np.argmin(y))
+
+
+def test_minmax_rejects_fewer_than_two_points():
+    with pytest.raises(ValueError, match="at least 2"):
+        ds.minmax_indices([1.0, 2.0, 3.0], 1)
+    assert ds.minmax_indices([1.0], 1).tolist() == [0]
+
+
+def test_lttb_returns_exactly_max_points_in_order():
+    x, y = series()
+    dates = (np.datetime64("2010-01-01") + x).astype("datetime64[D]")
+    out_x, out_y = ds.downsample(dates, y, 300, ds.LTTB)
+    assert len(out_x) == 300 and out_x.dtype == dates.dtype
+    assert np.all(np.diff(out_x.astype(np.int64)) > 0)
+    assert (out_y[0], out_y[-1]) == (y[0], y[-1])
+
+
+def test_target_points_and_bad_method():
+    assert ds.target_points(8, 100) == 1600
+    assert ds.target_points(0.001, 1) == 3
+    with pytest.raises(ValueError):
+        ds.downsample([1, 2], [1, 2], 10, "every-other")
@@ -0,0 +1,74 @@
+import pytest
+
+import holdings_loader as hl
+
+ROUTED_STOCKS = """SYMBOL,NO_SHARES,PURCHASE_PRICE,CURRENT_VALUE,PURCHASE_DATE,INVESTOR_ID
+GOOGL,125,772.88,941.53,8/1/2015,1
+MSFT,85,56.60,73.04,8/1/2015,2
+
+IBM,80,150.37,145.30,5/12/2017,9
+F,85,12.58,10.95,2/17/2017,1
+"""
+
+
+def write(tmp_path, text, name="stocks.csv"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def collect(file_path, investor_ids):
+    lots = dict((investor_id, []) for investor_id in investor_ids)
+
+    def add_lot(investor_obj, index, values):
+        lots[investor_obj].append((index, values[0]))
+    stats = hl.route_rows(file_path, hl.STOCK_COLUMNS, dict((i, i) for i in investor_ids), add_lot, verbose=False)
+    return lots, stats
+
+
+def test_iter_rows_yields_requested_columns_in_order(tmp_path):
+    rows = list(hl.iter_rows(write(tmp_path, ROUTED_STOCKS), ("PURCHASE_DATE", "SYMBOL")))
+    assert rows == [(1, 1, ("8/1/2015", "GOOGL")), (2, 2, ("8/1/2015", "MSFT")),
+                    (4, 9, ("5/12/2017", "IBM")), (5, 1, ("2/17/2017", "F"))]
+
+
+def test_rows_are_routed_to_their_investor(tmp_path):
+    lots, stats = collect(write(tmp_path, ROUTED_STOCKS), (1, 2))
+    assert lots == {1: [(1, "GOOGL"), (5, "F")], 2: [(2, "MSFT")]}
+    assert (stats.rows, stats.routed, stats.skipped) == (4, 3, 1)
+
+
+def test_files_without_investor_column_go_to_everyone(tmp_path):
+    text = "\n".join(line.rsplit(",", 1)[0] for line in ROUTED_STOCKS.splitlines() if line) + "\n"
+    lots, stats = collect(write(tmp_path, text), (1, 2))
+    assert [symbol for _, symbol in lots[1]] == ["GOOGL", "MSFT", "IBM", "F"]
+    assert lots[1] == lots[2]
+    assert stats.routed == 8
+
+
+def test_missing_file_and_bad_header(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(hl.iter_rows(str(tmp_path / "missing.csv"), hl.STOCK_COLUMNS))
+    with pytest.raises(ValueError, match="Incorrect Columns"):
+        list(hl.iter_rows(write(tmp_path, "SYMBOL,NO_SHARES\nIBM,1\n"), hl.STOCK_COLUMNS))
+
+
+def test_short_row_is_reported(tmp_path):
+    with pytest.raises(ValueError, match="Row 2"):
+        list(hl.iter_rows(write(tmp_path, ROUTED_STOCKS.replace("MSFT,85,56.60,73.04,8/1/2015,2", "MSFT,85")),
+                          hl.STOCK_COLUMNS))
+
+
+def test_load_columns_groups_rows_by_investor(tmp_path):
+    holdings = hl.load_columns(write(tmp_path, ROUTED_STOCKS), hl.STOCK_COLUMNS)
+    rows = holdings.investor_rows([1, 2, 3])
+    assert [holdings.take("SYMBOL", rows[investor_id]).tolist() for investor_id in (1, 2, 3)] == [
+        ["GOOGL", "F"], ["MSFT"], []]
+    assert holdings.portfolio(rows[1]).shares.tolist() == [125, 85]
+
+
+def test_load_columns_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        hl.load_columns(str(tmp_path / "missing.csv"), hl.STOCK_COLUMNS)
+    with pytest.raises(ValueError, match="Incorrect Columns in Bond"):
+        hl.load_columns(write(tmp_path, ROUTED_STOCKS), hl.BOND_COLUMNS, "Bond")
@@ -0,0 +1,74 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import csv_columns as cc
+import holdings_loader as hl
+import holdings_store as hs
+from conftest import DATA_DIR
+
+
+class RecordingArray(np.ndarray):
+    """Array that records the length of every tolist() call, including on its slices"""
+    sizes = []
+
+    def tolist(self):
+        RecordingArray.sizes.append(len(self))
+        return super().tolist()
+
+
+@pytest.fixture(params=["sample", "dupes"])
+def stock_file(request, tmp_path):
+    path = str(tmp_path / hl.STOCK_FILE)
+    shutil.copy(os.path.join(DATA_DIR, request.param, hl.STOCK_FILE), path)
+    return path
+
+
+def recording(holdings):
+    """HoldingsColumns over the same columns viewed as RecordingArray"""
+    columns = dict((name, (column[0], column[1].view(RecordingArray)) if isinstance(column, tuple)
+                    else column.view(RecordingArray)) for name, column in holdings.columns.items())
+    RecordingArray.sizes = []
+    return cc.HoldingsColumns(holdings.file_path, holdings.header, columns, holdings.rows)
+
+
+def test_store_round_trips_the_parsed_columns(stock_file):
+    parsed = cc.parse_file(stock_file, workers=1)
+    stored = hs.load(stock_file)
+    assert isinstance(stored.column("PURCHASE_PRICE"), np.memmap)
+    assert stored.column("NO_SHARES").dtype == np.int32
+    assert list(stored.values(hl.STOCK_COLUMNS)) == list(parsed.values(hl.STOCK_COLUMNS))
+    assert list(stored.iter_rows(hl.STOCK_COLUMNS, "Stock")) == list(parsed.iter_rows(hl.STOCK_COLUMNS, "Stock"))
+
+
+def test_rows_are_converted_in_bounded_slices(stock_file, monkeypatch):
+    monkeypatch.setattr(cc, "ROW_SLICE", 2)
+    stored = hs.load(stock_file)
+    expected = list(cc.parse_file(stock_file, workers=1).iter_rows(hl.STOCK_COLUMNS, "Stock"))
+    assert len(expected) > 2
+
+    holdings = recording(stored)
+    rows = holdings.iter_rows(hl.STOCK_COLUMNS, "Stock")
+    assert next(rows) == expected[0]
+    assert RecordingArray.sizes and max(RecordingArray.sizes) <= 2
+    assert [expected[0]] + list(rows) == expected
+    assert max(RecordingArray.sizes) <= 2
+
+    holdings = recording(stored)
+    assert list(holdings.values(("SYMBOL", "PURCHASE_DATE"))) == [(values[0], values[4]) for _, _, values in expected]
+    assert max(RecordingArray.sizes) <= 2
+
+
+def test_decoded_slices_a_text_column(stock_file):
+    stored = hs.load(stock_file)
+    symbols = [values[0] for _, _, values in stored.iter_rows(hl.STOCK_COLUMNS, "Stock")]
+    assert stored.decoded("SYMBOL").tolist() == symbols
+    assert stored.decoded("SYMBOL", 1, 3).tolist() == symbols[1:3]
+    assert stored.portfolio().symbols.tolist() == symbols
+
+
+def test_bad_columns_are_reported_before_iterating(stock_file):
+    with pytest.raises(ValueError, match="Incorrect Columns in Stock"):
+        hs.load(stock_file).iter_rows(("SYMBOL", "MISSING"), "Stock")
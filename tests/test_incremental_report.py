@@ -0,0 +1,90 @@
+import sqlite3
+
+import pytest
+
+import holdings_loader as hl
+import incremental_report as ir
+import week_7_nittala as w7
+from conftest import AS_OF_TEXT, golden_report, sorted_lines
+
+STOCKS = """SYMBOL,NO_SHARES,PURCHASE_PRICE,CURRENT_VALUE,PURCHASE_DATE,INVESTOR_ID
+GOOGL,125,772.88,941.53,8/1/2015,1
+MSFT,85,56.60,73.04,8/1/2015,1
+IBM,80,150.37,145.30,5/12/2017,2
+F,85,12.58,10.95,2/17/2017,3
+"""
+BONDS = """SYMBOL,NO_SHARES,PURCHASE_PRICE,CURRENT_VALUE,PURCHASE_DATE,Coupon,Yield,INVESTOR_ID
+GT2:GOV,200,100.02,100.05,8/1/2014,1.38,1.35%,2
+"""
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch, fixed_clock):
+    monkeypatch.chdir(tmp_path)
+    write_holdings(STOCKS, BONDS)
+    return tmp_path
+
+
+def write_holdings(stocks, bonds):
+    with open(hl.STOCK_FILE, "w") as f:
+        f.write(stocks)
+    with open(hl.BOND_FILE, "w") as f:
+        f.write(bonds)
+
+
+def refresh(investor_ids=(1, 2, 3)):
+    """One incremental run; returns (changed, total, report text)"""
+    w7.Stock.set_as_of_date(AS_OF_TEXT)
+    investors = [w7.Investor(investor_id, "Investor {0}".format(investor_id), "Address", "555")
+                 for investor_id in investor_ids]
+    w7.load_stock_data(AS_OF_TEXT, investors, verbose=False)
+    w7.load_bond_data(AS_OF_TEXT, investors, verbose=False)
+    conn = sqlite3.connect("investments.db")
+    try:
+        changed, total = w7.refresh_incremental(conn, investors, "investor_report.txt")
+    finally:
+        conn.close()
+    with open("investor_report.txt") as f:
+        return changed, total, f.read()
+
+
+def full_report(investor_ids=(1, 2, 3)):
+    """The report a from-scratch render of the same holdings produces, one block per investor"""
+    w7.Stock.set_as_of_date(AS_OF_TEXT)
+    investors = [w7.Investor(investor_id, "Investor {0}".format(investor_id), "Address", "555")
+                 for investor_id in investor_ids]
+    w7.load_stock_data(AS_OF_TEXT, investors, verbose=False)
+    w7.load_bond_data(AS_OF_TEXT, investors, verbose=False)
+    return "".join(w7.rr.render_investor_block(investor_obj) for investor_obj in investors)
+
+
+def test_incremental_main_matches_original(run_report):
+    assert sorted_lines(run_report(w7, "sample", incremental=True)) == sorted_lines(golden_report("sample", "week7"))
+
+
+def test_unchanged_holdings_rewrite_nothing(workdir):
+    first = refresh()
+    assert first[:2] == (3, 3)
+    assert refresh() == (0, 3, first[2])
+
+
+def test_price_change_rerenders_only_its_investor(workdir):
+    refresh()
+    write_holdings(STOCKS.replace("150.37,145.30", "150.37,199.99"), BONDS)
+    changed, total, text = refresh()
+    assert (changed, total) == (1, 3)
+    assert sorted_lines(text) == sorted_lines(full_report())
+    assert "3969.6" in text
+
+
+def test_layout_changes_are_spliced_into_a_new_report(workdir):
+    refresh()
+    write_holdings(STOCKS + "T,1,20.00,25.00,1/1/2018,2\n", BONDS)
+    changed, _, text = refresh((1, 2, 3))
+    assert changed == 1
+    assert sorted_lines(text) == sorted_lines(full_report())
+    changed, total, text = refresh((1, 3))
+    assert (changed, total) == (0, 2)
+    assert sorted_lines(text) == sorted_lines(full_report((1, 3)))
+    state = ir.ReportState.load(ir.state_file_for("investor_report.txt"), "investor_report.txt")
+    assert state.investor_ids() == [1, 3]
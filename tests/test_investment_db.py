@@ -0,0 +1,165 @@
+import sqlite3
+
+import pytest
+
+import investment_db as idb
+import StockCalculator as sc
+import week_7_nittala as w7
+from conftest import AS_OF_TEXT, DATA_DIR
+
+
+@pytest.fixture
+def investors(monkeypatch):
+    monkeypatch.setattr(w7.Stock, "as_of_date", None)
+    w7.Stock.set_as_of_date(AS_OF_TEXT)
+    loaded = [w7.Investor(1, "Bob", "71 Pilgrim Avenue", "303-303-3033"),
+              w7.Investor(2, "Carl", "271 East Orchard Ave", "720-909-1234")]
+    w7.load_stock_data(AS_OF_TEXT, loaded, DATA_DIR + "/sample/Lesson6_Data_Stocks.csv", verbose=False)
+    w7.load_bond_data(AS_OF_TEXT, loaded, DATA_DIR + "/sample/Lesson6_Data_Bonds.csv", verbose=False)
+    return loaded
+
+
+@pytest.fixture
+def conn(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "investments.db"))
+    idb.ensure_schema(connection)
+    yield connection
+    connection.close()
+
+
+def table_counts(connection):
+    return dict((table, connection.execute("SELECT COUNT(*) FROM " + table).fetchone()[0])
+                for table in ("investor", "stock", "bond"))
+
+
+def test_iter_batches_splits_a_stream():
+    assert [len(batch) for batch in idb.iter_batches(range(7), 3)] == [3, 3, 1]
+    assert list(idb.iter_batches([], 3)) == []
+
+
+def test_bulk_insert_writes_every_row(conn, investors):
+    counts = idb.bulk_insert(conn, investors, batch_size=3, verbose=False)
+    assert counts == {"investor": 2, "stock": 16, "bond": 2}
+    assert table_counts(conn) == counts
+
+
+def test_bulk_insert_rolls_back_on_failure(conn, investors):
+    idb.bulk_insert(conn, investors[:1], verbose=False)
+    before = table_counts(conn)
+    with pytest.raises(sqlite3.IntegrityError):
+        # Investor 1 is already present, so the whole second transaction is rolled back
+        idb.bulk_insert(conn, [investors[1], investors[0]], verbose=False)
+    assert table_counts(conn) == before
+
+
+def test_configure_pragmas_switches_to_wal(conn):
+    idb.configure_pragmas(conn, cache_size_kb=2048)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2048
+
+
+def holdings(investor_obj):
+    return ([stock.to_row(investor_obj._investor_id) for stock in investor_obj._list_of_stocks],
+            [bond.to_row(investor_obj._investor_id) for bond in investor_obj._list_of_bonds])
+
+
+def test_set_based_reload_matches_per_investor_queries(conn, investors):
+    idb.bulk_insert(conn, investors, verbose=False)
+    reloaded = list(w7.load_investors_from_db(conn))
+    assert [investor_obj.to_row() for investor_obj in reloaded] == [investor_obj.to_row() for investor_obj in investors]
+    for investor_obj in reloaded:
+        single = w7.Investor(*investor_obj.to_row())
+        w7.load_data_from_db(conn.cursor(), single, investor_obj._investor_id)
+        assert holdings(single) == holdings(investor_obj)
+    assert [investor_obj._investor_id for investor_obj in w7.load_investors_from_db(conn, 2, 2)] == [2]
+
+
+def test_reload_runs_one_query_per_table(conn, investors):
+    many = [w7.Investor(investor_id, "Investor", "Address", "555") for investor_id in range(3, 40)]
+    for investor_obj in many:
+        investor_obj.add_stock(w7.stock_from_values(("IBM", 80, 150.37, 145.30, "5/12/2017")))
+    idb.bulk_insert(conn, investors + many, verbose=False)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    assert len(list(idb.iter_investor_holdings(conn))) == 39
+    conn.set_trace_callback(None)
+    assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 3
+
+
+def test_holdings_reads_use_the_investor_symbol_indexes(conn):
+    names = set(row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'"))
+    assert not names & set(idb.LEGACY_INDEXES)
+    plan = " ".join(str(row) for row in conn.execute("EXPLAIN QUERY PLAN " + idb.SELECT_STOCKS, (0, 10)))
+    assert "idx_stock_investor_symbol" in plan
+
+
+V1_SCHEMA = ["""CREATE TABLE investor(investor_id integer PRIMARY KEY, first_name text NOT NULL, address text NOT NULL,
+             phone_number integer NOT NULL)""",
+             """CREATE TABLE stock(purchase_id integer PRIMARY KEY, investor_id integer NOT NULL,
+             stock_symbol text NOT NULL, purchase_price integer NOT NULL, current_price integer NOT NULL,
+             number_of_shares integer NOT NULL, purchase_date text NOT NULL)""",
+             """CREATE TABLE bond(purchase_id integer PRIMARY KEY, investor_id integer NOT NULL,
+             stock_symbol text NOT NULL, purchase_price integer NOT NULL, current_price integer NOT NULL,
+             number_of_shares integer NOT NULL, purchase_date text NOT NULL, coupon integer NOT NULL,
+             yld integer NOT NULL)""",
+             "CREATE INDEX idx_stock_investor ON stock(investor_id)"]
+
+V2_BOND = """CREATE TABLE bond(purchase_id INTEGER PRIMARY KEY, investor_id INTEGER NOT NULL,
+stock_symbol TEXT NOT NULL, purchase_price REAL NOT NULL, current_price REAL NOT NULL,
+number_of_shares INTEGER NOT NULL, purchase_date INTEGER NOT NULL, coupon REAL NOT NULL, yld REAL NOT NULL)"""
+
+
+def column_types(connection, table):
+    return dict((row[1], row[2]) for row in connection.execute("PRAGMA table_info({0})".format(table)))
+
+
+def test_version_1_database_is_migrated_in_place(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "v1.db"))
+    for statement in V1_SCHEMA:
+        connection.execute(statement)
+    connection.execute("INSERT INTO investor VALUES (1, 'Bob', '71 Pilgrim Avenue', 3033033033)")
+    connection.execute("INSERT INTO stock VALUES (7, 1, 'IBM', 150.37, 145.30, 80, '5/12/2017')")
+    connection.execute("INSERT INTO bond VALUES (8, 1, 'GT2:GOV', 100.02, 100.05, 200, '8/1/2014', 1.38, '1.35%')")
+    connection.commit()
+
+    assert idb.ensure_schema(connection) == idb.SCHEMA_VERSION == idb.schema_version(connection)
+    assert column_types(connection, "bond")["yld"] == "TEXT"
+    assert column_types(connection, "stock")["purchase_date"] == "INTEGER"
+    assert connection.execute("SELECT phone_number FROM investor").fetchone() == ("3033033033",)
+    assert connection.execute("SELECT * FROM stock").fetchone() == (
+        7, 1, "IBM", 150.37, 145.30, 80, sc.to_epoch_day("5/12/2017"))
+    assert idb.select_lots(connection, "GT2:GOV", "1/1/2014", "12/31/2014", table="bond") == [
+        (8, 1, "GT2:GOV", 100.02, 100.05, 200, sc.to_epoch_day("8/1/2014"), 1.38, "1.35%")]
+    names = set(row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'"))
+    assert not names & set(idb.LEGACY_INDEXES)
+    connection.close()
+
+
+def test_version_2_bond_yield_becomes_text(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "v2.db"))
+    connection.execute(V2_BOND)
+    connection.execute("CREATE INDEX idx_bond_investor ON bond(investor_id)")
+    connection.execute("INSERT INTO bond VALUES (8, 1, 'GT2:GOV', 100.02, 100.05, 200, 16283, 1.38, '1.35%')")
+    connection.execute("PRAGMA user_version = 2")
+    connection.commit()
+
+    idb.ensure_schema(connection)
+    assert column_types(connection, "bond")["yld"] == "TEXT"
+    assert connection.execute("SELECT yld, typeof(yld) FROM bond").fetchone() == ("1.35%", "text")
+    names = set(row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'"))
+    assert "idx_bond_investor" not in names and "idx_bond_investor_symbol" in names
+    connection.close()
+
+
+def test_newer_schema_is_refused(conn):
+    conn.execute("PRAGMA user_version = {0}".format(idb.SCHEMA_VERSION + 1))
+    with pytest.raises(ValueError, match="newer"):
+        idb.ensure_schema(conn)
+
+
+def test_bond_yield_round_trips_as_text(conn, investors):
+    idb.bulk_insert(conn, investors, verbose=False)
+    assert set(conn.execute("SELECT typeof(yld) FROM bond")) == {("text",)}
+    reloaded = list(w7.load_investors_from_db(conn))
+    assert [holdings(investor_obj)[1] for investor_obj in reloaded] == [
+        holdings(investor_obj)[1] for investor_obj in investors]
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+import json_stream as js
+
+RECORDS = [{"Symbol": "AIG", "Date": "1-Jan-17", "Open": 58.91, "Close": 59.0, "Volume": 1234567},
+           {"Symbol": "F", "Date": "2-Jan-17", "Open": "-", "Close": 12.5, "Volume": 0},
+           {"Symbol": "AIG", "Date": "3-Jan-17", "Open": 60.1, "Close": 61.25, "Volume": 98765,
+            "Note": "brackets ] and commas , inside \"strings\""},
+           [1, [2, 3], {"nested": []}], 123456789, -0.5e3, "tail", None, True]
+
+
+def write(tmp_path, text):
+    path = tmp_path / "AllStocks.json"
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.mark.parametrize("layout", [json.dumps(RECORDS), json.dumps(RECORDS, indent=4),
+                                    "\n  " + json.dumps(RECORDS, separators=(" , ", " : ")) + " \n"])
+def test_every_chunk_boundary_decodes_the_same_records(tmp_path, layout):
+    path = write(tmp_path, layout)
+    for chunk_size in range(1, len(layout) + 2):
+        assert list(js.iter_json_array(path, chunk_size)) == RECORDS, chunk_size
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ ]  ", "\n[\n]\n"])
+def test_empty_arrays(tmp_path, text):
+    path = write(tmp_path, text)
+    for chunk_size in (1, 2, 64):
+        assert list(js.iter_json_array(path, chunk_size)) == []
+
+
+@pytest.mark.parametrize("text", ['{"Symbol": "AIG"}', "[1, 2", "[1 2]", '[{"Symbol": "AIG"}', "[1,,2]", ""])
+def test_malformed_files_raise(tmp_path, text):
+    path = write(tmp_path, text)
+    for chunk_size in (1, 3, 64):
+        with pytest.raises(ValueError):
+            list(js.iter_json_array(path, chunk_size))
+
+
+def test_price_records_filter_by_symbol_and_missing_open(tmp_path):
+    path = write(tmp_path, json.dumps(RECORDS[:3]))
+    assert [record["Date"] for record in js.iter_price_records(path, "AIG", chunk_size=7)] == ["1-Jan-17",
+                                                                                               "3-Jan-17"]
+    assert len(list(js.iter_price_records(path, skip_missing=False))) == 3
+    assert len(list(js.iter_price_records(path))) == 2
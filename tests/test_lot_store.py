@@ -0,0 +1,43 @@
+import pytest
+
+import nittala_week_6 as w6
+import report_renderer as rr
+from conftest import AS_OF, DATA_DIR
+from lot_store import LotArray
+
+SAMPLE = DATA_DIR + "/sample/"
+
+
+def load(compact):
+    investors = [w6.Investor(1, "Bob", "71 Pilgrim Avenue", "303-303-3033", compact=compact),
+                 w6.Investor(2, "Carl", "271 East Orchard Ave", "720-909-1234", compact=compact)]
+    w6.load_stock_data(AS_OF, investors, SAMPLE + "Lesson6_Data_Stocks.csv", verbose=False)
+    w6.load_bond_data(AS_OF, investors, SAMPLE + "Lesson6_Data_Bonds.csv", verbose=False)
+    return investors
+
+
+def test_lots_have_no_instance_dict():
+    for lot in (w6.Stock(1, "SLOT", 1.0, 2.0, 3, AS_OF, "8/1/2015"),
+                w6.Bond(1, "SLOT", 1.0, 2.0, 3, AS_OF, "8/1/2015", 1.5, "2%"),
+                w6.Investor(1, "Bob", "Address", "555")):
+        assert not hasattr(lot, "__dict__")
+
+
+def test_lot_array_round_trips_every_compact_field():
+    bonds = LotArray(w6.Bond)
+    originals = [w6.Bond(i, "GT{0}:GOV".format(i % 2), 100.0 + i, 101.0, 10 * i, AS_OF, "8/1/2014", 1.38, "1.35%")
+                 for i in range(1, 5)]
+    for bond in originals:
+        bonds.append(bond)
+    assert len(bonds) == 4
+    for original, snapshot in zip(originals, bonds):
+        assert [getattr(snapshot, name) for name, _ in w6.Bond.compact_fields] == \
+               [getattr(original, name) for name, _ in w6.Bond.compact_fields]
+    assert bonds.column("_stock_symbol") == ["GT1:GOV", "GT0:GOV", "GT1:GOV", "GT0:GOV"]
+    assert bonds.total_loss_gain() == pytest.approx(sum(bond.loss_gain for bond in originals))
+    assert bonds.nbytes() < 4 * 80
+
+
+def test_compact_investors_render_the_same_report():
+    assert [rr.render_investor_block(investor_obj) for investor_obj in load(True)] == \
+           [rr.render_investor_block(investor_obj) for investor_obj in load(False)]
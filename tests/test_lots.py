@@ -0,0 +1,51 @@
+import pytest
+
+import nittala_week_6 as w6
+import week_7_nittala as w7
+from conftest import AS_OF, AS_OF_TEXT
+
+
+@pytest.fixture
+def as_of(monkeypatch):
+    monkeypatch.setattr(w7.Stock, "as_of_date", None)
+    w7.Stock.set_as_of_date(AS_OF_TEXT)
+    return AS_OF
+
+
+def expected_yield(purchase_price, current_price, purchase_date):
+    days = (AS_OF - w6.sc.to_date(purchase_date)).days
+    return (((current_price - purchase_price) / purchase_price) / days) * 100 * 365
+
+
+def test_week6_results_are_numbers_computed_on_first_use():
+    stock = w6.Stock(1, "LAZY6", 772.88, 941.53, 125, AS_OF, "8/1/2015")
+    assert stock._loss_gain is None and stock._annual_percent_yield_loss is None
+    assert stock.loss_gain == pytest.approx((941.53 - 772.88) * 125)
+    assert stock.annual_percent_yield_loss == pytest.approx(expected_yield(772.88, 941.53, "8/1/2015"))
+    assert stock.report_values() == ("LAZY6", "125", str(round(stock.loss_gain, 2)),
+                                     str(round(stock.annual_percent_yield_loss, 2)) + "%")
+
+
+def test_week7_results_follow_price_and_valuation_date(as_of):
+    stock = w7.Stock(1, "LAZY7", 150.37, 145.30, 80, "5/12/2017")
+    assert stock._loss_gain is None
+    first = stock.loss_gain
+    assert stock._loss_gain is not None and stock.loss_gain == first
+    stock.current_price = 160.0
+    assert stock.loss_gain == pytest.approx((160.0 - 150.37) * 80)
+    before = stock.annual_percent_yield_loss
+    w7.Stock.set_as_of_date("10/18/2027")
+    assert stock.annual_percent_yield_loss < before
+
+
+def test_bond_report_values_add_coupon_and_yield(as_of):
+    bond = w7.Bond(1, "LAZYB", 100.02, 100.05, 200, "8/1/2014", 1.38, "1.35%")
+    assert bond.report_values()[4:] == ("1.38", "1.35%")
+    assert bond.to_row(9) == (1, 9, "LAZYB", 100.02, 100.05, 200, w7.sc.to_epoch_day("8/1/2014"), 1.38, "1.35%")
+
+
+def test_purchase_date_must_precede_valuation_date(as_of):
+    with pytest.raises(ValueError, match="prior"):
+        w7.Stock(1, "LAZY7", 1.0, 2.0, 1, "12/31/2026")
+    with pytest.raises(ValueError, match="prior"):
+        w6.Stock(1, "LAZY6", 1.0, 2.0, 1, "1/1/2020", "1/2/2020")
@@ -0,0 +1,83 @@
+import json
+import time
+import tracemalloc
+
+import pytest
+
+import metrics
+import report_renderer as rr
+import week_7_nittala as w7
+
+
+@pytest.fixture(autouse=True)
+def metrics_off(monkeypatch):
+    for name in (metrics.METRICS_ENV, metrics.PROFILE_ENV, metrics.TRACE_MEMORY_ENV):
+        monkeypatch.delenv(name, raising=False)
+    yield
+    metrics.disable()
+
+
+def test_metrics_stay_off_without_a_flag():
+    assert metrics.configure() is None
+    assert not metrics.enabled()
+    with metrics.span("load") as stage:
+        stage.add(rows=3)
+    assert metrics.write_summary() is None
+
+
+def test_metrics_do_not_trace_memory_unless_asked(tmp_path):
+    output = str(tmp_path / "metrics.json")
+    metrics.configure(output)
+    assert not tracemalloc.is_tracing()
+    with metrics.span("load", rows=2) as stage:
+        stage.add(nbytes=10)
+    metrics.write_summary()
+    with open(output) as f:
+        summary = json.load(f)
+    assert summary["peak_bytes"] is None
+    assert summary["stages"] == [{"stage": "load", "parent": None, "seconds": summary["stages"][0]["seconds"],
+                                  "rows": 2, "bytes": 10, "rows_per_second": summary["stages"][0]["rows_per_second"]}]
+
+
+@pytest.mark.parametrize("flag, env", [(True, None), (False, "1")])
+def test_memory_tracing_is_a_separate_opt_in(monkeypatch, flag, env):
+    if env:
+        monkeypatch.setenv(metrics.TRACE_MEMORY_ENV, env)
+    collector = metrics.configure(trace_memory=flag)
+    assert collector is not None and tracemalloc.is_tracing()
+    with metrics.span("outer"):
+        with metrics.span("inner"):
+            block = bytearray(1 << 20)
+        del block
+    stages = dict((stage["stage"], stage) for stage in collector.summary()["stages"])
+    assert stages["inner"]["parent"] == "outer"
+    assert stages["outer"]["peak_bytes"] >= stages["inner"]["peak_bytes"] >= 1 << 20
+    metrics.disable()
+    assert not tracemalloc.is_tracing()
+
+
+def test_call_timer_and_recorded_stages():
+    collector = metrics.enable()
+    timer = metrics.CallTimer()
+    double = timer.wrap(lambda value: value * 2)
+    assert [double(value) for value in range(3)] == [0, 2, 4]
+    assert timer.calls == 3 and timer.seconds >= 0
+    collector.record("render", timer.seconds, timer.calls)
+    metrics.count("rows", 5)
+    summary = collector.summary()
+    assert summary["counters"] == {"rows": 5}
+    assert summary["stages"][0]["stage"] == "render" and "peak_bytes" not in summary["stages"][0]
+
+
+def test_week7_final_report_flush_counts_as_report_write(run_report, monkeypatch):
+    flush = rr.ReportRenderer.flush
+
+    def slow_flush(renderer):
+        time.sleep(0.05)
+        flush(renderer)
+    monkeypatch.setattr(rr.ReportRenderer, "flush", slow_flush)
+    collector = metrics.enable()
+    run_report(w7, "sample")
+    stages = dict((span.name, span) for span in collector.spans)
+    assert stages["report_write"].seconds >= 0.05
+    assert stages["db_reload"].seconds < 0.05
@@ -0,0 +1,46 @@
+import holdings_loader as hl
+import nittala_week_6 as w6
+import parallel_report
+from worker_pool import split_shards
+from conftest import AS_OF, DATA_DIR, golden_report
+
+SAMPLE = DATA_DIR + "/sample/"
+INVESTOR_ROWS = [(1, "Bob", "71 Pilgrim Avenue Chevy Chase, MD 20815", "303-303-3033"),
+                 (2, "Carl", "271 East Orchard Ave, CO 80112", "720-909-1234")]
+
+
+def test_split_shards_is_contiguous_and_balanced():
+    assert split_shards(list(range(7)), 3) == [[0, 1, 2], [3, 4], [5, 6]]
+    assert split_shards([1, 2], 8) == [[1], [2]]
+    assert split_shards([], 4) == []
+
+
+def test_parallel_csv_report_matches_original(run_report):
+    assert run_report(w6, "sample", workers=2) == golden_report("sample", "week6")
+
+
+def test_holdings_files_are_parsed_once(tmp_path, monkeypatch):
+    parsed = []
+    route_rows = hl.route_rows
+
+    def counting_route_rows(file_path, *args):
+        parsed.append(file_path)
+        return route_rows(file_path, *args)
+    monkeypatch.setattr(hl, "route_rows", counting_route_rows)
+    output = str(tmp_path / "report.txt")
+    parallel_report.write_report_from_csv(INVESTOR_ROWS, output, AS_OF, workers=2,
+                                          stock_file=SAMPLE + "Lesson6_Data_Stocks.csv",
+                                          bond_file=SAMPLE + "Lesson6_Data_Bonds.csv")
+    assert sorted(parsed) == [SAMPLE + "Lesson6_Data_Bonds.csv", SAMPLE + "Lesson6_Data_Stocks.csv"]
+
+
+def test_shard_worker_only_uses_the_rows_it_is_given(monkeypatch):
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("worker parsed a holdings file")
+    monkeypatch.setattr(hl, "iter_rows", no_parsing)
+    stocks = [[(1, ("IBM", "80", "150.37", "145.30", "5/12/2017"))], []]
+    bonds = [[], [(1, ("GT2:GOV", "200", "100.02", "100.05", "8/1/2014", "1.38", "1.35%"))]]
+    text = parallel_report._render_csv_shard(INVESTOR_ROWS, AS_OF, stocks, bonds)
+    bob, carl = text.split("#### Investment Report for ")[1:]
+    assert "IBM" in bob and "GT2:GOV" not in bob
+    assert "GT2:GOV" in carl and "IBM" not in carl
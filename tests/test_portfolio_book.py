@@ -0,0 +1,94 @@
+import contextlib
+import io
+import os
+import runpy
+
+import numpy as np
+import pytest
+
+import portfolio_book as pb
+from conftest import ROOT
+
+BOOK = {
+    "Bob": {"stock_symbols": ["GOOGL", "MSFT", "FB"], "shares": [125, 85, 150],
+            "purchase_price": [772.88, 56.60, 124.31], "current_price": [941.53, 73.04, 172.45]},
+    "Ann": {"stock_symbols": ["AIG"], "shares": [235], "purchase_price": [54.21], "current_price": [65.27]},
+    "Ragged": {"stock_symbols": ["GOOGL", "MSFT"], "shares": [125], "purchase_price": [772.88, 56.60],
+               "current_price": [941.53, 73.04]},
+    "Empty": {"stock_symbols": [], "shares": [], "purchase_price": [], "current_price": []},
+    "Pop": {"stock_symbols": ["MSFT", "YAHOO"], "shares": [85, 120], "purchase_price": [56.60, 144.31],
+            "current_price": [73.04, 172.45]},
+}
+
+
+def reference_report(stock_data_dict):
+    """Per investor validation and report loop of the original Nittala-3 script"""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        for investor, attributes in stock_data_dict.items():
+            symbols, shares = attributes["stock_symbols"], attributes["shares"]
+            purchase_price, current_price = attributes["purchase_price"], attributes["current_price"]
+            if not (len(symbols) > 0 and len(symbols) == len(shares) == len(purchase_price) == len(current_price)):
+                print("Please check lists for errors!!!")
+                continue
+            print("Stock ownership for " + str(investor))
+            print("--------------------------------------------\n")
+            print("STOCK", "\t", "SHARE#", "\t", "EARNINGS/LOSS")
+            print("--------------------------------------------")
+            for i in range(len(symbols)):
+                print(symbols[i], "\t", shares[i], "\t\t", round((current_price[i] - purchase_price[i]) * shares[i], 2))
+    return out.getvalue()
+
+
+def test_from_dict_packs_valid_investors_in_order():
+    book = pb.PortfolioBook.from_dict(BOOK)
+    assert book.investors == list(BOOK)
+    assert book.valid.tolist() == [True, True, False, False, True]
+    assert book.lot_counts().tolist() == [3, 1, 0, 0, 2]
+    assert book.symbols == ["GOOGL", "MSFT", "FB", "AIG", "YAHOO"]
+    assert book.shares.dtype == np.int64 and book.shares.tolist() == [125, 85, 150, 235, 85, 120]
+    position = book.position("Pop")
+    assert book.symbol_codes[book.investor_slice(position)].tolist() == [1, 4]
+
+
+def test_report_matches_the_original_loop():
+    out = io.StringIO()
+    pb.PortfolioBook.from_dict(BOOK).write_report(out)
+    assert out.getvalue() == reference_report(BOOK)
+
+
+def test_investor_totals():
+    def total(name):
+        attributes = BOOK[name]
+        return sum((current - purchase) * shares for shares, purchase, current in
+                   zip(attributes["shares"], attributes["purchase_price"], attributes["current_price"]))
+    totals = pb.PortfolioBook.from_dict(BOOK).investor_loss_gain()
+    np.testing.assert_allclose(totals, [total("Bob"), total("Ann"), 0.0, 0.0, total("Pop")])
+
+
+def test_fractional_shares_are_kept():
+    fractional = {"Bob": dict(BOOK["Bob"]), "Pop": dict(BOOK["Pop"], shares=[85, 12.5])}
+    book = pb.PortfolioBook.from_dict(fractional)
+    assert book.shares.dtype == np.float64 and book.shares.tolist() == [125, 85, 150, 85, 12.5]
+    out = io.StringIO()
+    book.write_report(out)
+    assert out.getvalue() == reference_report(fractional)
+    np.testing.assert_allclose(book.investor_loss_gain()[1], (73.04 - 56.60) * 85 + (172.45 - 144.31) * 12.5)
+    assert pb.PortfolioBook(["Bob"], [0, 1], ["IBM"], [0], [0.25], [1.0], [2.0]).shares.tolist() == [0.25]
+    whole = pb.PortfolioBook.from_dict({"Bob": dict(BOOK["Bob"], shares=[125.0, 85, 150])})
+    assert whole.shares.dtype == np.int64 and whole.shares.tolist() == [125, 85, 150]
+
+
+def test_bad_offsets_are_rejected():
+    with pytest.raises(ValueError, match="Offsets must rise"):
+        pb.PortfolioBook(["Bob", "Pop"], [0, 2, 1], ["IBM"], [0], [1], [1.0], [2.0])
+    with pytest.raises(ValueError, match="number of investors"):
+        pb.PortfolioBook(["Bob"], [0, 0, 1], ["IBM"], [0], [1], [1.0], [2.0])
+    with pytest.raises(ValueError, match="same length"):
+        pb.PortfolioBook(["Bob"], [0, 1], ["IBM"], [0], [1, 2], [1.0], [2.0])
+
+
+def test_week3_script_report(capsys):
+    namespace = runpy.run_path(os.path.join(ROOT, "Nittala-3(python assignment).py"), run_name="__main__")
+    stock_data_dict = namespace["stock_data_dict"]
+    assert capsys.readouterr().out == str(stock_data_dict) + "\n" + reference_report(stock_data_dict)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import price_analytics as pa
+
+CLOSE = np.array([10.0, 11.0, 12.0, 11.5, np.nan, 13.0, 12.0, 14.0, 15.0, 13.5])
+
+
+def naive_window(values, window, reduce):
+    result = np.full(len(values), np.nan)
+    for end in range(window, len(values) + 1):
+        chunk = values[end - window:end]
+        if not np.isnan(chunk).any():
+            result[end - 1] = reduce(chunk)
+    return result
+
+
+def test_moving_averages_match_a_naive_window():
+    averages = pa.moving_averages(CLOSE, (1, 3, 4))
+    for window in (1, 3, 4):
+        np.testing.assert_allclose(averages[window], naive_window(CLOSE, window, np.mean), equal_nan=True)
+
+
+def test_rolling_volatility_matches_sample_std():
+    returns = pa.daily_returns(CLOSE)
+    assert np.isnan(returns[0]) and returns[1] == pytest.approx(0.1)
+    volatility = pa.rolling_volatility(returns, (1, 3), annualize=None)
+    assert np.isnan(volatility[1]).all()
+    np.testing.assert_allclose(volatility[3], naive_window(returns, 3, lambda chunk: np.std(chunk, ddof=1)),
+                               equal_nan=True)
+    annual = pa.rolling_volatility(returns, (3,))
+    np.testing.assert_allclose(annual[3], volatility[3] * np.sqrt(pa.TRADING_DAYS), equal_nan=True)
+
+
+def test_drawdown_from_running_peak():
+    falls = pa.drawdown(CLOSE)
+    assert falls[2] == 0.0 and falls[3] == pytest.approx(11.5 / 12 - 1)
+    assert pa.max_drawdown(CLOSE) == pytest.approx(13.5 / 15.0 - 1)
+    assert pa.max_drawdown([]) == 0.0
+
+
+def test_indicators_by_symbol_and_bad_windows():
+    result = pa.indicators_by_symbol({"IBM": CLOSE, "F": CLOSE[:3]}, windows=(2,))
+    assert sorted(result) == ["F", "IBM"]
+    assert result["IBM"]["max_drawdown"] == pa.max_drawdown(CLOSE)
+    assert set(result["F"]["sma"]) == {2}
+    with pytest.raises(ValueError):
+        pa.moving_averages(CLOSE, (0,))
@@ -0,0 +1,66 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import date_parser as dp
+import price_cache as pc
+
+HISTORY = [{"Symbol": "AIG", "Date": "1-Jan-17", "Open": 58.91, "High": 59.5, "Low": 58.1, "Close": 59.0,
+            "Volume": 100},
+           {"Symbol": "IBM", "Date": "1-Jan-17", "Open": 150.0, "High": 151.0, "Low": 149.0, "Close": 150.5,
+            "Volume": 200},
+           {"Symbol": "AIG", "Date": "2-Jan-17", "Open": "-", "High": "-", "Low": "-", "Close": 59.25,
+            "Volume": "-"}]
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    path = str(tmp_path / "AllStocks.json")
+    with open(path, "w") as f:
+        json.dump(HISTORY, f)
+    builds = []
+    build_cache = pc.build_cache
+
+    def counting_build(*args, **kwargs):
+        builds.append(args[0])
+        return build_cache(*args, **kwargs)
+    monkeypatch.setattr(pc, "build_cache", counting_build)
+    return path, builds
+
+
+def test_symbols_load_as_memory_mapped_columns(history):
+    path, builds = history
+    aig = pc.load_symbol(path, "AIG")
+    assert isinstance(aig, np.memmap) and not aig.flags.writeable
+    assert aig["date"].tolist() == [dp.parse_epoch_day("1-Jan-17", pc.DATE_FORMAT),
+                                    dp.parse_epoch_day("2-Jan-17", pc.DATE_FORMAT)]
+    assert aig["open"][0] == 58.91 and np.isnan(aig["open"][1])
+    assert aig["close"].tolist() == [59.0, 59.25]
+    assert aig["volume"].tolist() == [100, pc.MISSING_VOLUME]
+    assert pc.symbols(path) == ["AIG", "IBM"]
+    assert len(pc.load_symbol(path, "XYZ")) == 0
+    assert len(builds) == 1
+
+
+def test_touched_but_unchanged_source_is_not_rebuilt(history):
+    path, builds = history
+    pc.open_cache(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    pc.open_cache(path)
+    assert len(builds) == 1
+    assert pc.read_manifest(pc.cache_dir_for(path))["mtime_ns"] == stat.st_mtime_ns + 10 ** 9
+
+
+def test_changed_source_rebuilds_and_drops_old_symbol_files(history):
+    path, builds = history
+    pc.open_cache(path)
+    with open(path, "w") as f:
+        json.dump([record for record in HISTORY if record["Symbol"] == "IBM"], f)
+    assert pc.symbols(path) == ["IBM"]
+    assert len(builds) == 2
+    cache_dir = pc.cache_dir_for(path)
+    assert sorted(os.listdir(cache_dir)) == ["00000.npy", pc.MANIFEST]
+    assert pc.load_symbol(path, "IBM")["close"].tolist() == [150.5]
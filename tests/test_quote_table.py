@@ -0,0 +1,102 @@
+import pytest
+
+import nittala_week_6 as w6
+from conftest import AS_OF
+from quote_table import QuoteTable
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def quotes(monkeypatch):
+    table = QuoteTable()
+    monkeypatch.setattr(w6.Stock, "quotes", table)
+    return table
+
+
+def ibm_investor(compact):
+    investor_obj = w6.Investor(1, "Bob", "Address", "555", compact=compact)
+    investor_obj.add_stock(w6.Stock(1, "IBM", 150.0, 160.0, 10, AS_OF, "5/12/2017"))
+    investor_obj.add_stock(w6.Stock(2, "IBM", 150.0, 170.0, 10, AS_OF, "1/3/2014"))
+    investor_obj.add_stock(w6.Stock(3, "F", 10.0, 12.0, 5, AS_OF, "2/17/2017"))
+    return investor_obj
+
+
+def test_lots_of_one_symbol_keep_their_own_prices(quotes):
+    investor_obj = ibm_investor(False)
+    assert [lot.current_price for lot in investor_obj._list_of_stocks] == [160.0, 170.0, 12.0]
+    assert [lot.loss_gain for lot in investor_obj._list_of_stocks] == [100.0, 200.0, 10.0]
+    assert len(quotes) == 0
+    investor_obj._list_of_stocks[0].current_price = 155.0
+    assert [lot.loss_gain for lot in investor_obj._list_of_stocks] == [50.0, 200.0, 10.0]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_revalue_applies_quoted_symbols_only(quotes, compact):
+    investor_obj = ibm_investor(compact)
+    assert investor_obj.revalue() == 310.0
+    quotes.update("IBM", 200.0)
+    assert investor_obj.revalue() == 1010.0
+    assert investor_obj.revalue({"F": 20.0}) == 1050.0
+    assert [lot.current_price for lot in investor_obj._list_of_stocks] == [200.0, 200.0, 20.0]
+
+
+def test_compact_snapshots_do_not_write_the_quote_table(quotes):
+    investor_obj = ibm_investor(True)
+    quotes.update("IBM", 200.0)
+    assert [lot.current_price for lot in investor_obj._list_of_stocks] == [160.0, 170.0, 12.0]
+    assert quotes.get("IBM").price == 200.0
+    assert investor_obj.revalue() == 1010.0
+
+
+def test_least_recently_used_quotes_are_evicted():
+    table = QuoteTable(maxsize=2)
+    table.update("A", 1)
+    table.update("B", 2)
+    table.applied(["A", "B"])
+    table.get("A")
+    table.update("C", 3)
+    assert "B" not in table and "A" in table and "C" in table
+    assert table.prices(["A", "B", "C"]) == {"A": 1.0, "C": 3.0}
+
+
+def test_pending_quotes_are_never_evicted():
+    table = QuoteTable(maxsize=1)
+    table.update("A", 1)
+    table.update("B", 2)
+    assert len(table) == 2 and table.pending() == ["A", "B"]
+    table.applied(["A"])
+    assert "A" not in table and table.pending() == ["B"]
+    table.update("A", 3)
+    assert table.prices(["A", "B"]) == {"A": 3.0, "B": 2.0}
+
+
+def test_quotes_go_stale_after_the_ttl():
+    clock = Clock()
+    table = QuoteTable(ttl=60, clock=clock)
+    table.update("A", 1)
+    clock.now = 30
+    table.update("B", 2)
+    clock.now = 75
+    assert table.stale_symbols() == ["A"]
+    assert table.is_stale("A") and not table.is_stale("B") and table.is_stale("unknown")
+    assert table.prices(["A", "B"]) == {"B": 2.0}
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_revalue_skips_stale_quotes(monkeypatch, compact):
+    clock = Clock()
+    table = QuoteTable(ttl=60, clock=clock)
+    monkeypatch.setattr(w6.Stock, "quotes", table)
+    investor_obj = ibm_investor(compact)
+    table.update("IBM", 200.0)
+    clock.now = 61
+    assert investor_obj.revalue() == 310.0
+    assert investor_obj.revalue({"F": 20.0}) == 350.0
+    assert [lot.current_price for lot in investor_obj._list_of_stocks] == [160.0, 170.0, 20.0]
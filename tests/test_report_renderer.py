@@ -0,0 +1,84 @@
+import io
+
+import numpy as np
+import pytest
+
+import nittala_week_6 as w6
+import report_renderer as rr
+import StockCalculator as sc
+from conftest import AS_OF
+
+
+class CountingFile(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def investor():
+    investor_obj = w6.Investor(1, "Bob", "71 Pilgrim Avenue", "303-303-3033")
+    investor_obj.add_stock(w6.Stock(1, "RENDER", 772.88, 941.53, 125, AS_OF, "8/1/2015"))
+    investor_obj.add_bond(w6.Bond(2, "RENDERB", 100.02, 100.05, 200, AS_OF, "8/1/2014", 1.38, "1.35%"))
+    return investor_obj
+
+
+def test_block_matches_row_by_row_output():
+    investor_obj = investor()
+    expected = io.StringIO()
+    expected.write(rr.INVESTOR_HEADER("Bob", "71 Pilgrim Avenue", "303-303-3033") + rr.STOCK_HEADER)
+    investor_obj._list_of_stocks[0].stock_report(expected)
+    expected.write(rr.BOND_HEADER)
+    investor_obj._list_of_bonds[0].bond_report(expected)
+    expected.write(rr.INVESTOR_FOOTER)
+    assert rr.render_investor_block(investor_obj) == expected.getvalue()
+
+
+def test_values_are_formatted_like_the_original_report():
+    assert rr.format_loss_gain(21081.249999999996) == "21081.25"
+    assert rr.format_annual_percent_yield_loss(-1.0) == "-1.0%"
+    assert rr.STOCK_ROW("IBM", "80", "1.0", "2.0%") == "\n" + "".join(v.ljust(16) for v in ("IBM", "80", "1.0", "2.0%"))
+
+
+def test_renderer_buffers_until_flush_size():
+    block = rr.render_investor_block(investor())
+    out = CountingFile()
+    with rr.ReportRenderer(out, flush_size=len(block) * 3) as renderer:
+        for _ in range(5):
+            renderer.render_investor(investor())
+        assert out.writes == 1
+    assert out.writes == 2
+    assert out.getvalue() == block * 5
+
+
+def test_column_block_matches_the_lot_block():
+    investor_obj = investor()
+    investor_obj.add_stock(w6.Stock(3, "MSFT", 56.60, 73.04, 85, AS_OF, "8/1/2015"))
+    stocks = sc.Portfolio.from_lots(investor_obj._list_of_stocks)
+    bonds = sc.Portfolio.from_lots(investor_obj._list_of_bonds)
+    block = rr.render_columns_block("Bob", "71 Pilgrim Avenue", "303-303-3033", rr.portfolio_columns(stocks, AS_OF),
+                                    rr.portfolio_columns(bonds, AS_OF) + (np.array(["1.38"], dtype=object),
+                                                                         ["1.35%"]))
+    assert block == rr.render_investor_block(investor_obj)
+
+
+def test_column_block_without_lots():
+    empty = w6.Investor(1, "Bob", "71 Pilgrim Avenue", "303-303-3033")
+    assert rr.render_columns_block("Bob", "71 Pilgrim Avenue", "303-303-3033", None) == rr.render_investor_block(empty)
+
+
+def test_renderer_buffers_column_blocks():
+    out = io.StringIO()
+    with rr.ReportRenderer(out) as renderer:
+        renderer.render_columns("Bob", "Address", "555", (["IBM"], [80], [-405.6], [-1.2345]))
+        assert out.getvalue() == ""
+    assert "\n" + "IBM".ljust(16) + "80".ljust(16) + "-405.6".ljust(16) + "-1.23%".ljust(16) in out.getvalue()
+
+
+def test_lots_not_bought_before_the_valuation_date_are_rejected():
+    book = sc.Portfolio(["IBM"], [80], [150.37], [145.30], [AS_OF])
+    with pytest.raises(ValueError, match="prior to today"):
+        rr.portfolio_columns(book, AS_OF)
@@ -0,0 +1,29 @@
+import pytest
+
+import nittala_week_6 as w6
+import week_7_nittala as w7
+from conftest import golden_report, sorted_lines
+
+DATASETS = ["sample", "dupes"]
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_week6_report_matches_original(run_report, dataset):
+    assert run_report(w6, dataset) == golden_report(dataset, "week6")
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_week7_report_matches_original(run_report, dataset):
+    assert sorted_lines(run_report(w7, dataset)) == sorted_lines(golden_report(dataset, "week7"))
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+@pytest.mark.parametrize("options", [{"render_columns": True}, {"render_columns": True, "columnar": True},
+                                     {"render_columns": True, "parse_workers": 2}])
+def test_week6_column_render_matches_original(run_report, dataset, options):
+    assert run_report(w6, dataset, **options) == golden_report(dataset, "week6")
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_week7_column_render_matches_original(run_report, dataset):
+    assert sorted_lines(run_report(w7, dataset, render_columns=True)) == sorted_lines(golden_report(dataset, "week7"))
@@ -0,0 +1,44 @@
+import nittala_week4 as w4
+import schema_validator as sv
+
+
+def investor(**changes):
+    attributes = {'stock_symbols': ['GOOGL', 'MSFT'], 'shares': [125, 85], 'purchase_price': [772.88, 56.60],
+                  'current_price': [941.53, 73.04], 'purchase_date': ['8/1/2015', '8/1/2015'],
+                  'current_date': ['10/8/2017', '10/8/2017']}
+    attributes.update(changes)
+    return attributes
+
+
+def test_valid_investor_has_no_errors():
+    result = w4.STOCK_SCHEMA.validate(investor(), "Bob")
+    assert result and result.valid and result.errors == []
+    assert str(result) == "Bob: valid"
+
+
+def test_every_problem_is_reported_in_one_pass():
+    attributes = investor(shares=[125, "85"], purchase_price=[772.88], purchase_date=['8/1/2015', '2015-08-01'])
+    del attributes['current_price']
+    result = w4.STOCK_SCHEMA.validate(attributes, "Bob")
+    assert not result
+    assert [(error.field, error.kind, error.index) for error in result.errors] == [
+        ('shares', sv.TYPE, 1), ('purchase_price', sv.LENGTH, None), ('current_price', sv.MISSING_KEY, None),
+        ('purchase_date', sv.BAD_DATE, 1)]
+    assert "shares[1]: wrong type ('85')" in str(result)
+
+
+def test_container_problems():
+    assert w4.STOCK_SCHEMA.validate(["GOOGL"]).kinds() == {sv.NOT_A_DICT}
+    assert sv.NOT_A_LIST in w4.STOCK_SCHEMA.validate(investor(shares=125)).kinds()
+    empty = dict((key, []) for key in w4.STOCK_SCHEMA.keys())
+    assert w4.STOCK_SCHEMA.validate(empty).kinds() == {sv.EMPTY}
+
+
+def test_validate_many_extracts_nested_attributes():
+    schema = sv.InvestorSchema([('symbol', str), ('bought', sv.DATE)], date_format="%d-%b-%y")
+    data = {'Bob': {'investor_data': {'Stocks': {'symbol': ['IBM'], 'bought': ['12-Apr-17']}}},
+            'Carl': {'investor_data': {}}}
+    results = schema.validate_many(data, lambda value: value['investor_data']['Stocks'])
+    assert results['Bob'].valid
+    assert results['Carl'].kinds() == {sv.MISSING_KEY}
+    assert w4.validate_investors({'Bob': investor(), 'Carl': investor(shares=[1.5, 2])})['Carl'].kinds() == {sv.TYPE}
@@ -0,0 +1,64 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+import StockCalculator as sc
+
+PURCHASE = [772.88, 56.60, 49.58, 30.30]
+CURRENT = [941.53, 73.04, 55.74, 23.98]
+SHARES = [125, 85, 400, 425]
+DATES = ["8/1/2015", "8/1/2015", "8/1/2015", "1/10/2017"]
+
+
+def scalar_loss_gain(purchase_price, current_price, shares):
+    return round((current_price - purchase_price) * shares, 2)
+
+
+def test_to_epoch_day_accepts_every_date_form():
+    day = sc.to_epoch_day(date(2015, 8, 1))
+    assert sc.to_epoch_day("8/1/2015") == day
+    assert sc.to_epoch_day(datetime(2015, 8, 1, 13, 45)) == day
+    assert sc.to_epoch_day(day) == day
+    assert sc.to_date(day) == date(2015, 8, 1)
+
+
+def test_to_epoch_days_parses_each_distinct_value():
+    days = sc.to_epoch_days(DATES)
+    assert days.dtype == np.int32
+    assert days.tolist() == [sc.to_epoch_day(text) for text in DATES]
+    assert sc.to_epoch_days([]).tolist() == []
+
+
+def test_column_loss_gain_matches_scalar_math():
+    gains = sc.calculate_loss_gain(PURCHASE, CURRENT, SHARES)
+    assert gains.tolist() == [scalar_loss_gain(*lot) for lot in zip(PURCHASE, CURRENT, SHARES)]
+
+
+def test_scalar_and_indexed_forms():
+    assert sc.calculate_loss_gain(PURCHASE[0], CURRENT[0], SHARES[0]) == 21081.25
+    assert sc.calculate_loss_gain(3, PURCHASE, CURRENT, SHARES) == scalar_loss_gain(30.30, 23.98, 425)
+    with pytest.raises(TypeError):
+        sc.calculate_loss_gain(1, 2)
+
+
+def test_percent_yield_loss_matches_day_count():
+    as_of = "10/18/2026"
+    expected = [round((((c - p) / p) / (sc.to_epoch_day(as_of) - sc.to_epoch_day(d))) * 100 * 365, 2)
+                for p, c, d in zip(PURCHASE, CURRENT, DATES)]
+    yields = sc.calculate_percent_yield_loss(PURCHASE, CURRENT, [as_of] * 4, DATES)
+    assert yields.tolist() == expected
+    assert sc.calculate_percent_yield_loss(0, PURCHASE, CURRENT, [as_of] * 4, DATES) == expected[0]
+
+
+def test_portfolio_values_the_whole_book():
+    book = sc.Portfolio(["GOOGL", "MSFT", "RDS-A", "M"], SHARES, PURCHASE, CURRENT, DATES)
+    assert len(book) == 4
+    assert book.total_loss_gain() == pytest.approx(sum((c - p) * s for p, c, s in zip(PURCHASE, CURRENT, SHARES)))
+    assert book.held_days(date(2026, 10, 18)).tolist() == [
+        sc.to_epoch_day("10/18/2026") - sc.to_epoch_day(d) for d in DATES]
+
+
+def test_portfolio_rejects_ragged_columns():
+    with pytest.raises(ValueError):
+        sc.Portfolio(["GOOGL"], [1, 2], [1.0], [2.0], ["8/1/2015"])
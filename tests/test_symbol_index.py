@@ -0,0 +1,87 @@
+import pytest
+
+import nittala_week_6 as w6
+from quote_table import QuoteTable
+import symbol_index as si
+from conftest import AS_OF, DATA_DIR, copy_dataset
+
+DUPES = DATA_DIR + "/dupes/"
+
+
+@pytest.fixture
+def indexed():
+    index = si.SymbolIndex()
+    investors = [w6.Investor(1, "Bob", "Address", "555", index=index),
+                 w6.Investor(2, "Carl", "Address", "555", index=index, compact=True)]
+    w6.load_stock_data(AS_OF, investors, DUPES + "Lesson6_Data_Stocks.csv", verbose=False)
+    w6.load_bond_data(AS_OF, investors, DUPES + "Lesson6_Data_Bonds.csv", verbose=False)
+    return index, investors
+
+
+def walk(investors, symbol):
+    """Answer the lookup the slow way, by walking every investor's lots"""
+    lots = [(investor_obj, lot) for investor_obj in investors
+            for lot in list(investor_obj._list_of_stocks) + list(investor_obj._list_of_bonds)
+            if lot._stock_symbol == symbol]
+    return {"shares": sum(lot._shares for _, lot in lots),
+            "cost": sum(lot._purchase_price * lot._shares for _, lot in lots),
+            "market_value": sum(lot._current_price * lot._shares for _, lot in lots),
+            "loss_gain": sum(lot.loss_gain for _, lot in lots)}
+
+
+def test_index_answers_match_walking_every_investor(indexed):
+    index, investors = indexed
+    assert sorted(index.symbols()) == ["GOOGL", "GT10:GOV", "GT2:GOV", "IBM", "MSFT"]
+    for symbol in index.symbols():
+        assert index.exposure(symbol) == pytest.approx(walk(investors, symbol))
+        assert index.holders(symbol) == investors
+    assert index.holdings_by_investor("IBM") == {1: 135, 2: 135}
+    assert len(index.postings("IBM")) == 6
+
+
+def test_unknown_symbol_is_empty(indexed):
+    index, _ = indexed
+    assert "XYZ" not in index
+    assert index.holders("XYZ") == [] and index.holdings_by_investor("XYZ") == {}
+    assert index.exposure("XYZ")["shares"] == 0
+
+
+def test_revalue_reprices_every_holder_once(indexed, monkeypatch):
+    index, investors = indexed
+    quotes = QuoteTable()
+    monkeypatch.setattr(w6.Stock, "quotes", quotes)
+    calls = []
+    revalue = w6.Investor.revalue
+
+    def counted(investor_obj, prices=None):
+        calls.append(investor_obj._investor_id)
+        return revalue(investor_obj, prices)
+    monkeypatch.setattr(w6.Investor, "revalue", counted)
+    totals = index.revalue(quotes, {"IBM": 200.0, "MSFT": 50.0, "XYZ": 1.0})
+    assert sorted(calls) == [1, 2]
+    assert totals == dict((investor_obj._investor_id, revalue(investor_obj)) for investor_obj in investors)
+    assert quotes.pending() == [] and "XYZ" in quotes
+    assert all(lot._current_price == 200.0 for investor_obj in investors for lot in investor_obj._list_of_stocks
+               if lot._stock_symbol == "IBM")
+    assert index.revalue(quotes) == {}
+
+
+def test_exposure_reads_compact_lots_after_revalue(indexed, monkeypatch):
+    index, investors = indexed
+    monkeypatch.setattr(w6.Stock, "quotes", QuoteTable())
+    for investor_obj in investors:
+        investor_obj.revalue({"IBM": 200.0})
+    assert index.exposure("IBM") == pytest.approx(walk(investors, "IBM"))
+    assert index.exposure("IBM")["market_value"] == 270 * 200.0
+    assert all(lot._current_price == 200.0 for _, lot in index.postings("IBM"))
+    compact = [lots for investor_obj, lots, _ in index._symbols["IBM"].postings if investor_obj is investors[1]]
+    assert compact and all(lots is investors[1]._list_of_stocks for lots in compact)
+
+
+def test_main_prints_holders(tmp_path, monkeypatch, fixed_clock, capsys):
+    monkeypatch.chdir(tmp_path)
+    copy_dataset("dupes", tmp_path)
+    w6.main(holders=["IBM", "XYZ"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-2].startswith("IBM: 270 shares") and lines[-2].endswith("holders: Bob (135), Carl (135)")
+    assert lines[-1] == "XYZ: 0 shares, market value 0.00, loss/gain 0.00; holders: none"
@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+
+import bench_suite
+import holdings_loader as hl
+import json_stream as js
+import synthetic_data as sd
+
+
+def read_bytes(paths):
+    result = {}
+    for name, path in paths.items():
+        with open(path, "rb") as f:
+            result[name] = f.read()
+    return result
+
+
+def test_same_seed_and_size_give_identical_files(tmp_path):
+    first = read_bytes(sd.generate(str(tmp_path / "a"), 200, investors=3))
+    second = read_bytes(sd.generate(str(tmp_path / "b"), 200, investors=3))
+    assert first == second
+    assert read_bytes(sd.generate(str(tmp_path / "c"), 200, investors=3, seed=8)) != first
+
+
+def test_generated_files_load_with_the_real_readers(tmp_path):
+    paths = sd.generate(str(tmp_path), 200, investors=3)
+    stocks = list(hl.iter_rows(paths["stock"], hl.STOCK_COLUMNS))
+    bonds = list(hl.iter_rows(paths["bond"], hl.BOND_COLUMNS, "Bond"))
+    assert (len(stocks), len(bonds)) == (200, 20)
+    assert set(investor_id for _, investor_id, _ in stocks) == {1, 2, 3}
+    records = list(js.iter_json_array(paths["price"]))
+    assert len(records) == 200 and set(record["Symbol"] for record in records) == set(sd.SYMBOLS)
+    assert any(record["Open"] == js.MISSING for record in records)
+    shared = list(hl.iter_rows(sd.generate(str(tmp_path / "shared"), 10)["stock"], hl.STOCK_COLUMNS))
+    assert set(investor_id for _, investor_id, _ in shared) == {None}
+
+
+def test_bench_suite_writes_only_under_its_workdir(tmp_path, monkeypatch):
+    cwd = tmp_path / "cwd"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    workdir = str(tmp_path / "work")
+    monkeypatch.setattr(sys, "argv", ["bench_suite.py", "--sizes", "200", "--workdir", workdir])
+    bench_suite.main()
+    assert os.listdir(str(cwd)) == []
+    with open(os.path.join(workdir, bench_suite.RESULTS_FILE)) as f:
+        stages = [result["stage"] for result in json.load(f)["results"]]
+    assert stages[0] == "generate" and "db_reload" in stages and stages[-1] == "plot"
@@ -7,40 +7,86 @@
 ################################################################
 """
 
+import argparse
+import contextlib
+import os
 import sqlite3
+import sys
 from datetime import datetime, date
-import os
 import uuid
 
+import async_pipeline
+import holdings_loader as hl
+import incremental_report as ir
+import investment_db as idb
+from lot_store import LotArray, SYMBOL
+import metrics
+import parallel_report
+from quote_table import DEFAULT_QUOTES
+import report_renderer as rr
+import StockCalculator as sc
+
 
 class Investor(object):
-    def __init__(self, investor_id, first_name, address, phone_number):
+    __slots__ = ("_investor_id", "_first_name", "_address", "_phone_number", "_list_of_stocks", "_list_of_bonds",
+                 "_index")
+
+    def __init__(self, investor_id, first_name, address, phone_number, compact=False, index=None):
         """Initialize the investor.
+        :param compact: Keep lots in array backed containers instead of lists of objects
+        :param index: Optional SymbolIndex updated with every stock and bond added
         """
         self._investor_id = investor_id
         self._first_name = first_name
         self._address = address
         self._phone_number = phone_number
-        self._list_of_stocks = []
-        self._list_of_bonds = []
+        self._list_of_stocks = LotArray(Stock) if compact else []
+        self._list_of_bonds = LotArray(Bond) if compact else []
+        self._index = index
 
     def add_stock(self, stock):
         """
         :param stock: This is the current Stock Object
         """
         self._list_of_stocks.append(stock)
+        if self._index is not None:
+            self._index.add(self, self._list_of_stocks, len(self._list_of_stocks) - 1)
 
     def add_bond(self, bond):
         """
         :param bond: This is the current Bond Object
         """
         self._list_of_bonds.append(bond)
+        if self._index is not None:
+            self._index.add(self, self._list_of_bonds, len(self._list_of_bonds) - 1)
+
+    def revalue(self, prices=None):
+        """Reprice the investor's lots from the shared quote table and return the total loss or gain.
+        Lots of symbols without a quote keep the price they were loaded with.
+        :param prices: Optional dictionary of symbol -> current price, stored in the quote table first
+        """
+        if prices:
+            Stock.quotes.update_many(prices)
+        total = 0.0
+        for lots in (self._list_of_stocks, self._list_of_bonds):
+            if isinstance(lots, LotArray):
+                lots.set_prices(Stock.quotes.prices(set(lots.column("_stock_symbol"))))
+                total += lots.total_loss_gain()
+                continue
+            quoted = Stock.quotes.prices(set(lot._stock_symbol for lot in lots))
+            for lot in lots:
+                if lot._stock_symbol in quoted:
+                    lot.current_price = quoted[lot._stock_symbol]
+                total += lot.loss_gain
+        return total
+
+    def to_row(self):
+        """Investor table row for this investor"""
+        return self._investor_id, self._first_name, self._address, self._phone_number
 
     def insert_investor(self, conn):
         cur = conn.cursor()
-        investor_data = [self._investor_id, self._first_name, self._address, self._phone_number]
-        cur.execute("""INSERT INTO investor(investor_id, first_name, address, phone_number) VALUES(?, ?, ?, ?);""",
-                    investor_data)
+        cur.execute(idb.INSERT_INVESTOR, self.to_row())
 
         for stock in self._list_of_stocks:
             stock.insert_stock(cur, self._investor_id)
@@ -52,35 +98,21 @@ class Investor(object):
 
     def print_investments(self, cur, report):
         """Print each of the investor's investments into a report file"""
-        report.write("##################################################")
-        report.write("\n#### Investment Report for {0}".format(self._first_name))
-        report.write("\n#### Address:- {0}".format(self._address))
-        report.write("\n#### Phone:- {0}".format(self._phone_number))
-        report.write("\n##################################################")
-
-        # Stock headers
-        report.write('\n-------------------------------------------------------------------------------------')
-        report.write('\n{:<16}{:<16}{:<16}{:<16}'.format('STOCK', '#SHARES', 'EARNINGS/LOSS', 'YEARLY RATE'))
-        report.write('\n-------------------------------------------------------------------------------------')
-        for stock in self._list_of_stocks:
-            stock.stock_report(report)
-
-        # Bond headers
-        report.write('\n\n-------------------------------------------------------------------------------------')
-        report.write(
-            '\n{:<16}{:<16}{:<16}{:<16}{:<16}{:<16}'.format('BOND', '#QTY', 'EARNINGS/LOSS', 'YEARLY RATE',
-                                                            'COUPON', 'YIELD'))
-        report.write('\n-------------------------------------------------------------------------------------')
-        for bond in self._list_of_bonds:
-            bond.bond_report(report)
-        report.write('\n\n\n\n')
+        report.write(rr.render_investor_block(self))
 
 
 class Stock(object):
+    __slots__ = ("_purchase_id", "_stock_symbol", "_purchase_price", "_current_price", "_shares", "_purchase_day",
+                 "_loss_gain", "_annual_percent_yield_loss")
+    compact_fields = (("_purchase_id", "q"), ("_stock_symbol", SYMBOL), ("_purchase_price", "d"),
+                      ("_current_price", "d"), ("_shares", "q"), ("_purchase_day", "i"))
+    as_of_date = None
+    quotes = DEFAULT_QUOTES
+
     def __init__(self, purchase_id, stock_symbol, purchase_price, current_price, shares, purchase_date):
         """Assign values to stock attributes"""
         self._purchase_id = purchase_id
-        self._stock_symbol = stock_symbol
+        self._stock_symbol = sys.intern(stock_symbol)
 
         try:
             self._purchase_price = float(purchase_price)
@@ -101,47 +133,102 @@ class Stock(object):
             raise
 
         try:
-            self._purchase_date = datetime.strptime(purchase_date, "%m/%d/%Y").date()
+            self._purchase_day = sc.to_epoch_day(purchase_date)
         except Exception as e:
             print(str(e))
             raise
 
-        if (date.today() - self._purchase_date).days <= 0:
+        if sc.to_epoch_day(self.get_as_of_date()) - self._purchase_day <= 0:
             raise ValueError("Purchase Date should be prior to today")
 
-        self._loss_gain = self.calculate_loss_gain()
-        self._annual_percent_yield_loss = self.calculate_annual_percent_yield_loss()
+        # Results are computed on first use and recomputed when the price changes
+        self._loss_gain = None
+        self._annual_percent_yield_loss = None
+
+    @classmethod
+    def get_as_of_date(cls):
+        """Valuation date shared by every Stock and Bond in this run"""
+        if Stock.as_of_date is None:
+            Stock.as_of_date = date.today()
+        return Stock.as_of_date
+
+    @classmethod
+    def set_as_of_date(cls, as_of_date):
+        """Set the valuation date for the run. Yields computed against another date are recomputed on access."""
+        Stock.as_of_date = sc.to_date(as_of_date)
+
+    @property
+    def _purchase_date(self):
+        return sc.to_date(self._purchase_day)
+
+    @property
+    def current_price(self):
+        return self._current_price
+
+    @current_price.setter
+    def current_price(self, current_price):
+        """Reprice this lot only; Investor.revalue applies shared quotes"""
+        self._current_price = float(current_price)
+
+    @property
+    def loss_gain(self):
+        """Loss or gain as a number"""
+        price = self._current_price
+        if self._loss_gain is None or self._loss_gain[0] != price:
+            self._loss_gain = price, self.calculate_loss_gain()
+        return self._loss_gain[1]
+
+    @property
+    def annual_percent_yield_loss(self):
+        """Annual percent yield or loss as a number"""
+        key = (self.get_as_of_date(), self._current_price)
+        if self._annual_percent_yield_loss is None or self._annual_percent_yield_loss[0] != key:
+            self._annual_percent_yield_loss = (key, self.calculate_annual_percent_yield_loss())
+        return self._annual_percent_yield_loss[1]
 
     def calculate_loss_gain(self):
         """Calculates the loss or gain
         """
-        return str(round((self._current_price - self._purchase_price) * self._shares, 2))
+        return (self._current_price - self._purchase_price) * self._shares
 
     def calculate_annual_percent_yield_loss(self):
         """Calculates the annual percent yield or loss
         """
 
-        days = (date.today() - self._purchase_date).days
-        return str(round(
-            (((self._current_price - self._purchase_price) / self._purchase_price) / days) * 100 * 365, 2)) + "%"
+        days = sc.to_epoch_day(self.get_as_of_date()) - self._purchase_day
+        return (((self._current_price - self._purchase_price) / self._purchase_price) / days) * 100 * 365
+
+    def format_loss_gain(self):
+        """Loss or gain as it is printed in the report"""
+        return rr.format_loss_gain(self.loss_gain)
+
+    def format_annual_percent_yield_loss(self):
+        """Annual percent yield or loss as it is printed in the report"""
+        return rr.format_annual_percent_yield_loss(self.annual_percent_yield_loss)
+
+    def report_values(self):
+        """Report columns for this stock"""
+        return self._stock_symbol, str(self._shares), self.format_loss_gain(), self.format_annual_percent_yield_loss()
+
+    def to_row(self, investor_id):
+        """Stock table row for this stock"""
+        return (self._purchase_id, investor_id, self._stock_symbol, self._purchase_price, self._current_price,
+                self._shares, self._purchase_day)
 
     def insert_stock(self, cur, investor_id):
         """Insert Stock Record into database"""
-        stock_data = [self._purchase_id, investor_id, self._stock_symbol, self._purchase_price, self._current_price,
-                      self._shares, self._purchase_date.strftime("%m/%d/%Y")]
-        cur.execute("""INSERT INTO stock(purchase_id, investor_id, stock_symbol, purchase_price, current_price, number_of_shares, purchase_date) 
-        VALUES (?, ?, ?, ?, ?, ?, ?)""", stock_data)
+        cur.execute(idb.INSERT_STOCK, self.to_row(investor_id))
 
     def stock_report(self, report_file):
         """Print stock report for a given investor
         """
-
-        report_file.write(
-            "\n{:<16}{:<16}{:<16}{:<16}".format(str(self._stock_symbol), str(self._shares), str(self._loss_gain),
-                                                str(self._annual_percent_yield_loss)))
+        report_file.write(rr.STOCK_ROW(*self.report_values()))
 
 
 class Bond(Stock):
+    __slots__ = ("_coupon", "_yld")
+    compact_fields = Stock.compact_fields + (("_coupon", SYMBOL), ("_yld", SYMBOL))
+
     def __init__(self, purchase_id, symbol, purchase_price, current_price, shares, purchase_date, coupon,
                  yld):
         """Assign values to Bond attributes."""
@@ -149,152 +236,122 @@ class Bond(Stock):
         self._coupon = coupon
         self._yld = yld
 
+    def to_row(self, investor_id):
+        """Bond table row for this bond"""
+        return (self._purchase_id, investor_id, self._stock_symbol, self._purchase_price, self._current_price,
+                self._shares, self._purchase_day, self._coupon, self._yld)
+
     def insert_bond(self, cur, investor_id):
         """Insert Bond Record into database"""
-        bond_data = [self._purchase_id, investor_id, self._stock_symbol, self._purchase_price, self._current_price,
-                     self._shares, self._purchase_date.strftime("%m/%d/%Y"), self._coupon, self._yld]
-        cur.execute("""INSERT INTO bond(purchase_id, investor_id, stock_symbol, purchase_price, current_price, number_of_shares, purchase_date, coupon, yld) 
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""", bond_data)
+        cur.execute(idb.INSERT_BOND, self.to_row(investor_id))
+
+    def report_values(self):
+        """Report columns for this bond"""
+        return super().report_values() + (str(self._coupon), str(self._yld))
 
     def bond_report(self, report_file):
         """Print bond report for all investors
         """
+        report_file.write(rr.BOND_ROW(*self.report_values()))
 
-        report_file.write("\n{:<16}{:<16}{:<16}{:<16}{:<16}{:<16}".format(str(self._stock_symbol), str(self._shares),
-                                                                          str(self._loss_gain),
-                                                                          str(self._annual_percent_yield_loss),
-                                                                          str(self._coupon), str(self._yld)))
 
+def _new_purchase_id():
+    """Generate a unique purchase id for a lot"""
+    return int(str(uuid.uuid4().time).replace("L", ""))
 
-def load_stock_data(today, investor_obj):
-    """Loads and adds stock data for a given investor object"""
-    try:
-        file_path = "Lesson6_Data_Stocks.csv"
-        if os.path.exists(file_path):
-            with open(file_path, "r") as stockFile:
-                header = []
-                for index, row in enumerate(stockFile):
-                    uid = int(str(uuid.uuid4().time).replace("L", ""))
-                    attributes = row.split(",")
-                    if index == 0:
-                        header = attributes
-                    else:
-                        if all(col in header for col in
-                               ["SYMBOL", "NO_SHARES", "PURCHASE_PRICE", "CURRENT_VALUE", "PURCHASE_DATE\n"]):
-                            symbol_index = header.index("SYMBOL")
-                            symbol = attributes[symbol_index]
-                            symbol_index = header.index("NO_SHARES")
-                            shares = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_PRICE")
-                            purchase_price = attributes[symbol_index]
-                            symbol_index = header.index("CURRENT_VALUE")
-                            current_value = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_DATE\n")
-                            purchase_date = attributes[symbol_index]
-                            stock = Stock(uid, symbol, purchase_price, current_value, shares, purchase_date.strip())
-                            investor_obj.add_stock(stock)
-                        else:
-                            raise ValueError("Incorrect Columns in Stock file")
-                stockFile.close()
-        else:
-            raise FileNotFoundError(
-                "Stock File not found!! Please make sure input file exists in same directory as the Python program.")
-    except Exception as e:
-        raise e
 
+def _investor_map(investors):
+    """Accept a single Investor or a list of them and key them by investor id"""
+    if isinstance(investors, Investor):
+        investors = [investors]
+    return dict((investor_obj._investor_id, investor_obj) for investor_obj in investors)
 
-def load_bond_data(today, investor_obj):
-    """Loads and adds Bond data for a given investor object"""
-    try:
-        file_path = "Lesson6_Data_Bonds.csv"
-        if os.path.exists(file_path):
-            with open(file_path, "r") as bondFile:
-                header = []
-                for index, row in enumerate(bondFile):
-                    uid = int(str(uuid.uuid4().time).replace("L", ""))
-                    attributes = row.split(",")
-                    if index == 0:
-                        header = attributes
-                    else:
-                        if all(col in header for col in
-                               ["SYMBOL", "NO_SHARES", "PURCHASE_PRICE", "CURRENT_VALUE", "PURCHASE_DATE", "Coupon",
-                                "Yield\n"]):
-                            symbol_index = header.index("SYMBOL")
-                            symbol = attributes[symbol_index]
-                            symbol_index = header.index("NO_SHARES")
-                            shares = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_PRICE")
-                            purchase_price = attributes[symbol_index]
-                            symbol_index = header.index("CURRENT_VALUE")
-                            current_value = attributes[symbol_index]
-                            symbol_index = header.index("PURCHASE_DATE")
-                            purchase_date = attributes[symbol_index]
-                            symbol_index = header.index("Coupon")
-                            coupon = attributes[symbol_index]
-                            symbol_index = header.index("Yield\n")
-                            yld = attributes[symbol_index]
-                            bond = Bond(uid, symbol, purchase_price, current_value, shares, purchase_date, coupon,
-                                        yld.strip())
-                            investor_obj.add_bond(bond)
-                        else:
-                            raise ValueError("Incorrect Columns in Bond file")
-                bondFile.close()
-        else:
-            raise FileNotFoundError(
-                "Bond File not found!! Please make sure input file exists in same directory as the Python program.")
-    except Exception as e:
-        raise e
 
+def stock_from_values(values):
+    """Build a Stock from the hl.STOCK_COLUMNS values of a holdings row"""
+    symbol, shares, purchase_price, current_value, purchase_date = values
+    return Stock(_new_purchase_id(), symbol, purchase_price, current_value, shares, purchase_date)
 
-def load_data_from_db(cur, investor_obj, investor_id):
-    """Load Stock and Bond data from SQLite database"""
-    _stock_data = cur.execute("SELECT * FROM stock WHERE investor_id = {0}".format(investor_id)).fetchall()
-    _bond_data = cur.execute("SELECT * FROM bond WHERE investor_id = {0}".format(investor_id)).fetchall()
-    for stock in _stock_data:
+
+def bond_from_values(values):
+    """Build a Bond from the hl.BOND_COLUMNS values of a holdings row.
+    The coupon is kept as a float, as the REAL bond.coupon column would return it.
+    """
+    symbol, shares, purchase_price, current_value, purchase_date, coupon, yld = values
+    return Bond(_new_purchase_id(), symbol, purchase_price, current_value, shares, purchase_date, float(coupon), yld)
+
+
+def load_stock_data(today, investors, file_path=hl.STOCK_FILE, verbose=True, parse_workers=None,
+                    columnar=False):
+    """Loads stock data once and adds it to each of the given investor objects"""
+
+    def add_lot(investor_obj, index, values):
+        investor_obj.add_stock(stock_from_values(values))
+
+    return hl.route_rows(file_path, hl.STOCK_COLUMNS, _investor_map(investors), add_lot, "Stock", verbose,
+                         parse_workers, columnar)
+
+
+def load_bond_data(today, investors, file_path=hl.BOND_FILE, verbose=True, parse_workers=None,
+                   columnar=False):
+    """Loads Bond data once and adds it to each of the given investor objects"""
+
+    def add_lot(investor_obj, index, values):
+        investor_obj.add_bond(bond_from_values(values))
+
+    return hl.route_rows(file_path, hl.BOND_COLUMNS, _investor_map(investors), add_lot, "Bond", verbose,
+                         parse_workers, columnar)
+
+
+def add_holdings(investor_obj, stock_rows, bond_rows):
+    """Build Stock and Bond objects from database rows and add them to an investor"""
+    for stock in stock_rows:
         stock_obj = Stock(stock[0], stock[2], stock[3], stock[4], stock[5], stock[6])
         investor_obj.add_stock(stock_obj)
 
-    for bond in _bond_data:
+    for bond in bond_rows:
         bond_obj = Bond(bond[0], bond[2], bond[3], bond[4], bond[5], bond[6], bond[7], bond[8])
         investor_obj.add_bond(bond_obj)
 
 
+def load_data_from_db(cur, investor_obj, investor_id):
+    """Load Stock and Bond data from SQLite database for a single investor"""
+    _stock_data = cur.execute("SELECT * FROM stock WHERE investor_id = ? ORDER BY purchase_id",
+                              (investor_id,)).fetchall()
+    _bond_data = cur.execute("SELECT * FROM bond WHERE investor_id = ? ORDER BY purchase_id",
+                             (investor_id,)).fetchall()
+    add_holdings(investor_obj, _stock_data, _bond_data)
+
+
+def load_investors_from_db(conn, first_id=idb.MIN_ID, last_id=idb.MAX_ID):
+    """Rebuild every investor with its stocks and bonds from one ordered query per table
+    :param conn: SQLite connection
+    :param first_id: Lowest investor_id to load
+    :param last_id: Highest investor_id to load
+    :return: Generator of Investor objects in investor_id order
+    """
+    for record, stock_rows, bond_rows in idb.iter_investor_holdings(conn, first_id, last_id):
+        investor_obj = Investor(record[0], record[1], record[2], record[3])
+        add_holdings(investor_obj, stock_rows, bond_rows)
+        yield investor_obj
+
+
+def rows_portfolio(rows):
+    """StockCalculator.Portfolio over stock or bond table rows, in row order"""
+    columns = list(zip(*rows)) or [()] * 7
+    return sc.Portfolio(columns[2], columns[5], columns[3], columns[4], columns[6])
+
+
+def holdings_columns(investor_row, stock_rows, bond_rows, as_of):
+    """ReportRenderer.render_columns arguments for an investor's database rows, valued as of as_of"""
+    bond_columns = rr.portfolio_columns(rows_portfolio(bond_rows), as_of)
+    return (investor_row[1], investor_row[2], investor_row[3], rr.portfolio_columns(rows_portfolio(stock_rows), as_of),
+            bond_columns + ([bond[7] for bond in bond_rows], [bond[8] for bond in bond_rows]))
+
+
 def create_tables(connection):
-    """Create Table Schema for Stock, Bond, and Investor"""
-    investor_table = """CREATE TABLE IF NOT EXISTS investor(
-    investor_id integer PRIMARY KEY,
-    first_name text NOT NULL,
-    address text NOT NULL,
-    phone_number integer NOT NULL);"""
-
-    stock_table = """CREATE TABLE IF NOT EXISTS stock(
-    purchase_id integer PRIMARY KEY,
-    investor_id integer NOT NULL,
-    stock_symbol text NOT NULL,
-    purchase_price integer NOT NULL,
-    current_price integer NOT NULL,
-    number_of_shares integer NOT NULL,
-    purchase_date text NOT NULL);"""
-
-    bond_table = """CREATE TABLE IF NOT EXISTS bond(
-    purchase_id integer PRIMARY KEY,
-    investor_id integer NOT NULL,
-    stock_symbol text NOT NULL,
-    purchase_price integer NOT NULL,
-    current_price integer NOT NULL,
-    number_of_shares integer NOT NULL,
-    purchase_date text NOT NULL,
-    coupon integer NOT NULL,
-    yld integer NOT NULL);"""
-
-    cursor = connection.cursor()
-    cursor.execute("DROP TABLE IF EXISTS investor")
-    cursor.execute(investor_table)
-    cursor.execute("DROP TABLE IF EXISTS stock")
-    cursor.execute(stock_table)
-    cursor.execute("DROP TABLE IF EXISTS bond")
-    cursor.execute(bond_table)
-    connection.commit()
+    """Create or migrate the Table Schema for Stock, Bond, and Investor. Existing tables are kept."""
+    idb.ensure_schema(connection)
 
 
 def create_connection(db_file):
@@ -321,48 +378,176 @@ def delete_records(conn):
     cur.execute(delete_bond)
 
 
-def main():
+def refresh_incremental(conn, list_of_investors, output_report_file, batch_size=idb.DEFAULT_BATCH_SIZE):
+    """Rewrite only the investors whose holdings or prices changed since the last run.
+    Changed investors are replaced in the database, reloaded and re-rendered; all other report
+    blocks are reused from the previous report.
+    :param conn: SQLite connection
+    :param list_of_investors: Investors loaded from the holdings files, in report order
+    :param output_report_file: Report file
+    :return: (number of re-rendered investors, number of investors in the report)
+    """
+    state_file = ir.state_file_for(output_report_file)
+    state = ir.ReportState.load(state_file, output_report_file)
+    as_of_day = sc.to_epoch_day(Stock.get_as_of_date())
+    fingerprints, dirty, removed = ir.find_dirty(list_of_investors, state, as_of_day)
+
+    with conn:
+        create_tables(conn)
+        if not state.blocks:
+            delete_records(conn)
+        idb.delete_investors(conn, [investor_obj._investor_id for investor_obj in dirty] + removed, batch_size)
+        idb.bulk_insert(conn, dirty, batch_size, verbose=False)
+
+    rendered = {}
+    for investor_obj in dirty:
+        investor_id = investor_obj._investor_id
+        for reloaded in load_investors_from_db(conn, investor_id, investor_id):
+            rendered[investor_id] = rr.render_investor_block(reloaded)
+    order = [investor_obj._investor_id for investor_obj in list_of_investors]
+    ir.write_report(output_report_file, order, fingerprints, rendered, state).save(state_file)
+    return len(rendered), len(order)
+
+
+def main(bulk=True, batch_size=idb.DEFAULT_BATCH_SIZE, workers=1, incremental=False, pipeline=False,
+         parse_workers=None, columnar=False, render_columns=False, grouped=False):
+    """Load the holdings files into the investments database and generate the investor report.
+    :param bulk: Insert with batched executemany in one transaction instead of one execute per row
+    :param batch_size: Rows per executemany batch in bulk mode
+    :param workers: Number of worker processes rendering the report; 1 renders in this process
+    :param incremental: Only rewrite investors whose holdings or prices changed since the last run
+    :param pipeline: Overlap report rendering, database inserts and report output in an asyncio pipeline
+    :param parse_workers: Parse the holdings files in chunks with this many processes; None reads them line by line
+    :param columnar: Read the holdings through the memory mapped columnar store
+    :param render_columns: Render the report from the database rows through value columns instead of lot objects
+    :param grouped: With pipeline, the holdings files list each investor's rows together in INVESTOR_ID order,
+                    so investors are rendered while the files are still being parsed
+    """
     output_report_file = "investor_report.txt"
     db_file = "investments.db"
     today = str(datetime.now().strftime("%m/%d/%Y"))
+    Stock.set_as_of_date(today)
     list_of_investors = []
     investor_obj1 = Investor(1, "Bob", "71 Pilgrim Avenue Chevy Chase, MD 20815", "303-303-3033")
     list_of_investors.append(investor_obj1)
     investor_obj2 = Investor(2, "Carl", "271 East Orchard Ave, CO 80112", "720-909-1234")
     list_of_investors.append(investor_obj2)
 
+    if pipeline:
+        stats = async_pipeline.run_pipeline(list_of_investors, db_file, output_report_file, stock_from_values,
+                                            bond_from_values, grouped=grouped)
+        print(stats)
+        print("Report Generated successfully")
+        return
+
     # This piece of code is to:
     # 1) Read stock & bond data from CSV files
     # 2) Load data into classes
     # 3) Insert into SQLite investments database
     conn = create_connection(db_file)
+    if bulk or incremental:
+        idb.configure_pragmas(conn)
+    if incremental:
+        with metrics.span("load_holdings"):
+            load_stock_data(today, list_of_investors, parse_workers=parse_workers, columnar=columnar)
+            load_bond_data(today, list_of_investors, parse_workers=parse_workers, columnar=columnar)
+        with metrics.span("incremental_refresh", rows=len(list_of_investors)):
+            changed, total = refresh_incremental(conn, list_of_investors, output_report_file, batch_size)
+        conn.close()
+        print("Report Generated successfully, {0} of {1} investors changed".format(changed, total))
+        return
     with conn:
-        if not os._exists(db_file):
-            create_tables(conn)
+        create_tables(conn)
         delete_records(conn)
-        for investor_obj in list_of_investors:
-            load_stock_data(today, investor_obj)
-            load_bond_data(today, investor_obj)
-            investor_obj.insert_investor(conn)
+        with metrics.span("load_holdings"):
+            load_stock_data(today, list_of_investors, parse_workers=parse_workers, columnar=columnar)
+            load_bond_data(today, list_of_investors, parse_workers=parse_workers, columnar=columnar)
+        with metrics.span("db_insert") as stage:
+            if bulk:
+                idb.bulk_insert(conn, list_of_investors, batch_size)
+            else:
+                for investor_obj in list_of_investors:
+                    investor_obj.insert_investor(conn)
+            stage.add(rows=sum(1 + len(investor_obj._list_of_stocks) + len(investor_obj._list_of_bonds)
+                               for investor_obj in list_of_investors))
     conn.close()
 
     # This piece of code performs the following steps:
     # 1) Read data from SQLite investments database,
     # 2) Load into class structures, and
     # 3) Generate an investment output report.
-    with open(output_report_file, "w") as report:
+    if workers > 1:
+        with metrics.span("parallel_report", nbytes=os.path.getsize(db_file)) as stage:
+            count = parallel_report.write_report_from_db(db_file, output_report_file, Stock.get_as_of_date(),
+                                                         workers)
+            stage.add(rows=count)
+        print("Report Generated successfully for {0} investors with {1} workers".format(count, workers))
+        return
+    # Reloading and rendering are interleaved, so rendering time is split out with a CallTimer
+    collector = metrics.active()
+    with metrics.span("db_reload", nbytes=os.path.getsize(db_file)) as stage, contextlib.ExitStack() as outputs:
+        report = outputs.enter_context(open(output_report_file, "w"))
+        renderer = outputs.enter_context(rr.ReportRenderer(report))
+        as_of = Stock.get_as_of_date()
+
+        def render_rows(investor_row, stock_rows, bond_rows):
+            renderer.render_columns(*holdings_columns(investor_row, stock_rows, bond_rows, as_of))
+        render = render_rows if render_columns else renderer.render_investor
+        # Writing the last buffered blocks and closing the report is report writing too
+        finish = outputs.close
+        if collector is not None:
+            render_timer = metrics.CallTimer()
+            finish_timer = metrics.CallTimer()
+            render = render_timer.wrap(render)
+            finish = finish_timer.wrap(finish)
         conn = create_connection(db_file)
-        cur = conn.cursor()
-        for record in cur.execute("SELECT * FROM investor"):
-            print(record)
-        for record in cur.execute("SELECT * FROM investor").fetchall():
-            investor_obj = Investor(record[0], record[1], record[2], record[3])
-            load_data_from_db(cur, investor_obj, record[0])
-            investor_obj.print_investments(cur, report)
+        if render_columns:
+            for investor_row, stock_rows, bond_rows in idb.iter_investor_holdings(conn):
+                print(investor_row)
+                render(investor_row, stock_rows, bond_rows)
+                stage.add(rows=1 + len(stock_rows) + len(bond_rows))
+        else:
+            for investor_obj in load_investors_from_db(conn):
+                print(investor_obj.to_row())
+                render(investor_obj)
+                stage.add(rows=1 + len(investor_obj._list_of_stocks) + len(investor_obj._list_of_bonds))
         conn.close()
-    report.close()
+        finish()
+    if collector is not None:
+        write_seconds = render_timer.seconds + finish_timer.seconds
+        stage.seconds -= write_seconds
+        collector.record("report_write", write_seconds, render_timer.calls, os.path.getsize(output_report_file))
     print("Report Generated successfully")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate the investor report through the investments database")
+    parser.add_argument("--per-row", action="store_true", help="insert one row per execute instead of in bulk")
+    parser.add_argument("--batch-size", type=int, default=idb.DEFAULT_BATCH_SIZE, help="rows per bulk insert batch")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes used to render the report")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only rewrite investors whose holdings or prices changed since the last run")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="parse the holdings files in memory mapped chunks with this many processes")
+    parser.add_argument("--columnar", action="store_true",
+                        help="read the holdings through the memory mapped columnar store, converting it when stale")
+    parser.add_argument("--render-columns", action="store_true",
+                        help="render the report from the database rows through value columns, without lot objects")
+    parser.add_argument("--metrics", default=None,
+                        help="write stage timings and memory as JSON to this file; '1' prints them "
+                             "(or set " + metrics.METRICS_ENV + ")")
+    parser.add_argument("--profile-dir", default=None,
+                        help="dump a cProfile file per stage here (or set " + metrics.PROFILE_ENV + ")")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record tracemalloc peak memory per stage (or set " + metrics.TRACE_MEMORY_ENV + "=1)")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="overlap report rendering, database inserts and report output in an asyncio pipeline")
+    parser.add_argument("--grouped", action="store_true",
+                        help="with --pipeline, render each investor as soon as its rows are read; the holdings "
+                             "files must list rows in ascending " + hl.INVESTOR_ID_COLUMN + " order")
+    args = parser.parse_args()
+    metrics.configure(args.metrics, args.profile_dir, args.trace_memory)
+    main(bulk=not args.per_row, batch_size=args.batch_size, workers=args.workers, incremental=args.incremental,
+         pipeline=args.pipeline, parse_workers=args.parse_workers, columnar=args.columnar,
+         render_columns=args.render_columns, grouped=args.grouped)
+    metrics.write_summary()
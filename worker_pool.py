@@ -0,0 +1,29 @@
+"""
+################################################################
+#Author: Srireshmi Nittala                                     #
+#Date: 10-18-2026                                              #
+#Description: Helpers shared by the modules that spread work   #
+#             over a process pool: the default worker count    #
+#             and contiguous sharding of an ordered work list. #
+################################################################
+"""
+
+import os
+
+
+def default_workers():
+    """Number of worker processes used when none is given"""
+    return os.cpu_count() or 1
+
+
+def split_shards(items, number_of_shards):
+    """Split an ordered list into at most number_of_shards contiguous, non-empty slices"""
+    number_of_shards = max(1, min(number_of_shards, len(items)))
+    size, extra = divmod(len(items), number_of_shards)
+    shards = []
+    start = 0
+    for shard in range(number_of_shards):
+        end = start + size + (1 if shard < extra else 0)
+        shards.append(items[start:end])
+        start = end
+    return [shard for shard in shards if shard]